@@ -2,11 +2,13 @@
 """
 精细化“大国工匠精神品质”主题河流图数据生成
 运行：python theme_river_fine.py
-依赖：pandas、jieba、openpyxl
+依赖：pandas、numpy、jieba、openpyxl
 """
 import re
+import numpy as np
 import pandas as pd
-import jieba
+from 词典注册 import compiled
+from 分词 import tokenize_paragraphs, encode_paragraphs
 
 # 1. 载入上面提供的 QUALITY_BANK
 QUALITY_BANK = {
@@ -207,37 +209,125 @@ QUALITY_BANK = {
     }
 } # ← 把上面的字典完整粘过来即可
 
-# 2. 读取源 Excel
-df_raw = pd.read_excel("知乎名单采集.xlsx", sheet_name="Sheet1", header=None)
-texts = df_raw.iloc[1:, 0].astype(str).tolist()
+# 2. 关键词倒排索引：关键词 → [(维度序号, 关键词序号, 权重), ...]
+DIMENSIONS = list(QUALITY_BANK)
+
+
+def build_keyword_index(bank):
+    index = {}
+    order = 0
+    for d, info in enumerate(bank.values()):
+        for kw, weight in info["keywords"].items():
+            index.setdefault(kw, []).append((d, order, weight))
+            order += 1
+    return index
+
+
+def keyword_weights(bank):
+    """逐维逐词的权重数组，下标即 build_keyword_index 里的关键词序号"""
+    return np.array([weight for info in bank.values() for weight in info["keywords"].values()],
+                    dtype=np.float64)
+
+
+KW_INDEX = compiled("quality_bank", QUALITY_BANK, build_keyword_index)   # 词典不变时直接读缓存
+KW_WEIGHTS = keyword_weights(QUALITY_BANK)
+MAX_KW_LEN = max(map(len, KW_INDEX))
+_token_hits = {}   # 分词结果 → 命中的 (维度序号, 关键词序号)，每个不同的词只算一次
+
+
+def token_hits(w: str):
+    """词 w 包含的全部关键词（kw in w 口径，同一关键词只算一次）→ [(维度序号, 关键词序号)]，按维度、关键词原顺序排列"""
+    hits = _token_hits.get(w)
+    if hits is None:
+        found = set()
+        for i in range(len(w)):
+            for j in range(i + 1, min(i + MAX_KW_LEN, len(w)) + 1):
+                found.update(KW_INDEX.get(w[i:j], ()))
+        hits = [(d, order) for d, order, _ in sorted(found)]
+        _token_hits[w] = hits
+    return hits
+
+
+def clean(text: str):
+    return re.sub(r"\s+", "", text)
+
+
+def tokenize(text: str):
+    return tokenize_paragraphs([clean(text)])[0]
+
 
 # 3. 权重计数函数
 def fine_count(text: str):
-    text = re.sub(r"\s+", "", text)
-    words = jieba.lcut(text)
-    res = []
-    for dim, info in QUALITY_BANK.items():
-        score = 0
-        for w in words:
-            for kw, weight in info["keywords"].items():
-                if kw in w:
-                    score += weight
-        if score > 0:
-            res.append({"dimension": dim, "score": round(score, 2)})
-    return res
-
-# 4. 逐人逐维汇总
-records = []
-for pid, txt in enumerate(texts, 1):
-    for item in fine_count(txt):
-        records.append({
-            "person_id": pid,
-            "dimension": item["dimension"],
-            "score": item["score"]
-        })
-
-river_df = pd.DataFrame(records)
-
-# 5. 输出
-river_df.to_csv("theme_river_fine.csv", index=False, encoding="utf-8-sig")
-print("已生成 theme_river_fine.csv，共 %d 行精细化数据。" % len(river_df))
+    scores = [0] * len(DIMENSIONS)
+    for w in tokenize(text):
+        for d, order in token_hits(w):
+            scores[d] += KW_WEIGHTS[order]
+    return [{"dimension": DIMENSIONS[d], "score": round(score, 2)}
+            for d, score in enumerate(scores) if score > 0]
+
+
+def keyword_hits(texts):
+    """
+    整张名单 → 命中表 (人序号, 维度序号, 关键词序号)，三个等长 int64 数组，按逐人逐词的先后排列
+    命中表只取决于关键词本身，与权重无关：调整 QUALITY_BANK 里的权重后用 score_hits 重新汇总即可，
+    不必重新分词、查索引。
+    """
+    # 整张名单一起分词，按文本哈希缓存，名单不变时重跑不再切词；缓存直接给出 int32 词编号
+    vocab, text_ptr, ids = encode_paragraphs([clean(txt) for txt in texts], cache_name="主题河流")
+    person_ids = np.repeat(np.arange(len(texts)), np.diff(text_ptr))
+    # 共享词表里还有别的文档的词，只给本名单出现过的词建命中表
+    present, token_ids = np.unique(ids, return_inverse=True)
+    token_ids = token_ids.astype(np.int64)
+
+    # 词 → 命中的 CSR 表示
+    ptr, hit_dim, hit_order = [0], [], []
+    for w in vocab.decode(present):
+        for d, order in token_hits(w):
+            hit_dim.append(d)
+            hit_order.append(order)
+        ptr.append(len(hit_dim))
+    ptr = np.asarray(ptr, dtype=np.int64)
+    hit_dim = np.asarray(hit_dim, dtype=np.int64)
+    hit_order = np.asarray(hit_order, dtype=np.int64)
+
+    # 每个词展开成它的命中
+    n_hits = ptr[token_ids + 1] - ptr[token_ids]
+    starts = np.repeat(ptr[token_ids], n_hits)
+    offsets = np.arange(n_hits.sum()) - np.repeat(np.cumsum(n_hits) - n_hits, n_hits)
+    hit_idx = starts + offsets
+    return np.repeat(person_ids, n_hits), hit_dim[hit_idx], hit_order[hit_idx]
+
+
+def score_hits(hits, n_people, weights=KW_WEIGHTS):
+    """
+    命中表 → 人 × 维度 的得分矩阵
+    按命中表的顺序用 np.add.at 依次累加，累加顺序与逐人逐词计算相同，分数逐位一致。
+    """
+    person_ids, dims, orders = hits
+    scores = np.zeros((n_people, len(DIMENSIONS)), dtype=np.float64)
+    np.add.at(scores, (person_ids, dims), weights[orders])
+    return scores
+
+
+def fine_count_batch(texts):
+    """整张名单一次性打分 → DataFrame(person_id, dimension, score)"""
+    scores = score_hits(keyword_hits(texts), len(texts))
+    rows, cols = np.nonzero(scores > 0)
+    return pd.DataFrame({
+        "person_id": rows + 1,
+        "dimension": [DIMENSIONS[d] for d in cols],
+        "score": [round(score, 2) for score in scores[rows, cols].tolist()],
+    })
+
+
+if __name__ == "__main__":
+    # 4. 读取源 Excel
+    df_raw = pd.read_excel("知乎名单采集.xlsx", sheet_name="Sheet1", header=None)
+    texts = df_raw.iloc[1:, 0].astype(str).tolist()
+
+    # 5. 逐人逐维汇总
+    river_df = fine_count_batch(texts)
+
+    # 6. 输出
+    river_df.to_csv("theme_river_fine.csv", index=False, encoding="utf-8-sig")
+    print("已生成 theme_river_fine.csv，共 %d 行精细化数据。" % len(river_df))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+五个行业的情感维度分析一次跑完（统一入口）
+在同一个进程里依次调用五个 *情感分析.py 的故事提取与 score_stories，
+语料库、融合命中表都只加载一次，各行业共用：故事记录的区间直接在命中表里取各维度命中，不再扫描正文。
+结果是一张长表，每行一个 行业 × 工匠 × 维度：
+    行业, 工匠, 维度, 分数, 命中数
+原来各脚本各自的 *分析结果.csv 和雷达图仍由各脚本的 main() 生成，这里只出汇总表。
+运行：python 五行业情感分析.py
+"""
+import time
+import pandas as pd
+from 语料库 import load_corpus
+import 航天军工情感分析
+import 能源电力情感分析
+import 文化传承情感分析
+import 装备制造情感分析
+import 基建工程情感分析
+
+OUTPUT_CSV = 'E:\\五行业情感分析结果.csv'
+INDUSTRIES = {
+    '航天军工': 航天军工情感分析,
+    '能源电力': 能源电力情感分析,
+    '文化传承': 文化传承情感分析,
+    '装备制造': 装备制造情感分析,
+    '基建工程': 基建工程情感分析,
+}
+COLUMNS = ['行业', '工匠', '维度', '分数', '命中数']
+
+
+def analyze_industry(industry, module, corpus):
+    """一个行业 → 长表的若干行（每位工匠 5 行）"""
+    stories = module.load_stories(corpus)
+    if not stories:
+        return []
+    scores, hits = module.score_stories(module.story_hits(stories, corpus), with_hits=True)
+    rows = []
+    for story, score_row, hit_row in zip(stories, scores.tolist(), hits.tolist()):
+        for dim, score, hit in zip(module.DIMENSIONS, score_row, hit_row):
+            rows.append((industry, story.name, dim, round(score, 4), int(hit)))
+    return rows
+
+
+def run(corpus=None):
+    """五个行业 → 长表 DataFrame"""
+    corpus = corpus if corpus is not None else load_corpus()
+    rows = []
+    for industry, module in INDUSTRIES.items():
+        if industry not in corpus:
+            print(f'❌ 语料库中缺少 {industry}.docx，跳过')
+            continue
+        start = time.perf_counter()
+        industry_rows = analyze_industry(industry, module, corpus)
+        rows.extend(industry_rows)
+        print(f'✓ {industry}：{len(industry_rows) // len(module.DIMENSIONS)} 位工匠，'
+              f'{(time.perf_counter() - start) * 1000:.0f} ms')
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def main():
+    print("=" * 60)
+    print("五行业大国工匠情感维度统一分析")
+    print("=" * 60)
+    df = run()
+    df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8-sig')
+    print(f"✅ 共 {df['工匠'].nunique()} 位工匠、{len(df)} 行，已保存：{OUTPUT_CSV}")
+    print(df.groupby(['行业', '维度'], sort=False)['分数'].mean().unstack().round(3))
+
+
+if __name__ == '__main__':
+    main()
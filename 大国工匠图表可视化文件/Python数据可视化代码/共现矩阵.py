@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+句子 × 关键词 稀疏共现矩阵（热力图 行业 × 品质 频次共用）
+所有句子拼成一个长串，行业词与品质词放进同一个关键词自动机只扫描一遍，
+得到 句子 × 关键词 的 CSR 计数矩阵，再用 关键词 × 分组 的指示矩阵汇总到行业/品质：
+    行业出现  P = (K_行业 · G_行业 > 0)        句子 × 行业，0/1
+    品质计数  Q =  K_品质 · G_品质              句子 × 品质，等于 sum(sent.count(w) for w in 词表)
+    频次矩阵  F =  Pᵀ · Q                       行业 × 品质
+多篇文档可以一起构建，按 doc_ptr 切行即可得到各文档的频次矩阵，耗时与语料长度成线性。
+用法：
+    from 共现矩阵 import build_cooccurrence
+    co = build_cooccurrence(corpus.sentences("航天军工"), INDUSTRY_DICT, QUALITY_DICT)
+    freq = co.frequency()          # ndarray，行序同 INDUSTRY_DICT，列序同 QUALITY_DICT
+    sents, doc_ptr = corpus_sentences(corpus, ["航天军工", "能源电力"])   # 多文档一起
+    co = build_cooccurrence(sents, INDUSTRY_DICT, QUALITY_DICT, doc_ptr)
+    freq_energy = co.frequency(doc=1)
+已有 句子 × 关键词 计数矩阵时（如 融合分析 的全语料命中表）直接汇总，不再扫描：
+    co = cooccurrence_from_hits(hits, vocab, INDUSTRY_DICT, QUALITY_DICT)
+依赖：numpy、scipy
+"""
+import numpy as np
+import scipy.sparse as sp
+from 关键词匹配 import keyword_matcher
+
+
+# ---------- 1. 句子 × 关键词 ----------
+def keyword_matrix(segments, keywords, sep="\n"):
+    """
+    段 × 关键词 的 CSR 计数矩阵，元素等于 segment.count(keyword)
+    各段以 sep 拼接后一次扫描；sep 不能出现在关键词里，保证命中不跨段。
+    返回 (矩阵, 列对应的关键词)，关键词已去重、去空。
+    """
+    keywords = list(keywords)
+    if any(sep in w for w in keywords):
+        raise ValueError(f"分隔符 {sep!r} 出现在关键词中，无法保证命中不跨段")
+    segments = list(segments)
+    lengths = np.fromiter((len(s) + len(sep) for s in segments), dtype=np.int64, count=len(segments))
+    seg_starts = np.cumsum(lengths) - lengths
+
+    matcher = keyword_matcher(tuple(keywords))
+    found = np.fromiter(
+        (v for pos, i in matcher.iter_matches(sep.join(segments)) for v in (pos, i)), dtype=np.int64
+    ).reshape(-1, 2)
+    rows = np.searchsorted(seg_starts, found[:, 0], side="right") - 1
+    counts = sp.csr_matrix(
+        (np.ones(len(found), dtype=np.int64), (rows, found[:, 1])),
+        shape=(len(segments), len(matcher.keywords)),
+    )
+    counts.sum_duplicates()
+    return counts, matcher.keywords
+
+
+def group_indicator(keywords, groups):
+    """关键词 × 分组 的指示矩阵；同一个词在组里出现几次就记几（与逐词求和的口径一致）"""
+    col = {w: i for i, w in enumerate(keywords)}
+    rows, cols = [], []
+    for g, words in enumerate(groups.values()):
+        for w in words:
+            if w in col:
+                rows.append(col[w])
+                cols.append(g)
+    return sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(len(keywords), len(groups))
+    )
+
+
+# ---------- 2. 行组 × 列组 共现 ----------
+class Cooccurrence:
+    """
+    presence  句子 × 行组 的 0/1 矩阵（句中出现该组任一关键词）
+    counts    句子 × 列组 的命中次数矩阵
+    doc_ptr   多文档构建时各文档的句子起止（文档 d 占 doc_ptr[d]:doc_ptr[d+1] 行）
+    """
+
+    def __init__(self, presence, counts, row_names, col_names, doc_ptr):
+        self.presence = presence
+        self.counts = counts
+        self.row_names = row_names
+        self.col_names = col_names
+        self.doc_ptr = doc_ptr
+
+    def _rows(self, doc):
+        if doc is None:
+            return self.presence, self.counts
+        start, end = self.doc_ptr[doc], self.doc_ptr[doc + 1]
+        return self.presence[start:end], self.counts[start:end]
+
+    def frequency(self, doc=None):
+        """行组 × 列组 频次矩阵 Pᵀ·Q（doc 为文档序号时只统计该文档）"""
+        presence, counts = self._rows(doc)
+        return np.asarray((presence.T @ counts).todense(), dtype=np.int64)
+
+    def first_seen_order(self, doc=None):
+        """
+        对频次有贡献（句中同时有该行组关键词和列组命中）的行组，
+        按首次出现的句子先后排序返回行组序号；同一句里按词典顺序。
+        """
+        presence, counts = self._rows(doc)
+        has_hits = np.asarray(counts.sum(axis=1)).ravel() > 0
+        active = presence.multiply(has_hits[:, None]).tocsc()
+        active.eliminate_zeros()
+        active.sort_indices()
+        nnz = np.diff(active.indptr)
+        first = {j: active.indices[active.indptr[j]] for j in np.flatnonzero(nnz)}
+        return sorted(first, key=lambda j: (first[j], j))
+
+
+def corpus_sentences(corpus, names):
+    """多篇文档的句子依次拼接 → (句子列表, doc_ptr)，供 build_cooccurrence 一起构建"""
+    sentences, doc_ptr = [], [0]
+    for name in names:
+        sentences.extend(corpus.sentences(name))
+        doc_ptr.append(len(sentences))
+    return sentences, doc_ptr
+
+
+def build_cooccurrence(segments, row_groups, col_groups, doc_ptr=None):
+    """
+    一次扫描构建共现矩阵
+    segments    句子序列（可以是多篇文档的句子依次拼接，此时传 doc_ptr）
+    row_groups  {行组名: 关键词列表}，按「是否出现」计
+    col_groups  {列组名: 关键词列表}，按「出现次数」计
+    """
+    segments = list(segments)
+    hits, vocab = keyword_matrix(segments, group_vocab(row_groups, col_groups))
+    return cooccurrence_from_hits(hits, vocab, row_groups, col_groups, doc_ptr)
+
+
+def group_vocab(*groups):
+    """若干 {组名: 关键词列表} 用到的全部关键词（去重、去空，保持首次出现顺序）"""
+    return list(dict.fromkeys(w for g in groups for ws in g.values() for w in ws if w))
+
+
+def cooccurrence_from_hits(hits, vocab, row_groups, col_groups, doc_ptr=None):
+    """句子 × 关键词 计数矩阵（列对应 vocab）→ 共现矩阵"""
+    presence = (hits @ group_indicator(vocab, row_groups)) > 0
+    counts = hits @ group_indicator(vocab, col_groups)
+    if doc_ptr is None:
+        doc_ptr = [0, hits.shape[0]]
+    return Cooccurrence(presence.astype(np.int64), counts, list(row_groups), list(col_groups),
+                        np.asarray(doc_ptr, dtype=np.int64))
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+"""
+多关键词一次扫描计数（各情感分析脚本的维度打分共用）
+原先每个维度对每个关键词各调用一次 text.count，一篇文章要扫描几十遍；
+这里把所有关键词编译进同一个自动机，整篇文本只扫描一遍就得到每个关键词的命中数。
+计数口径与 str.count 完全一致：同一关键词不重叠计数，不同关键词之间允许重叠
+（如「0.5毫米」里同时算一次「0.5毫米」和一次「毫米」）。
+用法：
+    from 关键词匹配 import count_groups
+    tech_count, innov_count = count_groups(text, tech_keywords, innov_keywords)
+    safety_weight, = count_groups(text, [('安全', 2), ('零事故', 5)])   # 带权重
+    pos_count, neg_count = count_groups(text, positive_words, negative_words, ignore_case=True)
+多篇文本一起计数（雷达图、导出共用一次打分），返回 文本 × 组 的矩阵：
+    counts = count_group_matrix([s.text for s in stories], tech_keywords, innov_keywords)
+正则版（柱形图 spirit_dict）同样一次扫描，计数与逐条 len(re.findall(pat, text)) 一致：
+    from 关键词匹配 import count_pattern_groups
+    counts = count_pattern_groups(text, *spirit_dict.values(), flags=re.I)
+「词1|词2|…」交替式按句批量计数（时序图 LEX），返回 句子 × 模式 的计数矩阵：
+    from 关键词匹配 import segment_counts
+    hits = segment_counts(sentences, list(LEX.values()))
+按字符位置的命中前缀和（长文本按窗口、段落求密度，不截断也不重新扫描）：
+    from 关键词匹配 import HitDensity
+    density = HitDensity(texts, tech_keywords, innov_keywords)
+    counts = density.totals()                          # 文本 × 组，同 count_group_matrix
+    peak = density.peak_density(*density.spans[0], 10000)   # 第一篇最密的 10000 字窗口，每千字命中数
+已有命中（融合命中表按故事区间取出的）时不再扫描：HitDensity.from_hits(字数, 命中, 权重矩阵)
+"""
+import re
+from functools import lru_cache
+import numpy as np
+from 词典注册 import compiled
+
+
+# ---------- 1. 自动机 ----------
+class KeywordMatcher:
+    """
+    关键词自动机：按长度降序拼成一个正则交替式，由 re 的 C 实现一次扫描全文。
+    扫描得到的是每个位置上最长的关键词，同一位置上更短的关键词必是它的前缀，
+    命中区间内部起始的关键词再逐位补查，因此任何一次出现都不会漏掉。
+    """
+
+    def __init__(self, keywords, ignore_case=False):
+        self.ignore_case = ignore_case
+        words = (w.lower() if ignore_case else w for w in keywords if w)
+        self.keywords = list(dict.fromkeys(words))
+        self.index = {w: i for i, w in enumerate(self.keywords)}
+        self._lengths = [len(w) for w in self.keywords]
+        # 每个关键词 → 也是关键词的前缀（含自身）的序号，由短到长
+        self._prefixes = {
+            w: [self.index[w[:k]] for k in range(1, len(w) + 1) if w[:k] in self.index]
+            for w in self.keywords
+        }
+        longest_first = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, longest_first))) if longest_first else None
+
+    def iter_hits(self, text):
+        """按起点顺序产出关键词的每一次出现（允许重叠）：(起点, 关键词序号)"""
+        if self._pattern is None:
+            return
+        if self.ignore_case:
+            text = text.lower()
+        prefixes, match_at = self._prefixes, self._pattern.match
+        for m in self._pattern.finditer(text):
+            start, end = m.span()
+            for i in prefixes[m.group()]:
+                yield start, i
+            for pos in range(start + 1, end):
+                inner = match_at(text, pos)
+                if inner:
+                    for i in prefixes[inner.group()]:
+                        yield pos, i
+
+    def iter_matches(self, text):
+        """只产出 str.count 会计入的出现（同一关键词不重叠）：(起点, 关键词序号)"""
+        last_end = [0] * len(self.keywords)   # 各关键词上一次计数的结束位置
+        lengths = self._lengths
+        for pos, i in self.iter_hits(text):
+            if pos >= last_end[i]:
+                last_end[i] = pos + lengths[i]
+                yield pos, i
+
+    def counts(self, text):
+        """返回与 self.keywords 对齐的命中次数列表，等价于 [text.count(w) for w in keywords]"""
+        counts = [0] * len(self.keywords)
+        for _, i in self.iter_matches(text):
+            counts[i] += 1
+        return counts
+
+    def count_map(self, text):
+        """{关键词: 命中次数}"""
+        return dict(zip(self.keywords, self.counts(text)))
+
+
+@lru_cache(maxsize=None)
+def keyword_matcher(keywords, ignore_case=False):
+    """按词表取编译好的自动机（经词典注册表缓存，同一词表只编译一次）"""
+    return compiled("keywords", [keywords, ignore_case], _build_matcher)
+
+
+def _build_matcher(spec):
+    keywords, ignore_case = spec
+    return KeywordMatcher(keywords, ignore_case)
+
+
+# ---------- 2. 分组计数 ----------
+def _weighted(group):
+    """关键词组统一成 (词, 权重) 序列；纯字符串的权重记 1"""
+    for entry in group:
+        yield (entry, 1) if isinstance(entry, str) else entry
+
+
+@lru_cache(maxsize=None)
+def _compile_groups(groups, ignore_case):
+    return compiled("keyword_groups", [groups, ignore_case], _build_groups)
+
+
+def _build_groups(spec):
+    groups, ignore_case = spec
+    groups = [list(_weighted(g)) for g in groups]
+    matcher = KeywordMatcher([w for g in groups for w, _ in g], ignore_case)
+    norm = str.lower if ignore_case else str
+    plan = [[(matcher.index[norm(w)], weight) for w, weight in g if w] for g in groups]
+    return matcher, plan
+
+
+def count_groups(text, *groups, ignore_case=False):
+    """
+    一次扫描统计多组关键词，返回每组的（加权）命中总数
+    每组可以是词列表，也可以是 (词, 权重) 列表；组内重复的词照原样重复计数，
+    结果与 sum(text.count(w) * 权重 for w in 组) 相同。
+    同一组合的关键词只编译一次，之后的调用直接复用自动机。
+    """
+    matcher, plan = _compile_groups(tuple(map(tuple, groups)), ignore_case)
+    counts = matcher.counts(text)
+    return [sum(counts[i] * weight for i, weight in g) for g in plan]
+
+
+def count_group_matrix(texts, *groups, ignore_case=False, sep="\n"):
+    """
+    多篇文本一起计数 → 文本 × 组 的（加权）命中矩阵，第 n 行等于 count_groups(texts[n], *groups)
+    先得到 文本 × 关键词 的计数矩阵，再乘 关键词 × 组 的权重矩阵；
+    各文本以 sep 拼接后只扫描一遍，sep 不能出现在关键词里，保证命中不跨文本。
+    """
+    matcher, plan = _compile_groups(tuple(map(tuple, groups)), ignore_case)
+    if any(sep in w for w in matcher.keywords):
+        raise ValueError(f"分隔符 {sep!r} 出现在关键词中，无法保证命中不跨文本")
+    texts = [t.lower() if ignore_case else t for t in texts]
+    n_kw = len(matcher.keywords)
+    lengths = np.fromiter((len(t) + len(sep) for t in texts), dtype=np.int64, count=len(texts))
+    starts = np.cumsum(lengths) - lengths
+    found = np.fromiter(
+        (v for pos, i in matcher.iter_matches(sep.join(texts)) for v in (pos, i)), dtype=np.int64
+    ).reshape(-1, 2)
+    rows = np.searchsorted(starts, found[:, 0], side="right") - 1
+    counts = np.bincount(rows * n_kw + found[:, 1], minlength=len(texts) * n_kw).reshape(len(texts), n_kw)
+    return counts @ _group_weights(plan, n_kw)
+
+
+def _group_weights(plan, n_kw):
+    """关键词 × 组 的权重矩阵（纯词列表时为整数 0/1 计数）"""
+    weights = np.zeros((n_kw, len(plan)), dtype=np.result_type(*[w for g in plan for _, w in g] or [0]))
+    for g, entries in enumerate(plan):
+        for i, weight in entries:
+            weights[i, g] += weight
+    return weights
+
+
+# ---------- 3. 正则模式组 ----------
+_META = set(".^$*+?{}[]|()\\")
+
+
+def _literal_prefix(pattern):
+    """
+    正则开头的纯文字部分 → (前缀, 整条是否都是纯文字)
+    任何匹配都必须以这段前缀开头，拿不到可靠前缀时返回空串。
+    """
+    if "|" in pattern:
+        return "", False          # 分支各有各的开头，保守起见不取前缀
+    chars, i = [], 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                chars.append(pattern[i + 1])   # \. \% 之类的转义标点
+                i += 2
+                continue
+            break                              # \d \w 等字符类
+        if c in _META:
+            break
+        chars.append(c)
+        i += 1
+    else:
+        return "".join(chars), True
+    if pattern[i] in "*?{" and chars:
+        chars.pop()               # 量词作用在最后一个字上，它可有可无
+    return "".join(chars), False
+
+
+def _has_case(s):
+    return s.lower() != s or s.upper() != s
+
+
+class PatternCounter:
+    """
+    多条正则一次扫描计数，结果与 [len(re.findall(p, text, flags)) for p in patterns] 相同。
+    每条正则的开头文字作为触发词放进同一个关键词自动机：纯文字模式直接按命中计数，
+    带 .*? 等语法的模式只在触发位置上用 pattern.match 确认，并按 findall 的规则跳过重叠。
+    取不到触发词的模式（如以 . 开头、忽略大小写且含字母）退回逐条 findall，保证结果不变。
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = list(dict.fromkeys(patterns))
+        self._compiled = {}                 # 只有需要确认/退回 findall 的模式才编译
+        self._fallback = []
+        self._literal = [False] * len(self.patterns)
+        triggers = {}                       # 触发词 → 以它开头的模式序号
+        for i, pat in enumerate(self.patterns):
+            lit, whole = _literal_prefix(pat)
+            if not lit or flags & re.VERBOSE or (flags & re.IGNORECASE and _has_case(lit)):
+                self._fallback.append(i)
+                self._compiled[i] = re.compile(pat, flags)
+                continue
+            self._literal[i] = whole
+            if not whole:
+                self._compiled[i] = re.compile(pat, flags)
+            triggers.setdefault(lit, []).append(i)
+        self._matcher = KeywordMatcher(triggers)
+        self._by_trigger = [triggers[w] for w in self._matcher.keywords]
+
+    @property
+    def triggers(self):
+        """触发词（与 count_hits 的 k 对齐）"""
+        return self._matcher.keywords
+
+    def counts(self, text):
+        """返回与 self.patterns 对齐的匹配次数列表"""
+        return self.count_hits(text, self._matcher.iter_hits(text))
+
+    def count_hits(self, text, hits):
+        """
+        由触发词的命中流计数：hits 为按起点递增的 (字符起点, 触发词序号)，
+        可以来自别处的扫描（如 融合分析 的全语料命中表），text 只用于确认和退回 findall。
+        """
+        counts = [0] * len(self.patterns)
+        last_end = [0] * len(self.patterns)
+        regexes, literal = self._compiled, self._literal
+        lengths = self._matcher._lengths
+        for pos, k in hits:
+            for i in self._by_trigger[k]:
+                if pos < last_end[i]:
+                    continue
+                if literal[i]:
+                    counts[i] += 1
+                    last_end[i] = pos + lengths[k]
+                else:
+                    m = regexes[i].match(text, pos)
+                    if m:
+                        counts[i] += 1
+                        last_end[i] = m.end()
+        for i in self._fallback:
+            counts[i] = len(regexes[i].findall(text))
+        return counts
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern_groups(groups, flags):
+    return compiled("pattern_groups", [groups, int(flags)], _build_pattern_groups)
+
+
+def _build_pattern_groups(spec):
+    groups, flags = spec
+    counter = PatternCounter([p for g in groups for p in g], flags)
+    index = {p: i for i, p in enumerate(counter.patterns)}
+    return counter, [[index[p] for p in g] for g in groups]
+
+
+def count_pattern_groups(text, *groups, flags=0):
+    """一次扫描统计多组正则，返回每组匹配总数（组内重复的模式照原样重复计数）"""
+    counter, plan = _compile_pattern_groups(tuple(map(tuple, groups)), flags)
+    counts = counter.counts(text)
+    return [sum(counts[i] for i in g) for g in plan]
+
+
+# ---------- 4. 交替式按段计数 ----------
+class AlternationCounter:
+    """
+    多个「词1|词2|…」纯文字交替式一次扫描，口径同各自的 re.finditer：
+    同一位置取排在最前的分支，同一模式的匹配互不重叠。
+    含正则语法的模式退回各自 finditer。
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._fallback = []
+        owners = {}                         # 分支词 → [(模式序号, 分支序号), ...]
+        for d, pat in enumerate(self.patterns):
+            branches = [_literal_prefix(b) for b in pat.split("|")] if pat else [("", False)]
+            if not all(lit and whole for lit, whole in branches):
+                self._fallback.append(d)
+                continue
+            for order, (lit, _) in enumerate(branches):
+                owners.setdefault(lit, []).append((d, order))
+        self._matcher = KeywordMatcher(owners)
+        self._owners = [owners[w] for w in self._matcher.keywords]
+        self._fallback_re = {d: re.compile(self.patterns[d]) for d in self._fallback}
+
+    @property
+    def branches(self):
+        """纯文字分支词（与 resolve 的 k 对齐）"""
+        return self._matcher.keywords
+
+    @property
+    def fallback(self):
+        """退回 finditer 的模式 {模式序号: 编译好的正则}"""
+        return self._fallback_re
+
+    def matches(self, text):
+        """产出每个模式的每一次匹配：(模式序号, 起点)，同一模式内按起点递增"""
+        yield from self.resolve(self._matcher.iter_hits(text), self._matcher._lengths)
+        for d, regex in self._fallback_re.items():
+            for m in regex.finditer(text):
+                yield d, m.start()
+
+    def resolve(self, hits, lengths):
+        """
+        分支词命中流 → 纯文字模式的匹配（不含退回 finditer 的模式）
+        hits 为按起点递增的 (起点, 分支词序号)，lengths[k] 为分支词长度，与起点同一单位（字符或字节）。
+        """
+        last_end = [0] * len(self.patterns)
+        owners = self._owners
+        group_pos, best = -1, {}
+
+        def flush():
+            for d, (_, length) in best.items():
+                if group_pos >= last_end[d]:
+                    last_end[d] = group_pos + length
+                    yield d, group_pos
+
+        for pos, k in hits:
+            if pos != group_pos:
+                yield from flush()
+                group_pos, best = pos, {}
+            for d, order in owners[k]:
+                if d not in best or order < best[d][0]:
+                    best[d] = (order, lengths[k])
+        yield from flush()
+
+
+@lru_cache(maxsize=None)
+def _alternation_counter(patterns):
+    return compiled("alternations", patterns, AlternationCounter)
+
+
+def segment_counts(segments, patterns, sep="\n"):
+    """
+    对一组文本段（如句子）批量计数 → int32 矩阵 (段数 × 模式数)
+    各段以 sep 拼成一个长串只扫描一遍，再按起点偏移把匹配归到所属段；
+    sep 不能出现在任何模式里，保证匹配不会跨段。结果与逐段 len(re.findall(p, seg)) 相同。
+    """
+    if any(sep in p for p in patterns):
+        raise ValueError(f"分隔符 {sep!r} 出现在模式中，无法保证匹配不跨段")
+    segments = list(segments)
+    lengths = np.fromiter((len(s) + len(sep) for s in segments), dtype=np.int64, count=len(segments))
+    seg_starts = np.cumsum(lengths) - lengths
+    counter = _alternation_counter(tuple(patterns))
+    found = np.fromiter(
+        (v for d, pos in counter.matches(sep.join(segments)) for v in (d, pos)), dtype=np.int64
+    ).reshape(-1, 2)
+    seg_ids = np.searchsorted(seg_starts, found[:, 1], side="right") - 1
+    flat = np.bincount(seg_ids * len(patterns) + found[:, 0], minlength=len(segments) * len(patterns))
+    return flat.astype(np.int32).reshape(len(segments), len(patterns))
+
+
+# ---------- 5. 命中前缀和 ----------
+class HitDensity:
+    """
+    多组关键词命中按字符位置的前缀和：cum[k] 为起点落在前 k 个字符内的各组（加权）命中数，
+    口径同 count_groups（str.count，同一关键词不重叠）。
+    任意区间 [a, b) 的命中数就是 cum[b] - cum[a]，故事、段落、滑动窗口的密度都是一次减法，不再重新扫描；
+    区间边界上的命中按起点归属（起点在区间内、终点越过 b 的也算进去）。
+    多篇文本以 sep 拼接后一起构建，spans 为各篇在拼接串中的 [起, 止)。
+    已有命中（如融合命中表按故事区间取出的）时用 from_hits 直接构建，不再扫描文字。
+    """
+
+    def __init__(self, texts, *groups, ignore_case=False, sep="\n"):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        matcher, plan = _compile_groups(tuple(map(tuple, groups)), ignore_case)
+        if any(sep in w for w in matcher.keywords):
+            raise ValueError(f"分隔符 {sep!r} 出现在关键词中，无法保证命中不跨文本")
+        joined = sep.join(t.lower() if ignore_case else t for t in texts)
+        found = np.fromiter(
+            (v for pos, i in matcher.iter_matches(joined) for v in (pos, i)), dtype=np.int64
+        ).reshape(-1, 2)
+        self._build(map(len, texts), found, _group_weights(plan, len(matcher.keywords)), len(sep))
+
+    @classmethod
+    def from_hits(cls, lengths, found, weights, sep_len=1):
+        """
+        由已知命中构建：lengths 为各篇字数，found 为 (拼接串中的字符起点, 关键词序号) 数组，
+        weights 为 关键词 × 组 的权重矩阵；各篇之间按隔 sep_len 个字符拼接计位置
+        """
+        density = cls.__new__(cls)
+        density._build(lengths, np.asarray(found, dtype=np.int64).reshape(-1, 2), weights, sep_len)
+        return density
+
+    def _build(self, lengths, found, weights, sep_len):
+        lengths = np.fromiter(lengths, dtype=np.int64)
+        starts = np.cumsum(lengths + sep_len) - (lengths + sep_len)
+        self.spans = np.stack([starts, starts + lengths], axis=1)
+        total = int(lengths.sum() + sep_len * max(len(lengths) - 1, 0))
+        cum = np.zeros((total + 1, weights.shape[1]), dtype=weights.dtype)
+        np.add.at(cum, found[:, 0] + 1, weights[found[:, 1]])
+        self.cum = np.cumsum(cum, axis=0, out=cum)
+
+    def counts(self, start, end):
+        """区间 [start, end) 内各组的命中数"""
+        return self.cum[end] - self.cum[start]
+
+    def totals(self):
+        """文本 × 组 的命中数，与 count_group_matrix(texts, *groups) 相同"""
+        return self.cum[self.spans[:, 1]] - self.cum[self.spans[:, 0]]
+
+    def density(self, start, end, per=1000):
+        """区间内每 per 字的命中数；空区间（end <= start）各组都是 0"""
+        if end <= start:
+            return np.zeros(self.cum.shape[1])
+        return self.counts(start, end) / ((end - start) / per)
+
+    def segment_counts(self, bounds):
+        """相邻边界之间各段的命中数：bounds 为递增的字符位置（如各句、各段起点再加上终点）"""
+        return np.diff(self.cum[np.asarray(bounds)], axis=0)
+
+    def window_counts(self, start, end, width):
+        """[start, end) 内每个长 width 的滑动窗口（起点逐字后移）的命中数；区间不足 width 时只有整个区间一个窗口"""
+        if end - start <= width:
+            return self.counts(start, end)[None, :]
+        return self.cum[start + width:end + 1] - self.cum[start:end - width + 1]
+
+    def peak_density(self, start, end, width, per=1000):
+        """各组滑动窗口密度的最大值（每 per 字）；区间不足 width 时就是整个区间的密度，空区间各组都是 0"""
+        width = min(width, end - start)
+        if width <= 0:
+            return np.zeros(self.cum.shape[1])
+        return self.window_counts(start, end, width).max(axis=0) / (width / per)
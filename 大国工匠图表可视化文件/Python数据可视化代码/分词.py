@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+jieba 分词统一入口（工匠姓名用户词典 + 按段落哈希的磁盘缓存）
+    · 从 大国工匠名单采集.xlsx 的「人物姓名」生成用户词典，jieba 每个进程只加载一次，
+      避免「高凤林」被切成「高/凤林」、「管延安」被切成「管/延安」；
+    · 分词结果按 段落内容 SHA-1 缓存到 .token_cache/，改停用词后重跑不再重新切词，
+      文档只改了几段时也只切改过的段；缓存存的是 int32 词编号（各文档共用一份词表 vocab-<版本>.json.gz），
+      读缓存时直接得到编号数组，不必先还原成 str 列表；
+    · 多篇文档一起分词时，未命中缓存的文档分到多个进程并行切。
+用法：
+    from 分词 import encode_paragraphs, tokenize_paragraphs, tokenize_documents, craftsman_names
+    tokens = tokenize_paragraphs(paragraphs, cache_name="装备制造")   # 每段一个词列表
+    docs = tokenize_documents({"航天军工": paras1, "能源电力": paras2})
+只要词频、过滤时直接取编号（共享词表），词频、过滤都是 bincount / 布尔掩码：
+    vocab, ptr, ids = encode_paragraphs(paragraphs, cache_name="装备制造")   # 第 i 段为 ids[ptr[i]:ptr[i+1]]
+    keep = (vocab.lengths() > 1) & ~vocab.mask(stopwords)
+    freq = vocab.counts(ids[keep[ids]])
+依赖：jieba、numpy、pandas、openpyxl
+"""
+import os
+import gzip
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import jieba
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+NAME_XLSX = os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "大国工匠知识图谱文件", "大国工匠名单采集.xlsx")
+# 缓存目录固定放在本模块旁边（各脚本会 chdir，不能用相对路径）
+CACHE_DIR = os.path.join(BASE_DIR, ".token_cache")
+NAME_FREQ = 100000   # 用户词典词频，保证姓名优先成词
+
+_names = None
+_jieba_ready = False
+_vocab = None          # 共享词表（token_vocab）
+_vocab_saved = 0       # 已写入磁盘的词数
+_vocab_digests = {}    # 词表前 n 个词 → 摘要（词表只增不改，算过的不用再算）
+
+
+# ---------- 1. 工匠姓名用户词典 ----------
+def craftsman_names(xlsx_path=NAME_XLSX):
+    """名单中的工匠姓名（去空、去重，保持表中顺序）；名单缺失时返回空列表"""
+    global _names
+    if _names is None:
+        if os.path.exists(xlsx_path):
+            col = pd.read_excel(xlsx_path, sheet_name=0)["人物姓名"]
+            _names = list(dict.fromkeys(str(n).strip() for n in col.dropna() if str(n).strip()))
+        else:
+            _names = []
+    return _names
+
+
+def dict_version():
+    """词典版本：jieba 版本 + 姓名表，任何一项变了分词缓存就换一份"""
+    key = jieba.__version__ + "\n" + "\n".join(craftsman_names())
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _userdict_path():
+    path = os.path.join(CACHE_DIR, f"userdict-{dict_version()}.txt")
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            for name in craftsman_names():
+                f.write(f"{name} {NAME_FREQ} nr\n")
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def init_jieba(userdict=None):
+    """加载 jieba 主词典与工匠用户词典（每个进程只做一次）"""
+    global _jieba_ready
+    if not _jieba_ready:
+        jieba.initialize()
+        jieba.load_userdict(userdict or _userdict_path())
+        _jieba_ready = True
+
+
+def _cut_all(paragraphs, userdict=None):
+    init_jieba(userdict)
+    return [jieba.lcut(p) for p in paragraphs]
+
+
+# ---------- 2. 共享词表 ----------
+def _vocab_path():
+    return os.path.join(CACHE_DIR, f"vocab-{dict_version()}.json.gz")
+
+
+def token_vocab():
+    """各段落缓存共用的词表（只增不改，编号一经分配不再变）；每个进程从 .token_cache/ 读一次"""
+    global _vocab, _vocab_saved
+    if _vocab is None:
+        words = []
+        path = _vocab_path()
+        if os.path.exists(path):
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    words = json.load(f)
+            except (OSError, ValueError):
+                words = []   # 词表损坏时从空表开始，各缓存的校验随之失效
+        _vocab = Vocabulary(words)
+        _vocab_saved = len(_vocab)
+    return _vocab
+
+
+def _save_vocab(vocab):
+    global _vocab_saved
+    if len(vocab) == _vocab_saved:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _vocab_path()
+    with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+        json.dump(vocab.words, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+    _vocab_saved = len(vocab)
+
+
+def _vocab_digest(vocab, n):
+    """词表前 n 个词的摘要：缓存里记下写入时的值，读时对不上（词表被别的进程改写过）就当作未命中"""
+    digest = _vocab_digests.get(n)
+    if digest is None:
+        data = json.dumps(vocab.words[:n], ensure_ascii=False).encode("utf-8")
+        digest = _vocab_digests[n] = hashlib.sha1(data).hexdigest()
+    return digest
+
+
+# ---------- 3. 段落级缓存 ----------
+def _para_key(paragraph):
+    return hashlib.sha1(paragraph.encode("utf-8")).hexdigest()
+
+
+def _cache_path(cache_name):
+    safe = cache_name.replace("/", "_").replace("\\", "_")
+    return os.path.join(CACHE_DIR, f"{safe}-{dict_version()}.npz")
+
+
+def _pack(arrays):
+    """各段编号数组 → (段落偏移 ptr, 拼接后的 int32 编号)"""
+    ptr = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, arrays), dtype=np.int64, count=len(arrays)), out=ptr[1:])
+    ids = np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int32)
+    return ptr, ids
+
+
+def _load_cache(cache_name):
+    """→ {段落哈希: int32 编号数组}"""
+    path = _cache_path(cache_name)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with np.load(path) as z:
+            n, vocab = int(z["vocab_size"]), token_vocab()
+            if n > len(vocab) or str(z["vocab_digest"]) != _vocab_digest(vocab, n):
+                return {}
+            ptr, ids = z["ptr"], z["ids"]
+            return dict(zip(z["keys"].tolist(), np.split(ids, ptr[1:-1])))
+    except (OSError, ValueError, KeyError):
+        return {}   # 缓存损坏时当作未命中
+
+
+def _save_cache(cache_name, keys, table):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(cache_name)
+    keys = list(dict.fromkeys(keys))   # 只保留本次用到的段，文档改动后旧段不会无限堆积
+    ptr, ids = _pack([table[k] for k in keys])
+    vocab = token_vocab()
+    with open(path + ".tmp", "wb") as f:
+        np.savez(f, keys=np.array(keys, dtype=str), ptr=ptr, ids=ids,
+                 vocab_size=len(vocab), vocab_digest=_vocab_digest(vocab, len(vocab)))
+    os.replace(path + ".tmp", path)   # 原子替换
+
+
+def _plan(paragraphs, cache_name):
+    """→ (各段哈希, 已缓存的表, 需要重新切的段)"""
+    keys = [_para_key(p) for p in paragraphs]
+    table = _load_cache(cache_name) if cache_name else {}
+    missing = list(dict.fromkeys(p for p, k in zip(paragraphs, keys) if k not in table))
+    return keys, table, missing
+
+
+def _finish(keys, table, missing, cut, cache_name):
+    """新切的段编码进共享词表并写回缓存 → (段落偏移 ptr, int32 编号)"""
+    if missing:
+        vocab = token_vocab()
+        table.update(zip(map(_para_key, missing), map(vocab.encode, cut)))
+        if cache_name:
+            _save_vocab(vocab)   # 先存词表，缓存里的摘要才对得上
+            _save_cache(cache_name, keys, table)
+    return _pack([table[k] for k in keys])
+
+
+def _split(vocab, ptr, ids):
+    """编码结果 → 每段一个词列表"""
+    words = vocab.decode(ids)
+    return [words[a:b] for a, b in zip(ptr[:-1].tolist(), ptr[1:].tolist())]
+
+
+# ---------- 4. 对外接口 ----------
+def encode_paragraphs(paragraphs, cache_name=None):
+    """
+    逐段分词并编码 → (共享词表, 段落偏移 ptr, int32 编号)，第 i 段为 ids[ptr[i]:ptr[i+1]]
+    命中缓存的段直接读出编号数组，不经过 str 列表；给了 cache_name 时按段落哈希读写缓存。
+    """
+    paragraphs = list(paragraphs)
+    keys, table, missing = _plan(paragraphs, cache_name)
+    ptr, ids = _finish(keys, table, missing, _cut_all(missing) if missing else [], cache_name)
+    return token_vocab(), ptr, ids
+
+
+def tokenize_paragraphs(paragraphs, cache_name=None):
+    """逐段分词 → 每段一个词列表（由编码结果解码，需要 str 的场合用）"""
+    return _split(*encode_paragraphs(paragraphs, cache_name))
+
+
+def encode_documents(documents, workers=None):
+    """
+    多篇文档一起分词并编码：{文档名: 段落列表} → (共享词表, {文档名: (ptr, int32 编号)})
+    缓存没命中的文档分给多个进程并行切（只有一篇要切时就在本进程里做）。
+    各行业词频矩阵即 np.stack([vocab.counts(ids) for _, ids in 结果.values()])。
+    """
+    plans = {name: _plan(list(paras), name) for name, paras in documents.items()}
+    todo = [name for name, (_, _, missing) in plans.items() if missing]
+    cuts = {}
+    if len(todo) > 1:
+        userdict = _userdict_path()
+        with ProcessPoolExecutor(max_workers=workers or min(len(todo), os.cpu_count() or 1)) as pool:
+            futures = {name: pool.submit(_cut_all, plans[name][2], userdict) for name in todo}
+            cuts = {name: f.result() for name, f in futures.items()}
+    elif todo:
+        cuts[todo[0]] = _cut_all(plans[todo[0]][2])
+    return token_vocab(), {name: _finish(*plans[name], cuts.get(name, []), name) for name in documents}
+
+
+def tokenize_documents(documents, workers=None):
+    """多篇文档一起分词：{文档名: 段落列表} → {文档名: 每段词列表}"""
+    vocab, encoded = encode_documents(documents, workers)
+    return {name: _split(vocab, ptr, ids) for name, (ptr, ids) in encoded.items()}
+
+
+# ---------- 5. 整数编码 ----------
+class Vocabulary:
+    """
+    共享词表：词 ↔ 连续整数编号
+    分词结果存成 int32 数组（每个词 4 字节，而 Python 字符串每个五六十字节），
+    停用词、人名等过滤条件是按编号索引的布尔数组，词频用 np.bincount 一次算完。
+    """
+
+    def __init__(self, words=()):
+        self.words = []
+        self.ids = {}
+        for w in words:
+            self.add(w)
+
+    def __len__(self):
+        return len(self.words)
+
+    def add(self, word):
+        i = self.ids.get(word)
+        if i is None:
+            i = self.ids[word] = len(self.words)
+            self.words.append(word)
+        return i
+
+    def encode(self, tokens):
+        """词序列 → int32 编号数组（新词自动加入词表）"""
+        add = self.add
+        return np.fromiter((add(w) for w in tokens), dtype=np.int32)
+
+    def decode(self, ids):
+        words = self.words
+        return [words[i] for i in ids.tolist()]
+
+    def mask(self, words):
+        """词表长度的布尔数组：属于 words 的编号为 True（不在词表里的词忽略）"""
+        m = np.zeros(len(self.words), dtype=bool)
+        hit = [self.ids[w] for w in words if w in self.ids]
+        m[hit] = True
+        return m
+
+    def lengths(self):
+        """每个编号对应词的字数"""
+        return np.fromiter(map(len, self.words), dtype=np.int32, count=len(self.words))
+
+    def counts(self, ids):
+        """词频表：长度等于词表大小的 int64 数组"""
+        return np.bincount(ids, minlength=len(self.words))
+
+    def top(self, counts, n=None):
+        """按频次降序的 [(词, 次数), ...]，次数为 0 的不列出"""
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0][:n]
+        return list(zip(self.decode(order), counts[order].tolist()))
+
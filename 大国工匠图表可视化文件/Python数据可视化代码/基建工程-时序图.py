@@ -2,37 +2,22 @@
 """
 《基建工程》六维情感时序图（纯 CPU + 中文无乱码）
 """
-import re
-import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
-from docx import Document
+from 语料库 import load_corpus
+from 融合分析 import load_fused
+from 词典 import TIMELINE_LEX
 
 # ---------- 1. 针对「基建工程」的 6 维词典 ----------
-LEX = {
-    "精度":   "精度|毫米|微米|丝|零误差|毫米级|厘米级",
-    "匠心":   "匠心|精益求精|手工|研磨|吊装|吊装工|钳工",
-    "安全":   "安全|零事故|滴水不漏|人命|风险|守护",
-    "创新":   "创新|突破|首创|模拟|自动化|机器人|新工艺",
-    "坚守":   "坚守|30年|40年|一辈子|传帮带|扎根|归零",
-    "自豪":   "自豪|大国工程|超级工程|世界之最|中国奇迹"
-}
+LEX = TIMELINE_LEX["基建工程"]   # 词典统一写在 词典.py，与其他图表一起登记
 
 # ---------- 2. 工具函数 ----------
-def read_docx(path):
-    doc = Document(path)
-    return [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-
-def sent_cut(text):
-    return [s.strip() for s in re.split(r'[。！？；]', text) if s.strip()]
-
-def lexicon_score(sentence):
-    scores = []
-    for dim, pattern in LEX.items():
-        hits = len(re.findall(pattern, sentence))
-        scores.append(min(hits / 3, 1.0))
-    return scores
+def lexicon_matrix(corpus):
+    """小句 × 六维 的 float32 得分矩阵：计数取自全语料命中表（融合分析），不再逐句扫描"""
+    hits = load_fused(corpus).alternation_counts("基建工程", LEX.values())
+    return np.minimum(hits.astype(np.float32) / 3, 1.0)
 
 # ---------- 3. 画图（中文无乱码） ----------
 def plot_timeline(df):
@@ -58,18 +43,15 @@ def plot_timeline(df):
 
 # ---------- 4. 主流程 ----------
 def main():
-    if not os.path.exists("基建工程.docx"):
-        print("❌ 请将「基建工程.docx」放在当前目录再运行！")
+    corpus = load_corpus()
+    if "基建工程" not in corpus:
+        print("❌ 请将「基建工程.docx」放在 原文本数据文件 目录再运行！")
         return
-    paragraphs = read_docx("基建工程.docx")
-    sentences  = []
-    for p in paragraphs:
-        sentences.extend(sent_cut(p))
+    # 按段落切成小句（[。！？；]），直接从 mmap 语料按偏移取出
+    sentences  = list(corpus.clauses("基建工程"))
     print(f"共切分 {len(sentences)} 句，开始打分...")
-    df = pd.DataFrame(sentences, columns=["sentence"])
-    lex_scores = df["sentence"].apply(lexicon_score)
-    for idx, dim in enumerate(LEX.keys()):
-        df[dim] = [v[idx] for v in lex_scores]
+    df = pd.DataFrame(lexicon_matrix(corpus), columns=list(LEX.keys()))
+    df.insert(0, "sentence", sentences)
     df.to_csv("infrastructure_6d.csv", index=False, encoding="utf-8-sig")
     plot_timeline(df)
     print("✅ 完成！文件：infrastructure_timeline_final.png | infrastructure_6d.csv")
@@ -1,63 +1,34 @@
 # -*- coding: utf-8 -*-
 """
 行业-品质热力图数据生成器（沿用 sklearn，仅追加写 CSV）
-运行前：pip install python-docx pandas scikit-learn
+运行前：pip install pandas scikit-learn
 """
 
-import re
-from collections import defaultdict
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfTransformer
-from docx import Document
+from 语料库 import load_corpus
+from 融合分析 import load_fused
+from 词典 import INDUSTRY_DICTS, QUALITY_DICTS
 
 # -------------------- 1. 词典 --------------------
-INDUSTRY_DICT = {
-    "航空制造": ["运-20", "C919", "大飞机", "机身", "钣金", "舱门", "蒙皮", "胡洋", "王伟"],
-    "核电建设": ["核电站", "主管道", "焊工", "未晓朋", "田湾", "核电", "焊缝"],
-    "射电望远镜": ["FAST", "反射面板", "吊装", "周永和", "射电望远镜", "天眼"],
-    "海底隧道/桥梁": ["港珠澳大桥", "沉管", "管延安", "海底隧道", "深中通道", "大连湾"],
-    "LNG船舶": ["LNG船", "殷瓦钢", "张冬伟", "液化天然气", "围护系统"]
-}
+INDUSTRY_DICT = INDUSTRY_DICTS["基建工程"]   # 词典统一写在 词典.py，与其他图表一起登记
+QUALITY_DICT = QUALITY_DICTS["基建工程"]
 
-QUALITY_DICT = {
-    "精度": ["毫米", "0.5毫米", "0.25毫米", "误差", "精度", "严丝合缝", "缝隙"],
-    "责任": ["责任", "耻辱", "荣耀", "名字", "刻", "终身", "一辈子"],
-    "创新": ["数字化", "零的突破", "第一次", "首创", "革命性", "探索"],
-    "专注": ["专注", "耐心", "重复", "一遍又一遍", "再检查", "强迫症"],
-    "吃苦": ["高温", "汗水", "狭小", "闷热", "烫", "疼", "苦"],
-    "学习": ["学习", "笔记", "日志", "培训", "请教", "啃", "坚持"],
-    "协作": ["团队", "合力", "配合", "并肩", "专家团", "几十人"],
-    "极致": ["百分之百", "100%", "0漏点", "天衣无缝", "无可挑剔", "完美"]
-}
-
-# -------------------- 2. 读 Word --------------------
-def read_docx(path):
-    return "\n".join(p.text for p in Document(path).paragraphs if p.text.strip())
-
-text = read_docx("基建工程.docx")   # 如需换路径，改这里
+# -------------------- 2. 读语料 --------------------
+corpus = load_corpus()   # 语料取自 原文本数据文件/，如需换路径改 load_corpus(src_dir=...)
 
 # -------------------- 3. 匹配 --------------------
-sents = re.split(r'[。！？]', text)
-ind2q = defaultdict(lambda: defaultdict(int))
-
-for sent in sents:
-    inds = [ind for ind, kw in INDUSTRY_DICT.items() if any(k in sent for k in kw)]
-    if not inds:
-        continue
-    for qual, kw_list in QUALITY_DICT.items():
-        cnt = sum(sent.count(k) for k in kw_list)
-        if cnt:
-            for ind in inds:
-                ind2q[ind][qual] += cnt
+# 句子 × 行业/品质 计数取自全语料命中表（融合分析，与其他图表共用一次扫描），
+# 行业 × 品质 频次 = 行业出现ᵀ · 品质计数
+co = load_fused(corpus).cooccurrence("基建工程", INDUSTRY_DICT, QUALITY_DICT)
+# 只保留有品质命中的行业，按首次出现的先后排列
+rows = co.first_seen_order()
 
 # -------------------- 4. sklearn TF-IDF --------------------
-industries = list(ind2q.keys())
+industries = [co.row_names[i] for i in rows]
 qualities = list(QUALITY_DICT.keys())
 
-freq_mat = pd.DataFrame(0, index=industries, columns=qualities)
-for ind, qdict in ind2q.items():
-    for q, v in qdict.items():
-        freq_mat.loc[ind, q] = v
+freq_mat = pd.DataFrame(co.frequency()[rows], index=industries, columns=qualities)
 
 tfidf = TfidfTransformer(norm=None).fit_transform(freq_mat.values)
 tfidf_dense = tfidf.toarray()
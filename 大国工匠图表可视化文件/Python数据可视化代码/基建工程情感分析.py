@@ -5,562 +5,69 @@ import matplotlib
 matplotlib.use('TkAgg')  # 强制兼容后端
 import matplotlib.pyplot as plt
 import os
+from 语料库 import load_corpus
+from 关键词匹配 import count_groups
+from 故事切分 import StoryRecord, doc_record
+from 融合分析 import story_density
+from 词典 import RADAR_KEYWORDS
 import warnings
 warnings.filterwarnings('ignore')
 
 # 1. 基础配置（基建领域专用）
-os.chdir('E:\\')  # 工作目录（文档需放此路径）
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei']  # 解决中文乱码
 plt.rcParams['axes.unicode_minus'] = False
 
-print("=" * 60)
-print("基建工程领域情感分析系统")
-print("工作目录:", os.getcwd())
-print("=" * 60)
+DIMENSIONS = ['精度要求', '工程难度', '坚守付出', '创新突破', '社会价值']  # 基建5维度
+# 各维度关键词写在 词典.py，与图表词典一起登记；语料里的故事直接从融合命中表计数
+KEYWORD_GROUPS = RADAR_KEYWORDS['基建工程']
 
-# 2. 从文档内容直接提取（修复：初始化stories列表）
-def extract_stories_from_content():
+# 2. 按人物名从语料库加载文章（原文存放在 原文本数据文件/工匠故事/基建工程/）
+def extract_stories_from_content(corpus=None):
     # 初始化stories列表（核心修复点）
     stories = []
     # 这6个人物是我们知道的
     target_names = ["胡洋", "未晓朋", "周永和", "王伟", "管延安", "张冬伟"]
     
-    # 1. 胡洋部分
-    hu_yang_content = """
-大国工匠丨胡洋："鲲鹏"机身数字化装配领军人
-
-人物频道来源：央视新闻 2021年05月04日 11:10A-A+
-
-　　代号"鲲鹏"的运-20飞机，是我国自主研制的首款大型运输机，标志着中国大飞机设计制造能力取得突破性进展。在它的身上，凝聚了几代航空人的智慧和汗水。今天的大国工匠，我们来认识一位90后的年轻人，他是运-20飞机机身数字化装配的领军人------胡洋。
-
-　　在中航西飞，新一架运-20开始机身调姿。这是飞机制造过程的重中之重。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：整机的姿态有问题的话，它的机翼肯定就是个偏的，垂尾也是偏的，起落架也是偏的，会造成很严重的后果。
-
-　　机身调姿对精度要求极高，全长50米的机身，各个部位偏差不能超过0.5毫米，这就好比在一个篮球场不能出现芝麻粒大小的误差。在以往，这项工作需要十几个人通力合作一个月才能完成，今天只要两三个人一天就可以完成这项复杂精密的工作，胡洋带领的团队实现了大飞机机身数字化装配零的突破，效率提高百倍的同时，精度能达到毫米级。
-
-　　作为领军人的胡洋，只是一个90后，他是如何做到的呢？
-踏实沉稳，是很多人对胡洋的第一印象。然而，在刚参加工作时，他可不是这样。2014年，胡洋大学毕业后进入中航西飞公司，分配给他的工作让他心凉了半截。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：干手工活，主要就是制孔，当时肯定是觉得不甘心，屈才了吧。
-
-　　心浮气躁的胡洋，最终付出了代价。在一次制孔的过程中，他在一个已经制过的孔上又制了一遍。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：我还觉得这没啥。这个两个孔就两个孔呗，修一修补一补也就能过来。
-
-　　事后，师父严肃批评了胡洋，告诉他，飞机上任何一个小孔出现问题，都可能产生裂纹，久而久之，可能导致飞行中解体。他在笔记本上记下了这样一段话。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：后来想想这个事儿汗毛都竖起来了，每次翻开本的时候也是能够自我提醒一下，改掉毛毛躁躁的坏习惯。
-
-　　经过这次教训之后，胡洋的性子慢慢沉了下来。不久后，为提高制造效率，中航西飞决定在运-20装配中启用数字化系统，胡洋被推荐加入了培训班。数字化装配涉及测量系统、自动控制和计算机软件等许多先进技术，是飞机制造的一次革命性变革。胡洋白天跟着专家在现场实践，晚上把白天的知识吃透、搞懂，找出问题，第二天继续向专家请教，这样的循环模式他不知道坚持了多少个日夜。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：感觉挑战很大，每一天你都会接触到新的事物，都会接触到新的技术，所以说就强迫自己，不停地学习，不停地进步，现在想想，很感谢当初的自己坚持下来了。
-
-　　坚持下来的胡洋，最终承接了运-20大飞机机身数字化装配任务。很快，第一次大考来了。2015年底，厂里第一次启用数字化系统进行机身调姿。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：第一次接手数字化装配的工作，内心是非常忐忑不安的，就是对自己心里没底，这个东西能不能做好。
-
-　　调姿结束之后，厂里组织了几十人的专家团来对结果进行验收。
-
-　　中航西飞机身装配厂厂长
-陈勇刚：结果实际上是超乎我们预料的。他们实现了0到1的一个突破。
-
-　　中航西飞机身装配厂单元长
-杨理勇：比我们传统的一个是效率高，第二个的话就是说装配的精度。这一块的话完全是传统的手工所达不到的。不服不行啊。
-
-　　七年时间，胡洋完成了从毛头小伙到业内专家的蜕变，一同蜕变的，是他头发的由黑转白。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：我是去年的10月30日结的婚，因为我头发白得比较多，有80%的人会问你？你结婚？你才结婚？你还没结婚？我说我是90年的。
-
-　　让胡洋自豪的是，经他手装配的运-20，用一次次完美的表现越来越多地出现在国家的重大任务中。
-
-　　中航西飞机身装配厂数字化装配工程师
-胡洋：每一次听到"胖妞"（运-20）的消息，作为它的亲历者，这种自豪感是无法用任何语言来形容的。作为一个航空人，我觉得非常幸运能够生在这个时代，同时参与这么重要的一个型号的研制，我想这将会是我这辈子唯一的一生的事业。
-
-　　（总台央视记者 张勤 岳群 王琰 李宁 张昊 秦晓猛 梅书军）
-"""
-    stories.append({'name': '胡洋', 'content': hu_yang_content})
-    
-    # 2. 未晓朋部分
-    wei_xiaopeng_content = """
-4.2 核电站主管道焊工未晓朋
-
-核电是一种清洁的新型能源然而核电站里的物质一旦发生泄漏后
-
-我不堪设想因此核电站内部连接和反应堆的输送管道就显得格外重要
-
-今天我们大国工匠系列报道的主人公就是一位焊接核电站主管道的电焊工
-
-魏小鹏在东部沿海的连云港田湾核电站正在紧张建设
-
-密集布设的管道历尽曲折大都指向核电站的核心部位和反应堆这些管道实际上就是连接核电站心脏的血管
-
-特别是主管道在这个核反应对设计寿命的40年泉州期里高辐射高流速高温高压的戒指日夜不息的在以主管道组成的回路当中流过
-
-这对主管道的焊接之处是一个极其严峻的考验不过这个一段泄露了不得了
-
-这核电就相当于就报废了对这个地方的这个生态环境就产生很大的影响
-
-出于最重要的核安全考虑这个核电站的主管道设计管闭后达70毫米是目前中国所有核电站主管道当中最后的
-
-由于这种材料结构复杂焊接难度大目前只能采用手工焊接而这样的手工焊接需要世界级水平
-
-田湾核电站273号机组主管到焊接进入收官阶段的时候梅雨季节也如期而至连续的雨季然后他对里边我们这个工作环境
-
-那个湿度的影响非常大但这个湿度呢要对我们焊接就形成一个致命的一个影响
-
-因为它极易造成我们那个焊条燃烧过程中产生你看不着的气孔这个东西就跟幽灵一样这种气孔是人用肉眼无法观察到的
-
-而他们的存在对核电站的长期稳定运行可能造成极大的威胁你气洪一多了之后以后就容易造成那种硬力集中
-
-英语集中之后他那个地方就容易产生裂纹裂纹一大了之后接到口就可能有可能断裂的
-
-为了不耽误工期同时也有效避免气孔出现工程部门采用给管道预热加温降低湿度的办法
-
-而这也意味着主管道的电焊工很多时候必须在高温质考下闷在管道里操作
-
-那一道口要焊很长时间光焊条都要焊4600个左右焊那么多
-
-然后里边你像平常都是加温的特别热夏天像我们那个汗甩的到处都是魏小鹏身材高达着装的肩宽约70厘米
-
-主管道的内径仅有90厘米魏小鹏在极为狭小的空间下操作只能任凭汗花火线迎头淋浴
-
-而管道曲折的拐弯又使他的身躯强行扭曲在这种状态下魏小鹏手上的焊枪还必须稳稳的保持到一根焊条焊完为止保持不了一个特别好的实现角度
-
-你就保证不了焊接质量所以有时候就要忍住接手那个飞剑往下掉烫的很疼啊
-
-按照惯例主管到焊接的每一圈焊接任务完成之后都要经过检测人员严格的射线检测检测结果均显示
-
-魏小鹏和工友们的焊接合格率达到了百分之百在完成整个焊接后焊工要把自己的工号刻到主管道上面
-
-这不仅仅是一种荣耀更多的是一种责任那就是我的名字那道口和我的名字和我的名也紧紧的就绑在那了是永久的
-
-如果我干不好那就是我的耻辱
-"""
-    stories.append({'name': '未晓朋', 'content': wei_xiaopeng_content})
-    
-    # 3. 周永和部分
-    zhou_yonghe_content = """
-4.3 FAST射电望远镜吊装工周永和
-
-我们再来关注几天前的世界上口径最大灵敏度最高的射电望远镜fast
-
-在我国贵州洛城启用被称为世界天眼的fast有40多万块反射面包
-
-在距离地面100多米的高空当中拼接而成而根据要求的面板之间的吻合误差不能超过两毫米
-
-这个难度是前所未有的任务就落在了中船重工武船集团其重工周永和所在的吊装团队的
-
-身上发型的工程的主体部分
-
-是一个口径500米的球面反射镜总面积达到25万平方米之前世界上最大的射电望远镜
-
-口径只有350米是由3万多块小金属反射面板历时11年才修建完成
-
-萨斯特设定望远镜的反射面板多达40多万块留给周永和的拼接周期只有不到一年的时间
-
-我们就是如何考虑把这每一块面板准确安全的安装单位
-
-最大的难题就是什么样的整体吊装模式才能够完成这项工作周永和精心研究安装图
-
-每一块面板编号多少在什么位置尺寸大小他闭上眼睛都能说出来
-
-经过反复讨论试验朱勇和他们选择用原绘模式进行吊装就从中间
-
-签一根线然后沿着这个半径250米这个半径换一个圆
-
-对圆规的最早理论描述介于2000多年前的大将墨子他说圆一中同场演2000多年后吊装萨斯特的中国功匠从圆规中得到启迪
-
-他们在巴斯特圆心的会员舱位置修建一个环凉作为圆规的中心支撑点晚边架设起一圈钢梁轨道
-
-两个支撑点之间有两根粗钢两连接安装的时候装运机车在缺粮轨道上转动把面板运送到指定位置
-
-呃反正经理现在能不能做我想着你个三个星期干什么有
-
-你先先先把你这个角落去先投出去好好放放放好历时270多天90%的反射面板安装完毕
-
-但是位于球面中心位置的吊装成了新的难题原先那个位置几乎就是我的帮环境的一个忙处
-
-他一个他左胳膊大号的柜子这是一次全心而大胆的探索离地100多米的高空中他们在500米的球面上牵引一条钢缆
-
-利用钢板的自然下垂将反射面板顺势而下到达指定位置这给安装团队的操作精度要求更为苛刻一旦出现失误行攻进气
-
-过了一半超过一半呢
-
-你现在这个速度是多少分啊31你还可以加一点加到35好好好好几点听了两边同事同事都管你好看的看看看看看见也行
-
-2016年7月3号
-
-位于中国贵州省平塘县大窝档洼地的世界最大单口径射电望远镜fast完成最后一块反射面板的吊装并于9月25号落成它能够以目前世界上最高的灵敏度
-
-开展从宇宙起源到星际物质结构的探寻甚至还可能用于搜寻地外文明的通讯信号寻找外星人这个望远镜本身就是为了开发太空探索这个宇宙奥妙
-
-都是我自己而言当困难一次一次的扑面而来的时候我认为对我自己也是有微微的机会
-
-也就是他是我自己这个过程
-"""
-    stories.append({'name': '周永和', 'content': zhou_yonghe_content})
-    
-    # 4. 王伟部分
-    wang_wei_content = """
-4.6 大飞机钣金工王伟
-
-不了hp九脱离这边千古弓匠的业绩已经竖起历史的丰碑
-
-今天的中国工匠正在为中国民族的当下发展制造腾飞的翅膀20多年前第一架有着纯正中国血统的大飞机运石就曾在这里起降
-
-尽管运石是非只有164个小时就未再延续但是他已经启动了一个伟大的梦想
-
-中国这么大一个国家没有一个飞机啊这样的项目出来就没有长长的气势
-
-20年过去中国终于重启民用大飞机项目
-
-这就是如今已经明满天下的c 919中国自主制造的新一代大型喷气式科技
-
-在中国自主制造大飞机的制造者行列中反精工王美的经历颇有点传奇色彩
-
-上世纪80年代包括运石在内的一系列民用飞机生产线陆续项目
-
-大部分产业工人转岗当时风华正茂的反进攻王伟也不得不告别上海飞机制造厂
-
-临走的时候他带上了一块废弃的金属板让我心里一直想我们国家哪天有我们自己的飞机这么我离开了但是有时候
-
-有时回家还要愿意那个基本狗离开飞机制造厂之后王伟干过许多工种
-
-最后开启了货运出租车但是在闲暇的时候他用木锤不停的敲击着那块当初从厂里带走的金属
-
-在敲击的旋律中他似乎能够回到展示身手的弓匠岁月
-
-听老人家说过这个敲完好像越敲越穷死吧帮你敲这个碗
-
-难道要去讨饭吗敲满的声音仍然不时的从厨房里传出来慢慢的大家都习惯了我一颗心永远坚持着我要回来造我们祖国的大队
-
-在王伟的家里60多平米的老房子里几乎没有什么装饰物
-
-但王伟父亲的光荣退休证一直都挂在客厅的墙上王伟的父亲当年参加过运石项
-
-我脾气很好的漂亮不过别生上天虽然能隆重了哎呀别跑到两边
-
-院士下马之后老人做了一个决定不是国产的飞机就不做
-
-直到今天他没有乘坐过任何飞机出行80多岁的老人一直在等着中国大飞机重启的消息
-
-他也是跟我讲哎呀自己的意识没有飞上去希望我们国家能够从我们这代身上看到我们
-
-自己祖国的大飞机敖上蓝天2006年中国政府制定增强国家核心竞争力的战略规划自主设计制造大飞机再次列入日程
-
-货运出租生意做的顺顺当当的王伟一天无意当中从客户那听到中国已经重启大飞机项目
-
-他用最短的时间联系上了自己当年的师傅谁也觉得主导不了我回来的时候我们中国人也托起我们中国大飞机的饭碗离开飞机制造厂十年之后王梅终于回来
-
-这意味着他必须放弃每个月五六千元的收入还要先当三个月的施工
-
-施工期间每个月只有1000元的工资新团队中很少有人知道王
-
-他们最担心的是面对新的标准和任务这里年近50的出租车司机能否胜任钣金工作
-
-你干好了以后就是机会对吧如果这个实习心理要考虑也也保证不了那就没法干了
-
-每天清晨王伟几乎总是第一个来到板金车间这个时间从他2007年回到厂里就雷达不动
-
-似乎他从未离开过这里在外闯荡十多年的游荡岁月
-
-不曾存在过现在他只专注于钣金工作外面的世界与他已经没有关系
-
-c 919的零度件有分之80是第一次设计生产
-
-除了舱体型材更加坚硬舱门的下部还有一道轻微的弧线变化
-
-这个变化用肉眼几乎看不出来要用手工敲打出来难度可想而知
-
-它的长度如果达不到的话根本就不能承受在空中承受那个空气对它的压力直接造成一个安全问题舱门的加工误差要求在0.25毫米以内
-
-这对机械加工来说是无法完成的任务这不仅是在中国即便是美国的波音欧洲的空客飞机制造也都是靠手工来实现的
-
-欧美的客运大飞机制造业早已经成熟有他们的专业工匠
-
-刚刚起步的中国客运大飞机制造行业里有这样一把木锤吗这个狼头的
-
-落点基础不好蓝头的那个用的力度不好你很难敲到我们蒙皮的要求25
-
-c919的舱体采用一种全新的复合材料
-
-这种被称为铝里合金的型材硬度更高更使用木锤的板筋
-
-工而言只凭着木锤的密集敲击就让坚硬的金属板材浮浮帖帖的变成设计的形状
-
-是一项巨大的挑战这就是说这所以我只能在心里一年以中达到什么程度它才能变成那么我们根据这个力度从一点点的从整个一条线上
-
-一点点这个是0那个只有二十五十现在是25是三个进去的但我们这里是没问题的最佳我们来实施啊大的话实事都过不了我现在用了90
-
-盲美敲击的舱体与工装之间的缝隙让酒私的粮食都无法通过这就证明他已经将工差缩小到了接近标准工差的1/3感觉就是
-
-我不敢想象怎么可能呢对吧王伟把这种胡变翘到94级的工厂也就是一
-
-毫米的9%所有质疑声停止了他用行动证明自己手里的这把板金锤是真正的
-
-王者归来不管坐飞机哪个部分哪个零件只要你有这种想法
-
-只要你把事情做好那么在飞机的每个地方就你的新学生中所以我也就坚定了我的信
-
-流转者2015年11月中国自主制造的大飞机c919下线
-
-c代表着中国九是中国传统的吉祥数字寓意天长地久要求代表着这款国产客机的最大载客量可以达到190人
-
-目前中国自主制造的大飞机c919正在接受批量投产前的系列检验他投入蓝天运营已经指日可待
-
-大飞机的自主制造成功使国家制造业水平的系统化高标准体现使中国制造业全面腾飞的象征
-
-这个腾飞的实现依托于千百万中国工匠的坚守钻研勤奋和所达到的
-
-记忆境界
-"""
-    stories.append({'name': '王伟', 'content': wang_wei_content})
-    
-    # 5. 管延安部分
-    guan_yanan_content = """
-管延安
-
-管延安：中国"深海钳工"第一人
-
-来源：大众日报2024-07-0514:29
-
-"周末人物·中国新闻名专栏"
-
-原标题：
-
-管延安：中国"深海钳工"第一人
-
-登上浮山湾北岸的"青岛之巅"，若是遇上风轻云淡、晴空如洗的天气，可东望崂山奇峰俊秀、云气离合，西瞰大小珠山"双珠嵌云"、如临仙境......
-
-然而，在中交一航局二公司（下称：二公司）总技师管延安的眼里，最美的风景却不是它们，而是时常泊于浪花粼粼中、见证着他和团队多年来国有号召、使命必达、战风斗浪的"津安1"轮、"津安2"轮和"津安3"轮三艘"功勋船"。
-
-这儿，承载着他和他们把一次次"不可能"变成"有可能"、最终"一定能"的光阴故事，镌刻着他和他们拥抱"国之大者"、铁杵磨成针创造"中国奇迹"的光荣与梦想。
-
-在管延安和工友们的世界里，这一片海早已不再是一片海。
-
-多少年以后，"我"就成了"你"
-
-"当初建设条件非常艰苦，很多施工工序都是靠肩扛人挑；没有水泥搅拌站，只能靠简陋的机器搅和，大部分还是靠人工。如果遇到机器不给力、工期赶得紧的时候，不用你去喊人，身边就会有无数个'铁人王进喜'式的人物挺身而出！"今年98岁高龄的老党员吴显英，是迄今在世不多的一位亲历者，回首往事依然心潮澎湃，"那时候每天干的是高强度体力活，手掌磨出血泡是家常便饭；没有淡水，就在离海滩不远处钻井取水；住的是草棚，每家只有4平方米，用帘子隔断，进门就是床......"
-
-走进二公司办公楼一楼大厅，赫然映入眼帘的，是记载着公司70年创业史的一面"光荣墙"。
-
-曾几何时，由李春美、孙琦、曲虹等28名扎根一线打混凝土的女工组成的"铁姑娘班"的事迹，成为二公司发展史上的一桩"美谈"、一面"旗帜"，织就了艰苦创业基因的厚重底色。
-
-"当我还是一名农民工的时候，就听领导和老职工经常讲起公司的光荣创业史，每次听后都心潮澎湃，心想有朝一日，自己也能成为其中的一份子。"作为一名后来者，提起这一段段创业佳话，管延安如数家珍，"新中国成立后，二公司参与了山东95%以上的码头建设项目，还有好些省外工程，"管延安讲到这里，眼中绽放出光彩，"特别是港珠澳大桥这一'超级工程'和日照港、海南南浦港等，都留下了二公司职工拼搏奋斗的汗水与足迹！"
-
-"宁让汗水漂起船，不让工期拖一天。"老一辈筑港人感天动地的豪言壮语，鼓舞了一代又一代人，至今也常常是大家攻坚克难时喊出的铮铮誓言。
-
-"是公司第一批建设者不怕流血流汗、豁出命也要建好争气港的精气神激励着我，是公司天高任鸟飞的沃土培养了我，是港珠澳大桥这一百年不遇的超级工程造就了我，"在"大国工匠管延安创新工作室"，说这话的时候，管延安双眸中透射出一种真诚、质朴而又蓄满力量的光，"否则，一个只有初中学历的农民工，哪有风风光光的今天？"
-
-多少年以后，"我"就成了"你"。
-
-"当工人可以学历低，但不能不学习"
-
-1977年，管延安出生在山东诸城的一个小乡村。父母和姐姐都是农民，脚踏实地、淳朴善良的本性自幼就融进了他的血液里。
-
-无奈天资一般，管延安初中毕业就结束了自己的学习生涯。他没有气馁，认为人生的路有千万条，并非只有考大学这座"独木桥"。1995年，管延安只身来到青岛，拜师学习机电维修。
-
-他的职业生涯从这里启航了。
-
-不久后的一件事，让他一辈子铭记在心。在一次大型电机常见故障维修中，师傅叮嘱他完事后再认真检查一遍。可管延安自我感觉良好，认为胸有成竹的事无须再回头检查。结果，电机一装上就烧坏了。考虑到他是新手，年龄又小，师傅没有责罚他，只是要求他返工。管延安羞愧难当，认认真真地找到电机烧坏的部位，小心翼翼地更换了新部件，又回头反复检查了两遍，确保没问题后才敢向师傅复命。
-
-自此，管延安心里刻下了"烙印"------每件事做好后，务必多检查一次。
-
-"当工人可以学历低，但不能不学习"，师傅常对他讲，"你要记住，人这辈子，不学则无术，无技则不立。"
-
-开了窍的管延安，逐渐领悟到了许多以前不懂的道理。学徒期间，他熟练掌握了錾、削、钻、铰、攻、套、铆、磨、矫正、弯形等各种设备的维修工艺和电气调试安装技术等，并养成了每天做笔记的好习惯。知识的储备积少成多，技能的羽翼日渐丰满，工作中他开始独当一面，甚至能独立解决常常让师傅们也抓耳挠腮的工艺难题了。
-
-最重要的是，所有维修过的机械设备，他都会再三检测并确保无误后，才交工。
-
-20多年，这一"习惯"从未改变。
-
-在跟随二公司参建了多项重点工程后，因为表现出众，2013年，管延安和工友们光荣地投身到"超级工程"------港珠澳大桥建设中。
-
-管延安的同事周炳东说："管师傅，就是个'学习迷'，这一点可羡煞俺了！"
-
-在港珠澳大桥的沉管加工基地牛头岛，平时工人宿舍都在岛的东面，管延安为了练习设备安装，直接把宿舍搬到了设备仓库的一处简易样板房。十几平方米的空间内，林林总总堆满了船舶机械类的书籍。
-
-管延安说："这么大的工程，需要学的东西太多了！"
-
-到了港珠澳大桥项目部后，管延安把自己忙成了"闪电"------在"津平1"轮上，他主动跟厂家技术人员学习碎石垫层铺设系统的机械原理和部件检修；在大型沉管安装船"津安2"轮、"津安3"轮上，跟技术主办学习专用锚机和变频器的检修......有一阵子，徒弟们都对他有"意见"了------每天的车间会开始前，管师傅总是第一个来"抢座"，会上，还不时地向"老师"提问题，听得入迷，记得认真。
-
-俗话说：好记性不如烂笔头。管延安经常向徒弟们"炫耀"他的"宝贝"------6本厚厚的"日志"。"这都是宝藏呐！以前带我的师傅每次把自己修机器的过程记下来，我也学着把自己修过的每一台机器、拆过的每一个零件都做详细笔记，闲的时候可以翻阅温习。"日记里面除了文字，还有他自创的许多"图解"符号。"这些日志，只有我自己能看懂，徒弟们看的时候还要我翻译呢！"管延安笑着说。
-
-2013年4月，"津安3"轮用于船舶坞内系泊的4台25吨绞缆机，有两台出厂装配时密封没有处理好，加上连续下雨，电机大量进水后烧坏了。工作人员赶紧联系生产厂家，对方的回复是至少15个工作日才能修复。管延安即刻便决定自己干，他带领徒弟将电机定子绕组拆除后换新，内部进行清理、烘干，密封处理后再装配调试。令人欣喜的是，仅用4天时间就修复如初，大大缩短了工期。
-
-2020年10月，"交工79"轮因现场施工需求和年限使用要求，两台主机需要更换新机，并把功率由2000匹升级改造为4000匹。但新旧主机底座不同，一旦进行更新，势必增大施工风险、延长工期。管延安看在眼里、急在心里，最后别出心裁地想出了新对策------在主机原来螺栓固定的基础上，于底座前后左右增加厚25毫米并攻丝M32的异形钢板，焊接在底座旁边，再用螺栓固定住。如此，避免了施工风险并缩短了工期。
-
-获得"全国技术能手"的同事成益品，在港珠澳大桥建设中负责线性控制贯通测量工作，也就是通过精准的测量数据来指导大桥沉管的合龙。但令他沮丧的是，两年间进行了3次试验，均以失败告终。
-
-"是与我并肩作战的管延安，深深地触动了我。"成益品说，二次舾装是沉管制造的最后一道工序，为了给沉管安装一双能看清海底水况的"眼睛"，连续多日，他看到管延安顶着烈日，在管顶上耐心检查一大堆设备，并把这些设备运到水下10多米的沉管中。法兰盘是阀门的关键部件，每次维修，管延安都亲自动手，只见他铺开耐水砂纸，倒上研磨油，随着手臂不急不缓地摆动，一个直径20多厘米的金属盘在砂纸上均匀地画圈；磨一会，就用手摸一摸盘面，然后又磨起来。10分钟、20分钟、半小时过去了，管延安仍在一圈一圈地研磨，直到锈迹斑斑的法兰盘变得锃光瓦亮，管延安才在上面均匀地抹上黄油，再小心装配到电动蝶阀上......
-
-"这才是匠人该有的样子呀！"成益品对此历历在目，佩服得五体投地。
-
-身边的榜样给了成益品力量和勇气。于是，他重拾信心，不断调整工作思路，终于，在第4次试验的时候获得成功，并完全掌握了超长沉管隧道精密工程测控核心技术。后来，成益品还获得了"国务院特殊津贴"等多项荣誉。
-
-微光见于平凡。与光同行，人生自会重燃。
-
-"大国重器"锤炼"大国工匠"
-
-2024年4月19日，举世瞩目的港珠澳大桥主体工程通过竣工验收。大桥主体工程创下多项世界之最，工程质量等级和综合评价等级均为优良，打造了一座精品工程、样板工程、平安工程、廉洁工程，造出了世界上最难、最长、最深的海底公路沉管隧道。
-
-这一"超级工程"，倾注着管延安和其他建设者们五年多如一日的辛劳汗水。
-
-作为岛隧工程4000多名建设者之一，管延安和团队主要负责大桥8万吨沉管的安装工作。经历千余次技术攻关，数万公里的交通里程，他们创造了世界最长外海沉管隧道在深海"滴水不漏"的奇迹。
-
-其中，沉管安装是大桥建设中最具挑战、最为关键和风险最大的一环。大桥海底隧道由33条巨型沉管连接而成，每条标准沉管长度为180米，水平面积有10个篮球场大。超级沉管要在30多米海底实现厘米级精确对接，在业内人士看来，难度系数丝毫不亚于"神舟九号"与"天宫一号"的对接。
-
-"港珠澳大桥建设锤炼了我的人生，让我对工匠精神的领悟有了本质变化。"对此，管延安感触颇深。
-
-在第一节沉管安装后不久，中国工程院院士、时任港珠澳大桥岛隧项目总经理、总工程师的林鸣来到管延安所在的维修基地，看见他们正在专心清理蝶阀中的法兰盘，他指着两排摆放得整整齐齐的蝶阀问："这些蝶阀怎么分成两排摆放？"管延安回答说："前面这些都是保养过的，后面那些，经检查存在隐患，作为淘汰品不能再用。"
-
-林鸣总经理对此提出了质疑："蝶阀要重复使用，经过保养的和不能使用的看不出明显差别。遇到紧急情况，会不会出现不知情的操作者混拿、混用现象？"在场的人都明白，蝶阀是调节8万吨沉管在深海下沉的"命门"，一旦出问题，后果不堪设想。
-
-林鸣的话让管延安心头猛遭一击，他立马醒悟，意识到现场管理存在重大漏洞和隐患。立整立改，从建立完善管理制度入手，要求团队把每一件设备都实行编号管理，把每一个蝶阀都标明使用次数，还将林鸣提出的"一丝不苟，不让隐患出坞门"的质量要求制作成标语，悬挂在基地的最显眼处。
-
-"标语就是警示牌，每天一上班就会看见它，时刻提醒我们工作质量要做到100%，绝不能存侥幸之心！"
-
-打这以后，管延安对徒弟们强调最多的事就是"再检查一遍"，啰唆最多的话就是"反复检查"。
-
-"强迫症"的称呼，是管延安的徒弟马士祥第一个叫出来的。他还讲述了他们"管师傅"的几则趣事------
-
-在别人眼里，机器无非是冷冰冰的钢铁，但在管师傅眼里，那都是他的"伙伴"，它们有自己的"脾气"和"秉性"。比如，有一次"津安3"轮的机舱1号主发电机启动不了，操作人员慌了手脚，电话打给了管师傅。"走，小马。"管师傅叫着马士祥赶到机舱，只见他先围着发电机转了几圈，然后查看启动马达、燃油泵，最后打开了启动控制箱。管师傅让大家凑近来看，原来是控制箱内有一根线路被震掉了......
-
-大家都赞叹管师傅"水平高"。管师傅却说："多动手动脑，你们也照样行！"
-
-在沉管安装前的二次舾装作业中，最要紧的就是线路安装和铺设。每条沉管有100多条主线、1000多条支线，沉管的精确对接就靠这些管线的传输与控制。其中，照明线路是两路并联，接线头处要用绝缘胶带包扎。有的工友认为简单绕几圈就行，但是管师傅不干，他亲自拿着线头，手把手地作示范，说："缠绕胶带也是有规律的，马虎不得。"
-
-拧螺丝，一般人认为是"小儿科"。但是，深海沉管对接要做到不渗水、不漏水，接缝的间隙必须小于1毫米。如此小的间隙无法用肉眼判断，只能凭借"手感"来操作。为了培养这一看不见摸不着的"手感"，管师傅经常把蝶阀反复拆、反复装。久而久之，管师傅还练就了一门"听感"绝技------通过敲击阀门，从金属碰撞的声音中鉴别接缝间隙的合格与否。
-
-这，活脱脱的就是将99％提高到99.99％的工匠精神！
-
-管延安常对徒弟们讲，"要把复杂的事情简单做，简单的事情重复做，重复的事情用心做。"
-
-"清零"过往，再出发
-
-"钳工，就是一颗行走的'螺丝钉'，哪里有需要，就往哪里拧！"管延安说，这不仅是个人的"自律"，更是整个团队多年磨炼锤打出的"铁律"。
-
-告别港珠澳大桥，管延安和他的团队随即投身大连湾海底隧道这一新的"超级工程"建设，参与到"老战友"------"津平1"轮、"津安2"轮、"津安3"轮三艘港珠澳功勋船的升级改造中。
-
-"这里冬天温度低，船舶运行困难重重。"严寒的气候束缚住了船舶在大连湾海底隧道施工过程中的脚步，管延安介绍，为尽快对三位"老战友"进行改造升级，在冬天来临前，需要迅速制订每一艘船舶的"保暖计划"。他跟工友们吃住在船上，在昼夜不停的海浪摇曳中，实施吊运、紧固、安装，给每一艘船舶加装了大功率热水锅炉，给所有的住舱和机舱加装了保温结构，甚至对甲板外露的部分管系都加装了电加热和保温结构。
-
-"困难是用来克服的，没有困难要我们干什么！"这句话成了管延安的新口头禅。
-
-在大连湾海底隧道，安装压载水泵及管系依旧是一次舾装施工的关键工序。管节里作业空间极其狭小，大型作业工具根本无法进入，面对长达180米的曲折管系，管延安和团队将港珠澳大桥"零缝隙"的标准"移植"到大连湾。每根水管重达600斤，最狭窄的区域宽度仅为4.4米，他们只能靠着小推车，一步步、一寸寸地拼接；在密闭的空间里，一次次进行压载水泵检修和水密试验，一再重复着松螺丝、拧螺丝的机械动作。
-
-2023年5月1日，大连湾海底隧道和光明路延伸工程正式通车运营。
-
-2024年6月16日，世界上综合建设难度最高的跨海集群工程之一深中通道也通过交工验收。该项目集"桥、岛、隧、水下互通"于一体，历经7年筹备、7年建设，粤港澳大湾区"A"形交通主骨架画上关键"一横"。这是管延安和他的团队参与过的又一大国工程。
-
-......
-
-新的坐标，在脚下延伸。在管延安的"事业线"上，昨天的荣耀已全部"归零"，今天之后的"每一次"，都将是"第一次"。（丁秀胤）
-
-责任编辑：尹文卓
-"""
-    stories.append({'name': '管延安', 'content': guan_yanan_content})
-    
-    # 6. 张冬伟部分
-    zhang_dongwei_content = """
-张冬伟
-
-张冬伟：用焊枪书写"中国荣耀"
-
-2018-04-3013:24:57
-
-全国技术能手、沪东中华造船公司技术工人张冬伟。资料照片
-
-　　"三百六十行，行行出状元"。只要有对职业的爱心和恒心，在平凡的岗位上，也一样可以迸发出别样的美。被称为"国宝级技术工人"的沪东中华造船（集团）有限公司的张冬伟就用手中的焊枪书写出人生的华章。
-
-　　把薄如纸的一张张殷瓦钢，焊接得天衣无缝，是世界焊接领域的一个技术高峰，也是许多电焊工梦想攀登却又无法如愿以偿掌握的技能。"80后"技校毕业生张冬伟工作仅十多年，就攀上了这个高峰，在钢板上"绣"出了一朵朵漂亮的"花"。
-
-　　"我就不相信不能降服你！"
-
-　　2001年，张冬伟从技校毕业进入了沪东中华造船公司。此时，公司正在全力以赴准备建造LNG船。LNG船也就是大家熟知的液化天然气船，它装载和运输的是零下163℃的液化天然气，是国际上公认的高技术、高难度、高附加值的"三高"船舶，与豪华游轮一起被誉为"造船工业皇冠上的明珠"。
-
-　　其中最重要的核心部件的焊接------液货围护系统的氩弧焊焊接，一般焊接工无法胜任，必须经过特殊训练，千锤百炼，才有可能作业------液货围护系统的殷瓦钢，薄得像一张纸，一滴汗水滴上去，钢板就会被锈蚀。只要操作稍微不当，一张进口的殷瓦钢就会成为废品，一公斤殷瓦钢要十几欧元。一艘LNG船殷瓦钢消耗量，折合人民币五六千万元。
-
-　　当知道要成为建造LNG船的电焊工，自己在技校学的技术不够用，必须从头开始学时，张冬伟很沮丧，同时又很欣喜，因为遇到了名师------焊接专家、全国技术能手和央企劳动模范秦毅。
-
-　　"你不用怕，但必须好好学，好好吃苦头，练就在钢板上能够像'绣花'那样的本领，就可以成为建造LNG船的电焊工。"师傅秦毅这样告诉他。果然在一次集训中，他吃到了苦头，但这种苦头是他没有想到的，每天需要在钢板上连续练习七八个小时，甚至更长时间。骨子里不服输的他誓言："我就不相信不能降服你！"
-
-　　张冬伟悟性好，憋着一股劲、咬着牙，拼命学，流了比别人多的汗，因此进步也一天比一天快。为了尽快掌握LNG船焊接技术，张冬伟跟在师傅身边仔细观察，学习他的每一个焊接手势，连最小的细节都不放过，有时一看就是几个小时。公司当时选出的16名焊接骨干中，张冬伟是进厂时间最短的，但就是凭着一股不服输的韧劲，顺利考取中国LNG船殷瓦焊接G证证书。
-
-　　国外专家向他伸出大拇指
-
-　　回想十几年前承接LNG船建造，对沪东中华其实是一个巨大考验，国内没有先例可循，国外又实行技术封锁。要想造好这艘"国之重器"，"殷瓦焊接"技术必须首先拿下。
-
-　　张冬伟回忆，当时自己考取G证成为合格的殷瓦焊工时，见多识广的LNG船船东并不相信一个毛头小伙子，能够承担这样的焊接重任。张冬伟没有丝毫胆怯，信心满满开始了焊接。"咝咝咝"的焊接声中，焊缝一寸寸在延长。船东代表不放心，让他停下来，用专用设备仔细检查了几次，再让他焊几十米试试。围着他的国外专家在掂量着他的技能是否真的精湛，专用检测设备数据表明，质量完全符合标准。船东露出了满意的笑容，伸出了大拇指。
-
-　　短短几米长的焊缝，需要焊接五六个小时，而任何一个针眼大小的漏点，都会导致液化天然气从船舱泄漏，严重的话，就会造成船毁人亡的灾难，直接经济损失起码十多个亿。殷瓦钢焊接对工人的技能要求几近苛刻，尤其对焊接工人的耐心和责任心是一个极大考验。
-
-　　一条LNG船，殷瓦焊接总长达140公里，虽然90%是自动焊，但还有14公里特殊位置的焊缝，需要焊工手工完成，沪东中华LNG建造团队曾经创造了一项纪录，在一个大舱完成焊接工作后，经第三方密性检测为0漏点，这一纪录即便欧美、日韩那些曾经建造过LNG船的船厂也没能达到，这是中国船舶工业的荣耀。
-
-　　书写"大洋上的中国荣耀"
-
-　　很多人都想成为张冬伟的徒弟。教徒弟不是省力的事，又没有什么好处，他可以婉拒或者应付。然而，张冬伟却这样说：造船可以兴国，而且中国要成为世界造船舞台上的强者，就必须要储备更多高技能人才，自己就必须要担当起这个责任。张冬伟在入党申请书中也写下了这样的话："要为中国船舶工业的发展竭尽全力。我不能口是心非，只做个喊喊口号的人，要用实实在在的行动兑现承诺。"
-
-　　如今，张冬伟身边有40余人获得了殷瓦G证等手工焊证书和氩弧焊等自动焊证书，30余人成了多种焊接类型的复合型殷瓦焊工。他们都是经过张冬伟培训或者手把手教出来的，现在都是中国建造LNG船的技术骨干。
-
-　　做焊工不容易，做一名好焊工，更不容易。穿着厚重的工作服，整日和滚烫的钢板、烟尘打交道，尤其在炎炎夏日，光着膀子都嫌热，电焊工却要捂着厚厚的帆布工作服，在船舱里伴着铁水"战高温"，干完一批活下来时，衣服往往全被汗水浸透。可张冬伟觉得如果能把"花""绣"得漂亮，那就是其乐无穷的。
-
-　　如今，沪东中华已成功建造了十多艘LNG船，书写了"大洋上的中国荣耀"，创造了多个中国第一和世界第一。
-
-　　全国技术能手、中央企业技术能手、全国职业道德建设标兵个人、全国五一劳动奖章......面对荣誉、掌声和鲜花，张冬伟一次次告诫自己，千万不要骄傲。"一个人如果能够做到几万米、几十万米殷瓦钢焊接没有一个漏点，才是神工妙力，才是铮铮的英雄，才能说为中国船舶工业建造水平的提高再立新功。这就是我的新目标。"张冬伟坚定地说。（本报记者　刘锟）
-
-来源：解放日报编辑：刘思琦
-"""
-    stories.append({'name': '张冬伟', 'content': zhang_dongwei_content})
+    corpus = corpus if corpus is not None else load_corpus()
+    for name in target_names:
+        # 只记文章在语料库中的偏移，正文用 story.text 按需解码
+        stories.append(doc_record(corpus, f'工匠故事/基建工程/{name}'))
     
     print(f"✓ 直接创建了 {len(stories)} 个基建人物")
     return stories
 
-# 3. 提取函数（调用硬编码的内容）
+# 3. 提取函数（调用语料库中的人物文章）
 def extract_stories(text):
     return extract_stories_from_content()
 
-# 4. 基建领域5大情感维度分数计算（优化得分逻辑，提升整体分数）
-def calculate_dimension_scores(text):
-    # 维度1：精度要求（基建核心，如毫米级误差、密封）
-    precision_kw = ['精度', '误差', '毫米', '0.5毫米', '0.25毫米', '无渗漏', '密封', '吻合误差', '厘米级', '零漏点', '精确对接']
-    precision_count = sum(text.count(kw) for kw in precision_kw)
-    # 优化系数：提高基础权重，降低文本长度稀释效应
-    precision_score = min(precision_count / (len(text)/3000 + 1) * 1.2, 0.98)
-
-    # 维度2：工程难度（基建环境挑战，如高温高压、深海）
-    difficulty_kw = ['高温', '高压', '高辐射', '高空', '深海', '狭小空间', '梅雨季节', '高难度', '严峻考验', '零下163℃', '复杂', '曲折']
-    difficulty_count = sum(text.count(kw) for kw in difficulty_kw)
-    difficulty_score = min(difficulty_count / (len(text)/2500 + 1) * 1.1, 0.98)
+def load_stories(corpus):
+    """五行业统一分析入口用：共用已加载的语料库"""
+    return extract_stories_from_content(corpus)
 
-    # 维度3：坚守付出（工匠投入，如长期钻研、极端作业）
-    dedication_kw = ['坚持', '日夜', '汗水', '苦练', '钻研', '十几年', '七年', '270多天', '通宵', '吃住厂', '二十多年', '十年', '反复', '耐心']
-    dedication_count = sum(text.count(kw) for kw in dedication_kw)
-    dedication_score = min(dedication_count / (len(text)/2000 + 1) * 1.2, 0.98)
+# 4. 基建领域5大情感维度分数计算（优化得分逻辑，提升整体分数；N 篇文本一次算出 N×5 矩阵）
+def story_hits(stories, corpus=None):
+    """故事 × 五个维度 的命中前缀和：给了 corpus 时取自融合命中表，否则扫描各篇正文"""
+    return story_density(stories, *KEYWORD_GROUPS.values(), corpus=corpus)
 
-    # 维度4：创新突破（基建技术革新，如数字化装配）
-    innovation_kw = ['数字化', '自主研发', '创新', '突破', '零的突破', '核心技术', '革命性变革', '新方法', '自主制造', '技术封锁', '独创']
-    innovation_count = sum(text.count(kw) for kw in innovation_kw)
-    innovation_score = min(innovation_count / (len(text)/2800 + 1) * 1.1, 0.98)
+def score_stories(density, with_hits=False):
+    counts = density.totals()
+    text_len = (density.spans[:, 1] - density.spans[:, 0]).astype(np.float64)[:, None]
 
-    # 维度5：社会价值（基建国家意义，如大国重器、世界之最）
-    value_kw = ['国家', '世界之最', '大国重器', '重大任务', '自主制造', '里程碑', '清洁能源', '交通骨架', '中国荣耀', '超级工程', '世界第一']
-    value_count = sum(text.count(kw) for kw in value_kw)
-    value_score = min(value_count / (len(text)/2200 + 1) * 1.2, 0.98)
+    # 优化系数：提高基础权重，降低文本长度稀释效应（列依次为 精度、难度、坚守、创新、价值）
+    spans = np.array([3000, 2500, 2000, 2800, 2200])
+    weights = np.array([1.2, 1.1, 1.2, 1.1, 1.2])
+    scores = np.minimum(counts / (text_len / spans + 1) * weights, 0.98)
 
     # 确保分数在0.2-0.98（提升最低分，避免过低）
-    scores = [precision_score, difficulty_score, dedication_score, innovation_score, value_score]
-    return [min(max(s, 0.2), 0.98) for s in scores]
+    scores = np.clip(scores, 0.2, 0.98)
+    return (scores, counts) if with_hits else scores
+
+
+def calculate_dimension_scores(text):
+    return score_stories(story_hits([StoryRecord.from_text(None, text)]))[0].tolist()
 
 # 5. 绘制雷达图（修复图例重叠，优化布局）
-def create_radar_chart(stories):
+def create_radar_chart(stories, scores=None):
     if not stories:
         print("无数据生成雷达图")
         return
@@ -569,7 +76,7 @@ def create_radar_chart(stories):
     print(f"为 {total_persons} 个基建人物生成雷达图...")
     
     # 雷达图基础配置
-    dimensions = ['精度要求', '工程难度', '坚守付出', '创新突破', '社会价值']  # 基建5维度
+    dimensions = DIMENSIONS
     n_dim = len(dimensions)
     angles = np.linspace(0, 2*np.pi, n_dim, endpoint=False).tolist()
     angles += angles[:1]  # 闭合图形
@@ -583,14 +90,19 @@ def create_radar_chart(stories):
     # 创建画布（加宽左侧间距，避免图例重叠）
     fig = plt.figure(figsize=(20, 10))
 
+    # 所有人物一次打分（已传入时直接复用）
+    if scores is None:
+        scores = score_stories(story_hits(stories))
+    all_scores = scores
+
     # 子图1：所有人物对比（左侧，增加宽度占比）
     ax1 = fig.add_subplot(121, polar=True)
     for i, story in enumerate(stories):  # 遍历所有人物，无数量限制
-        name = story['name']
-        scores = calculate_dimension_scores(story['content'])
-        scores_closed = scores + scores[:1]
+        name = story.name
+        person_scores = all_scores[i].tolist()
+        scores_closed = person_scores + person_scores[:1]
         
-        print(f"  {name} 的情感维度分数: {[round(s, 3) for s in scores]}")
+        print(f"  {name} 的情感维度分数: {[round(s, 3) for s in person_scores]}")
         
         # 绘制线条（加粗防重叠）+ 填充（低透明度防遮挡）
         color = colors[i % len(colors)]
@@ -616,7 +128,6 @@ def create_radar_chart(stories):
 
     # 子图2：平均维度分析（右侧，调整位置）
     ax2 = fig.add_subplot(122, polar=True)
-    all_scores = [calculate_dimension_scores(s['content']) for s in stories]
     avg_scores = np.mean(all_scores, axis=0)
     std_scores = np.std(all_scores, axis=0)
     
@@ -663,15 +174,19 @@ def analyze_sentiment_simple(text):
     positive_words = ['成功', '突破', '精准', '零漏点', '自主', '创新', '荣誉', '大国重器', '荣耀', '奇迹', '精湛', '英雄']
     negative_words = ['困难', '风险', '泄漏', '高温', '高压', '狭小', '复杂', '挑战', '严峻', '失败']
     
-    text_lower = text.lower()
-    pos_count = sum(text_lower.count(word.lower()) for word in positive_words)
-    neg_count = sum(text_lower.count(word.lower()) for word in negative_words)
+    pos_count, neg_count = count_groups(text, positive_words, negative_words, ignore_case=True)
     
     score = pos_count/(pos_count+neg_count) if (pos_count+neg_count) > 0 else 0.5
     return score, pos_count, neg_count
 
 # 7. 主程序（一键执行）
 def main():
+    os.chdir('E:\\')  # 工作目录（文档需放此路径）
+    print("=" * 60)
+    print("基建工程领域情感分析系统")
+    print("工作目录:", os.getcwd())
+    print("=" * 60)
+    
     # 检查文档是否存在
     file_path = 'E:\\基建工程.docx'
     if not os.path.exists(file_path):
@@ -681,21 +196,21 @@ def main():
     # 读取文档
     content = ""
     if os.path.exists(file_path):
-        from docx import Document
+        from 文档读取 import read_paragraphs
         try:
-            doc = Document(file_path)
-            content = '\n'.join([para.text.strip() for para in doc.paragraphs if para.text.strip()])
+            content = '\n'.join([para.strip() for para in read_paragraphs(file_path)])
             if len(content) > 500:
                 print(f"✓ 文档读取成功（字符数：{len(content):,}）")
         except:
             print("⚠ 读取文档失败，使用内置数据")
     
     # 提取所有人物（硬编码方式，确保全部6个人物）
-    stories = extract_stories(content)
+    corpus = load_corpus()
+    stories = load_stories(corpus)
     
     print(f"\n✓ 成功提取到 {len(stories)} 个基建人物：")
     for i, s in enumerate(stories, 1):
-        print(f"  {i}. {s['name']}（内容长度：{len(s['content'])} 字符）")
+        print(f"  {i}. {s.name}（内容长度：{len(s.text)} 字符）")
     
     # 情感分析+保存结果
     results = []
@@ -703,13 +218,13 @@ def main():
     print("情感分析结果：")
     print("-" * 50)
     for s in stories:
-        score, pos, neg = analyze_sentiment_simple(s['content'])
+        score, pos, neg = analyze_sentiment_simple(s.text)
         sentiment = '积极' if score > 0.6 else '消极' if score < 0.4 else '中性'
         results.append({
-            '人物': s['name'], '情感倾向': sentiment, '情感分数': round(score, 3),
+            '人物': s.name, '情感倾向': sentiment, '情感分数': round(score, 3),
             '积极关键词数': pos, '消极关键词数': neg
         })
-        print(f"  {s['name']:8s} | 情感：{sentiment:4s} | 分数：{score:.3f} | 积极词：{pos:2d} | 消极词：{neg:2d}")
+        print(f"  {s.name:8s} | 情感：{sentiment:4s} | 分数：{score:.3f} | 积极词：{pos:2d} | 消极词：{neg:2d}")
     
     # 保存CSV
     df = pd.DataFrame(results)
@@ -719,7 +234,7 @@ def main():
     
     # 生成雷达图（核心步骤）
     print("\n" + "=" * 60)
-    create_radar_chart(stories)
+    create_radar_chart(stories, score_stories(story_hits(stories, corpus)))
     print("=" * 60)
     print("🎉 基建工程情感分析完成！")
 
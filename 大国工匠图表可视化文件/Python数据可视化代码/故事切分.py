@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+按工匠姓名切分事迹合集（各情感分析脚本的 extract_stories 共用）
+原先每一行都把名单从头到尾试一遍 startswith / in，名单越长越慢；
+这里把名单编译进同一个关键词自动机（关键词匹配.KeywordMatcher），整篇文本扫描一遍，
+把每次姓名命中按起点归到所在行，只有含姓名的行才交给脚本自己的标题判定。
+切分结果是行的字符区间 + 标题行号，可换算成语料库里的 UTF-8 字节偏移；
+故事正文由脚本按行取出后用 join 一次拼好，不再逐行 += 字符串。
+名单换成 大国工匠名单采集.xlsx 的全部姓名（分词.craftsman_names()）也只是自动机多几个分支。
+语料库中的文档切分一次后，姓名 → [(文档, 字节区间…)] 保存为 .corpus/stories-<版本>.json，
+之后各脚本按姓名直接从 mmap 取故事（StoryRecord），不再重新切分、也不在字典里搬运整段正文。
+用法：
+    from 故事切分 import segment_stories, load_story_index
+    seg = segment_stories(text, KNOWN_CRAFTSMEN, is_heading)   # is_heading(行, 姓名) -> bool
+    for name, first, end in seg.stories():
+        content = '\n'.join(seg.lines(first, end))
+    seg.byte_spans(base)     # [(姓名, 起, 止)]，base 为 text 在语料文件中的字节起点
+
+    source = ParagraphSource(corpus, "能源电力")      # source.text 为段落拼接全文
+    story = source.record("陈永伟", [(起, 止), ...])   # 字符区间 → 语料字节区间的 StoryRecord
+
+    index = load_story_index(corpus, "工匠故事/航天军工/事迹合集", KNOWN_CRAFTSMEN, is_heading)
+    story = index.get("高凤林")          # StoryRecord：story.text 解码正文，story.view() 零拷贝
+依赖：numpy
+"""
+import os
+import json
+import hashlib
+import inspect
+from bisect import bisect_right
+from functools import lru_cache
+import numpy as np
+from 语料库 import CORPUS_DIR, _char_to_byte
+from 关键词匹配 import keyword_matcher
+
+STORY_INDEX_VERSION = 1   # 索引格式或切分逻辑改动时 +1，旧索引失效
+
+
+# ---------- 1. 切分结果 ----------
+class Segmentation:
+    """
+    line_spans  非空行（去掉首尾空白后）在 text 中的字符区间，对应 text.split('\\n') 里的非空行
+    heads       [(行号, 工匠名)]，行号指 line_spans 的下标，按先后排列
+    每个标题行的故事一直延续到下一个标题行之前；第一个标题行之前的内容不属于任何人。
+    """
+
+    def __init__(self, text, line_spans, heads):
+        self.text = text
+        self.line_spans = line_spans
+        self.heads = heads
+
+    def line(self, i):
+        start, end = self.line_spans[i]
+        return self.text[start:end]
+
+    def lines(self, first, end):
+        text = self.text
+        return [text[s:e] for s, e in self.line_spans[first:end]]
+
+    def stories(self):
+        """按先后产出 (工匠名, 标题行号, 结束行号)，行号区间左闭右开"""
+        n = len(self.heads)
+        for k, (first, name) in enumerate(self.heads):
+            end = self.heads[k + 1][0] if k + 1 < n else len(self.line_spans)
+            yield name, first, end
+
+    def spans(self):
+        """[(工匠名, 起, 止)]：各故事在 text 中的字符区间（标题行起点到最后一行末尾）"""
+        return [(name, self.line_spans[first][0], self.line_spans[end - 1][1])
+                for name, first, end in self.stories()]
+
+    def byte_spans(self, base=0):
+        """同 spans，换算成 UTF-8 字节偏移；base 为 text 在语料文件中的起点（corpus.doc_spans）"""
+        c2b = _char_to_byte(self.text)
+        return [(name, int(base + c2b[s]), int(base + c2b[e])) for name, s, e in self.spans()]
+
+
+# ---------- 2. 切分 ----------
+class StorySegmenter:
+    """工匠名单 → 姓名自动机；segment 一次扫描找出所有候选标题行"""
+
+    def __init__(self, names):
+        self.matcher = keyword_matcher(tuple(names))
+        self.names = self.matcher.keywords   # 已去重、去空，序号与自动机一致
+
+    def segment(self, text, is_heading):
+        """
+        is_heading(行, 姓名) 决定含该姓名的行是否开始一个新故事；
+        一行含多个姓名时按名单顺序取第一个判定成立的（与逐个 next(...) 的口径一致）。
+        """
+        line_spans, pos = [], 0
+        for raw in text.split("\n"):
+            stripped = raw.strip()
+            if stripped:
+                start = pos + len(raw) - len(raw.lstrip())
+                line_spans.append((start, start + len(stripped)))
+            pos += len(raw) + 1
+        starts = [s for s, _ in line_spans]
+
+        # 姓名命中 → 所在行（命中必须整个落在去掉空白后的行内）
+        candidates = {}
+        lengths = [len(n) for n in self.names]
+        for hit, i in self.matcher.iter_hits(text):
+            k = bisect_right(starts, hit) - 1
+            if k >= 0 and hit + lengths[i] <= line_spans[k][1]:
+                candidates.setdefault(k, set()).add(i)
+
+        heads = []
+        for k in sorted(candidates):
+            line = text[line_spans[k][0]:line_spans[k][1]]
+            name = next((self.names[i] for i in sorted(candidates[k]) if is_heading(line, self.names[i])), None)
+            if name is not None:
+                heads.append((k, name))
+        return Segmentation(text, line_spans, heads)
+
+
+@lru_cache(maxsize=None)
+def story_segmenter(names):
+    """同一份名单（tuple）只编译一次"""
+    return StorySegmenter(names)
+
+
+def segment_stories(text, names, is_heading):
+    return story_segmenter(tuple(names)).segment(text, is_heading)
+
+
+# ---------- 3. 故事记录 ----------
+class StoryRecord:
+    """
+    一位工匠的一段故事：只记偏移，不持有正文
+    buf    语料 mmap（corpus.buf）或一段 UTF-8 字节串
+    spans  [(起, 止)] 字节区间，正文为各区间解码后以 sep 连接
+    head   标题行清洗后的文字（如去掉姓名、冒号），放在正文最前；没有则为 None
+    """
+    __slots__ = ("name", "doc", "spans", "head", "sep", "buf")
+
+    def __init__(self, name, buf, spans, doc=None, head=None, sep="\n"):
+        self.name = name
+        self.doc = doc
+        self.spans = spans
+        self.head = head
+        self.sep = sep
+        self.buf = buf
+
+    @classmethod
+    def from_text(cls, name, text, doc=None):
+        """内存中的一段文字（非语料库来源）包装成记录"""
+        data = text.encode("utf-8")
+        return cls(name, data, [(0, len(data))], doc)
+
+    def view(self):
+        """故事覆盖的整段原始字节（第一个区间起点到最后一个区间终点）的零拷贝视图"""
+        if not self.spans:
+            return memoryview(b"")
+        return memoryview(self.buf)[self.spans[0][0]:self.spans[-1][1]]
+
+    def views(self):
+        mv = memoryview(self.buf)
+        return [mv[s:e] for s, e in self.spans]
+
+    @property
+    def text(self):
+        """正文（每次调用时从 buf 解码，不缓存）"""
+        buf = self.buf
+        pieces = [] if self.head is None else [self.head]
+        pieces.extend(buf[s:e].decode("utf-8") for s, e in self.spans)
+        return self.sep.join(pieces)
+
+    def __repr__(self):
+        return f"StoryRecord({self.name!r}, doc={self.doc!r}, spans={len(self.spans)})"
+
+
+class TextSource:
+    """不在语料库里的文字（如直接读取的 docx 全文）：只编码一次，按字符区间生成记录"""
+    doc = None
+
+    def __init__(self, text):
+        self.text = text
+        self.buf = text.encode("utf-8")
+        self._c2b = _char_to_byte(text)
+
+    def byte_spans(self, char_spans):
+        c2b = self._c2b
+        return [(int(c2b[s]), int(c2b[e])) for s, e in char_spans]
+
+    def record(self, name, char_spans, sep="\n"):
+        return StoryRecord(name, self.buf, self.byte_spans(char_spans), self.doc, sep=sep)
+
+
+class ParagraphSource(TextSource):
+    """
+    语料中一篇 docx 的段落去掉首尾空白、按 keep 筛选后以换行拼接（各脚本 join_paragraphs 的口径）
+    text 仍是拼接后的全文，脚本照旧按字符切分；record 把字符区间换回语料文件中的字节区间，
+    故事记录直接指向 corpus.buf，与融合命中表等其他语料视图同一坐标。
+    拼接出的换行不在语料里，跨行的区间按行拆开，正文各段以 record 的 sep 连接。
+    """
+
+    def __init__(self, corpus, doc, keep=bool):
+        lines, byte_starts = [], []
+        for (start, _), para in zip(corpus.doc_paragraph_spans(doc).tolist(), corpus.paragraphs(doc)):
+            line = para.strip()
+            if keep(line):
+                lines.append(line)
+                byte_starts.append(start + len(para.encode("utf-8")) - len(para.lstrip().encode("utf-8")))
+        self.text = "\n".join(lines)
+        self.buf = corpus.buf
+        self.doc = doc
+        lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+        self._line_starts = np.cumsum(lengths + 1) - (lengths + 1)
+        self._line_ends = self._line_starts + lengths
+        self._c2b = _char_to_byte(self.text)
+        # 第 k 行内字符 c 的语料字节偏移 = c2b[c] + shift[k]
+        self._shift = np.asarray(byte_starts, dtype=np.int64) - self._c2b[self._line_starts]
+
+    def byte_spans(self, char_spans):
+        c2b, starts, ends, shift = self._c2b, self._line_starts, self._line_ends, self._shift
+        out = []
+        for s, e in char_spans:
+            first = max(int(np.searchsorted(starts, s, side="right")) - 1, 0)
+            last = int(np.searchsorted(starts, e, side="right")) - 1
+            for k in range(first, last + 1):
+                a, b = max(s, starts[k]), min(e, ends[k])
+                if a < b:
+                    out.append((int(c2b[a] + shift[k]), int(c2b[b] + shift[k])))
+        return out
+
+
+def strip_spans(text, start, end, removed=()):
+    """
+    text[start:end] 删去 removed 中各串的全部出现、再去掉首尾空白后剩下的字符区间
+    （标题行「姓名：正文」清洗成正文开头时用；各区间依次连起来即 replace(...).strip() 的结果）
+    """
+    segment = text[start:end]
+    cut = [False] * len(segment)
+    for word in removed:
+        i = segment.find(word)
+        while word and i >= 0:
+            cut[i:i + len(word)] = [True] * len(word)
+            i = segment.find(word, i + len(word))
+    kept = [i for i, c in enumerate(cut) if not c]
+    while kept and segment[kept[0]].isspace():
+        kept.pop(0)
+    while kept and segment[kept[-1]].isspace():
+        kept.pop()
+    runs = []
+    for i in kept:
+        if runs and runs[-1][1] == start + i:
+            runs[-1][1] += 1
+        else:
+            runs.append([start + i, start + i + 1])
+    return [tuple(r) for r in runs]
+
+
+def doc_record(corpus, doc, name=None):
+    """整篇语料文档作为一段故事（如 工匠故事/<行业>/<工匠>.txt）"""
+    start, end = corpus.doc_spans[corpus.doc_id(doc)].tolist()
+    return StoryRecord(name or doc.rsplit("/", 1)[-1], corpus.buf, [(start, end)], doc)
+
+
+# ---------- 4. 持久化的姓名 → 故事区间索引 ----------
+class StoryIndex:
+    """按出现顺序排列的故事记录；同一工匠可能有多段"""
+
+    def __init__(self, records):
+        self.records = records
+        self._by_name = {}
+        for rec in records:
+            self._by_name.setdefault(rec.name, []).append(rec)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def names(self):
+        return list(self._by_name)
+
+    def lookup(self, name):
+        """某工匠的全部故事段（按出现顺序）"""
+        return self._by_name.get(name, [])
+
+    def get(self, name, default=None):
+        """某工匠的第一段故事"""
+        found = self._by_name.get(name)
+        return found[0] if found else default
+
+
+def _source_of(func):
+    if func is None:
+        return ""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return repr(func)
+
+
+def _story_index_path(corpus, doc, names, funcs, out_dir):
+    key = "\n".join([str(STORY_INDEX_VERSION), *corpus.sources, "|", doc, *names, "|",
+                     *map(_source_of, funcs)])
+    return os.path.join(out_dir, f"stories-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.json")
+
+
+def build_story_index(corpus, doc, names, is_heading, head=None, skip=None):
+    """
+    切分语料中的一篇文档 → StoryIndex
+    head(标题行, 姓名)  标题行清洗成正文开头（默认标题行原样作为第一段）
+    skip(行)           为真的行不计入正文（如「来源：」「编辑：」）
+    """
+    text = corpus.doc_text(doc)
+    base = int(corpus.doc_spans[corpus.doc_id(doc)][0])
+    seg = segment_stories(text, names, is_heading)
+    c2b = _char_to_byte(text) + base
+    records = []
+    for name, first, end in seg.stories():
+        first_body = first if head is None else first + 1
+        spans = [(int(c2b[s]), int(c2b[e])) for s, e in seg.line_spans[first_body:end]
+                 if skip is None or not skip(text[s:e])]
+        records.append(StoryRecord(name, corpus.buf, spans, doc,
+                                   None if head is None else head(seg.line(first), name)))
+    return StoryIndex(records)
+
+
+def load_story_index(corpus, doc, names, is_heading, head=None, skip=None, out_dir=CORPUS_DIR):
+    """取故事索引：语料、名单、判定函数都没变时直接读 .corpus/ 下的索引，不再切分"""
+    names = list(names)
+    path = _story_index_path(corpus, doc, names, (is_heading, head, skip), out_dir)
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+            return StoryIndex([StoryRecord(name, corpus.buf, [tuple(sp) for sp in spans], doc, head_text)
+                               for name, spans, head_text in entries])
+        except (OSError, ValueError, TypeError):
+            pass   # 索引损坏时重建
+    index = build_story_index(corpus, doc, names, is_heading, head, skip)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump([[r.name, r.spans, r.head] for r in index], f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+    return index
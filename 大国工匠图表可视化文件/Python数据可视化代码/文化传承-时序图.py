@@ -2,37 +2,22 @@
 """
 《文化传承》六维情感时序图（纯 CPU + 中文无乱码）
 """
-import re
-import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
-from docx import Document
+from 语料库 import load_corpus
+from 融合分析 import load_fused
+from 词典 import TIMELINE_LEX
 
 # ---------- 1. 针对「文化传承」的 6 维词典 ----------
-LEX = {
-    "坚守":   "坚守|传承|坚持|执着|耐得住寂寞|30年如一日|磨性情",
-    "匠心":   "匠心|精益求精|零差错|毫厘|完美|一丝不苟|妙手回春",
-    "敬畏":   "敬畏|敬畏心|小心翼翼|如履薄冰|文物为生命|不能断",
-    "自豪":   "自豪|骄傲|国宝|皇冠明珠|中华文化|民族|传世",
-    "感动":   "感动|泪目|暖心|触动|震撼|情不自禁",
-    "创新":   "创新|突破|失传|复活|复制|复原|模拟考古"
-}
+LEX = TIMELINE_LEX["文化传承"]   # 词典统一写在 词典.py，与其他图表一起登记
 
 # ---------- 2. 工具函数 ----------
-def read_docx(path):
-    doc = Document(path)
-    return [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-
-def sent_cut(text):
-    return [s.strip() for s in re.split(r'[。！？；]', text) if s.strip()]
-
-def lexicon_score(sentence):
-    scores = []
-    for dim, pattern in LEX.items():
-        hits = len(re.findall(pattern, sentence))
-        scores.append(min(hits / 3, 1.0))
-    return scores
+def lexicon_matrix(corpus):
+    """小句 × 六维 的 float32 得分矩阵：计数取自全语料命中表（融合分析），不再逐句扫描"""
+    hits = load_fused(corpus).alternation_counts("文化传承", LEX.values())
+    return np.minimum(hits.astype(np.float32) / 3, 1.0)
 
 # ---------- 3. 画图（中文无乱码） ----------
 def plot_timeline(df):
@@ -58,18 +43,15 @@ def plot_timeline(df):
 
 # ---------- 4. 主流程 ----------
 def main():
-    if not os.path.exists("文化传承.docx"):
-        print("❌ 请将「文化传承.docx」放在当前目录再运行！")
+    corpus = load_corpus()
+    if "文化传承" not in corpus:
+        print("❌ 请将「文化传承.docx」放在 原文本数据文件 目录再运行！")
         return
-    paragraphs = read_docx("文化传承.docx")
-    sentences  = []
-    for p in paragraphs:
-        sentences.extend(sent_cut(p))
+    # 按段落切成小句（[。！？；]），直接从 mmap 语料按偏移取出
+    sentences  = list(corpus.clauses("文化传承"))
     print(f"共切分 {len(sentences)} 句，开始打分...")
-    df = pd.DataFrame(sentences, columns=["sentence"])
-    lex_scores = df["sentence"].apply(lexicon_score)
-    for idx, dim in enumerate(LEX.keys()):
-        df[dim] = [v[idx] for v in lex_scores]
+    df = pd.DataFrame(lexicon_matrix(corpus), columns=list(LEX.keys()))
+    df.insert(0, "sentence", sentences)
     df.to_csv("culture_6d.csv", index=False, encoding="utf-8-sig")
     plot_timeline(df)
     print("✅ 完成！文件：culture_timeline_final.png | culture_6d.csv")
@@ -5,106 +5,82 @@ import matplotlib
 matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 import os
+import zipfile
+import xml.etree.ElementTree as ET
+from 文档读取 import read_paragraphs
+from 关键词匹配 import count_groups
+from 故事切分 import StoryRecord, TextSource, ParagraphSource
+from 融合分析 import story_density
+from 词典 import RADAR_KEYWORDS
 import warnings
 warnings.filterwarnings('ignore')
 
-# 设置工作目录
-os.chdir('E:\\')
-
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-print("=" * 60)
-print("文化传承领域情感分析系统")
-print("工作目录:", os.getcwd())
-print("=" * 60)
+DIMENSIONS = ['积极程度', '坚持程度', '艰辛程度', '责任感', '成就感']
+# 各维度关键词写在 词典.py，与图表词典一起登记；语料里的故事直接从融合命中表计数
+KEYWORD_GROUPS = RADAR_KEYWORDS['文化传承']
+
+def join_paragraphs(paragraphs):
+    """段落去掉首尾空白、跳过空段后以换行拼接"""
+    return '\n'.join(text for text in (para.strip() for para in paragraphs) if text)
 
 def read_docx_file(file_path):
     try:
-        try:
-            from docx import Document
-        except ImportError:
-            print("正在安装python-docx库...")
-            import subprocess
-            import sys
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
-            from docx import Document
-        doc = Document(file_path)
-        full_text = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:
-                full_text.append(text)
-        content = '\n'.join(full_text)
+        content = join_paragraphs(read_paragraphs(file_path))
         print(f"✓ DOCX文件读取成功, 长度: {len(content)} 字符")
         return content
-    except Exception as e:
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        # 不是合法的 docx（或缺少 word/document.xml），交给 main 走测试数据
         print(f"✗ 读取DOCX文件失败: {e}")
-        try:
-            print("尝试二进制读取...")
-            with open(file_path, 'rb') as f:
-                raw_content = f.read()
-            text_content = ""
-            try:
-                text_content = raw_content.decode('utf-8', errors='ignore')
-                import string
-                printable = set(string.printable)
-                text_content = ''.join(filter(lambda x: x in printable, text_content))
-            except:
-                pass
-            if len(text_content) > 100:
-                print(f"✓ 二进制读取成功, 长度: {len(text_content)} 字符")
-                return text_content[:10000]
-        except Exception as e2:
-            print(f"二进制读取也失败: {e2}")
         return ""
 
-def extract_stories_from_text(text):
+def extract_stories_from_text(text, source=None):
+    """
+    故事只记在全文中的区间（StoryRecord），不再截断到 1500 字，正文用 story.text 按需解码
+    source 为 text 的来源（语料库段落用 ParagraphSource，区间直接指向语料文件），默认按 text 本身建 TextSource
+    """
     stories = []
+    source = source if source is not None else TextSource(text)
     pattern = r'\[([^\]]+)\]\{\.mark\}\s*\n*(.+?)(?=\n\s*\[[^\]]+\]\{\.mark\}|\Z)'
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = list(re.finditer(pattern, text, re.DOTALL))
     print(f"正则匹配找到 {len(matches)} 个故事")
-    for name, content in matches:
-        content = content.strip()
-        if len(content) > 30:
-            stories.append({
-                'name': name.strip(),
-                'content': content[:1500]
-            })
+    for m in matches:
+        start, end = m.span(2)
+        content = m.group(2)
+        start += len(content) - len(content.lstrip())
+        end -= len(content) - len(content.rstrip())
+        if end - start > 30:
+            stories.append(source.record(m.group(1).strip(), [(start, end)]))
     if len(stories) < 3:
         print("使用简单方法补充...")
-        lines = text.split('\n')
         current_name = ""
-        current_content = []
-        for line in lines:
-            line = line.strip()
+        current_spans = []
+        
+        def flush():
+            # 各行以空格连接后的长度
+            story_len = sum(e - s for s, e in current_spans) + len(current_spans) - 1
+            if story_len > 30 and not any(s.name == current_name for s in stories):
+                stories.append(source.record(current_name, current_spans, sep=' '))
+        
+        pos = 0
+        for raw in text.split('\n'):
+            line = raw.strip()
+            line_start = pos + len(raw) - len(raw.lstrip())
+            pos += len(raw) + 1
             if line.startswith('[') and ']' in line:
-                if current_name and current_content:
-                    story_text = ' '.join(current_content)
-                    if len(story_text) > 30:
-                        if not any(s['name'] == current_name for s in stories):
-                            stories.append({
-                                'name': current_name,
-                                'content': story_text[:1500]
-                            })
-                try:
-                    current_name = line[1:line.index(']')].strip()
-                    if len(current_name) > 10:
-                        current_name = ""
-                except:
+                if current_name and current_spans:
+                    flush()
+                current_name = line[1:line.index(']')].strip()
+                if len(current_name) > 10:
                     current_name = ""
-                current_content = []
+                current_spans = []
             elif current_name and line and not line.startswith('['):
-                current_content.append(line)
-        if current_name and current_content:
-            story_text = ' '.join(current_content)
-            if len(story_text) > 30:
-                if not any(s['name'] == current_name for s in stories):
-                    stories.append({
-                        'name': current_name,
-                        'content': story_text[:1500]
-                    })
+                current_spans.append((line_start, line_start + len(line)))
+        if current_name and current_spans:
+            flush()
     if len(stories) < 3:
         print("数据不足，添加默认人物...")
         default_stories = [
@@ -120,33 +96,31 @@ def extract_stories_from_text(text):
             {'name': '杨玉芳', 'content': '皮影戏传承人，坚守皮影艺术数十年，面对行业困境不放弃，致力于传播皮影文化，责任感强烈'}
         ]
         for default in default_stories:
-            if not any(s['name'] == default['name'] for s in stories):
-                stories.append(default)
+            if not any(s.name == default['name'] for s in stories):
+                stories.append(StoryRecord.from_text(default['name'], default['content']))
     return stories
 
+def story_hits(stories, corpus=None):
+    """故事 × 五个维度 的命中前缀和：给了 corpus 时取自融合命中表，否则扫描各篇正文"""
+    return story_density(stories, *KEYWORD_GROUPS.values(), corpus=corpus)
+
+def score_stories(density, with_hits=False):
+    """命中前缀和（story_hits）→ N×5 情感维度矩阵（按列向量化归一与截断）；with_hits 时同时返回命中数矩阵"""
+    counts = density.totals()
+    text_len = (density.spans[:, 1] - density.spans[:, 0]).astype(np.float64)[:, None]
+    # 列依次为 积极、坚持、艰辛、责任、成就
+    spans = np.array([500, 400, 450, 350, 425])
+    weights = np.array([1.5, 1.3, 1.2, 1.4, 1.1])
+    scores = np.minimum(counts / np.maximum(text_len / spans, 1) * weights, 0.95)
+    scores = np.clip(scores, 0.5, 0.95)
+    return (scores, counts) if with_hits else scores
+
 def calculate_sentiment_scores(text):
-    positive_keywords = ['自豪', '欣慰', '满足', '成就', '荣誉', '热爱', '喜悦', '骄傲', '敬佩', '成功']
-    positive_count = sum(text.count(word) for word in positive_keywords)
-    positive_score = min(positive_count / max(len(text)/500, 1) * 1.5, 0.95)
-    persist_keywords = ['坚守', '坚持', '执着', '毅力', '数十年', '40年', '苦练', '刻苦', '专注', '恒心']
-    persist_count = sum(text.count(word) for word in persist_keywords)
-    persist_score = min(persist_count / max(len(text)/400, 1) * 1.3, 0.95)
-    hardship_keywords = ['艰辛', '困难', '挑战', '艰苦', '不易', '枯燥', '繁琐', '耗时', '磨练', '压力']
-    hardship_count = sum(text.count(word) for word in hardship_keywords)
-    hardship_score = min(hardship_count / max(len(text)/450, 1) * 1.2, 0.95)
-    duty_keywords = ['责任', '使命', '守护', '保护', '贡献', '传承', '弘扬', '担当', '义务', '奉献']
-    duty_count = sum(text.count(word) for word in duty_keywords)
-    duty_score = min(duty_count / max(len(text)/350, 1) * 1.4, 0.95)
-    achievement_keywords = ['成就', '成果', '价值', '意义', '满足', '认可', '荣耀', '辉煌', '突破', '贡献']
-    achievement_count = sum(text.count(word) for word in achievement_keywords)
-    achievement_score = min(achievement_count / max(len(text)/425, 1) * 1.1, 0.95)
-    scores = [positive_score, persist_score, hardship_score, duty_score, achievement_score]
-    scores = [min(max(score, 0.5), 0.95) for score in scores]
-    return scores
+    return score_stories(story_hits([StoryRecord.from_text(None, text)]))[0].tolist()
 
-def create_culture_radar_chart(stories):
+def create_culture_radar_chart(stories, scores=None):
     print(f"开始为 {len(stories)} 位文化传承人创建情感维度雷达图...")
-    dimensions = ['积极程度', '坚持程度', '艰辛程度', '责任感', '成就感']
+    dimensions = DIMENSIONS
     n_dim = len(dimensions)
     angles = np.linspace(0, 2 * np.pi, n_dim, endpoint=False).tolist()
     angles += angles[:1]
@@ -165,16 +139,17 @@ def create_culture_radar_chart(stories):
     markers = ['o', 's', '^', 'D', 'v', '<', '>', 'p', '*', 'h', '+', 'x',
                'o', 's', '^', 'D', 'v', '<']
     
-    all_scores = []
+    # 所有传承人一次打分
+    if scores is None:
+        scores = score_stories(story_hits(stories))
+    all_scores = scores.tolist()
     for i, story in enumerate(stories):
-        scores = calculate_sentiment_scores(story['content'])
-        scores += scores[:1]
-        all_scores.append(scores[:-1])
+        scores = all_scores[i] + all_scores[i][:1]
         color = colors[i % len(colors)]
         linestyle = linestyles[i % len(linestyles)]
         marker = markers[i % len(markers)]
         ax1.plot(angles, scores, marker=marker, linestyle=linestyle, linewidth=3,
-                label=story['name'], color=color, markersize=9, alpha=0.85)
+                label=story.name, color=color, markersize=9, alpha=0.85)
         ax1.fill(angles, scores, alpha=0.08, color=color)
     
     ax1.set_xticks(angles[:-1])
@@ -279,16 +254,25 @@ def analyze_culture_sentiment(text):
                      '重要', '关键', '价值', '意义', '伟大', '辉煌', '荣耀', '胜利']
     negative_words = ['困难', '难题', '挑战', '艰苦', '不易', '失传', '断层', '消失',
                      '破损', '残破', '损坏', '衰退', '退化', '艰辛', '缺乏', '不足']
-    text_lower = text.lower()
-    pos_count = sum(text_lower.count(word) for word in positive_words)
-    neg_count = sum(text_lower.count(word) for word in negative_words)
+    pos_count, neg_count = count_groups(text, positive_words, negative_words, ignore_case=True)
     if pos_count + neg_count > 0:
         score = pos_count / (pos_count + neg_count)
     else:
         score = 0.75
     return score, pos_count, neg_count
 
+def load_stories(corpus):
+    """五行业统一分析入口用：从已加载的语料库取文化传承.docx 的段落"""
+    source = ParagraphSource(corpus, '文化传承')
+    return extract_stories_from_text(source.text, source)
+
 def main():
+    # 设置工作目录
+    os.chdir('E:\\')
+    print("=" * 60)
+    print("文化传承领域情感分析系统")
+    print("工作目录:", os.getcwd())
+    print("=" * 60)
     print("正在分析文化传承文档...")
     file_path = 'E:\\文化传承.docx'
     if not os.path.exists(file_path):
@@ -311,21 +295,21 @@ def main():
     stories = extract_stories_from_text(text_content)
     print(f"\n✓ 提取到 {len(stories)} 位文化传承人:")
     for i, story in enumerate(stories, 1):
-        print(f"  {i:2d}. {story['name']:10s} - {len(story['content']):5d} 字符")
+        print(f"  {i:2d}. {story.name:10s} - {len(story.text):5d} 字符")
     results = []
     print("\n进行情感分析...")
     for story in stories:
-        score, pos_count, neg_count = analyze_culture_sentiment(story['content'])
+        score, pos_count, neg_count = analyze_culture_sentiment(story.text)
         sentiment = '积极' if score > 0.6 else '消极' if score < 0.4 else '中性'
         results.append({
-            '姓名': story['name'],
+            '姓名': story.name,
             '情感倾向': sentiment,
             '综合分数': round(score, 3),
             '积极词数': pos_count,
             '消极词数': neg_count,
-            '内容长度': len(story['content'])
+            '内容长度': len(story.text)
         })
-        print(f"  {story['name']:10s}: {sentiment} (分数: {score:.3f}, 积极词: {pos_count}, 消极词: {neg_count})")
+        print(f"  {story.name:10s}: {sentiment} (分数: {score:.3f}, 积极词: {pos_count}, 消极词: {neg_count})")
     df = pd.DataFrame(results)
     csv_path = 'E:\\文化传承情感分析.csv'
     try:
@@ -361,7 +345,7 @@ if __name__ == "__main__":
         traceback.print_exc()
         print("\n尝试强制生成雷达图...")
         try:
-            test_stories = [
+            test_stories = [StoryRecord.from_text(s['name'], s['content']) for s in [
                 {'name': '毛胜利', 'content': '宣纸晒纸工艺传承人，坚守古法技艺，数十年如一日的坚持让人敬佩，传承之路虽然艰辛但成果丰硕'},
                 {'name': '王亚蓉', 'content': '古丝绸修复专家，保护文化遗产，面对破损的文物充满心疼，修复成功后倍感自豪，为文化传承贡献巨大'},
                 {'name': '周东红', 'content': '捞纸工，40年坚守，传承宣纸技艺，工作枯燥但充满热爱，看到年轻人传承技艺感到欣慰'},
@@ -372,7 +356,7 @@ if __name__ == "__main__":
                 {'name': '王津', 'content': '故宫钟表修复师，修复百年古钟，工作细致入微，对文物有深厚感情，充满使命感'},
                 {'name': '陈巧生', 'content': '铜炉制作技艺传承人，复原古代铜炉制作工艺，数十年潜心研究，克服无数困难，成就感满满'},
                 {'name': '杨玉芳', 'content': '皮影戏传承人，坚守皮影艺术数十年，面对行业困境不放弃，致力于传播皮影文化，责任感强烈'}
-            ]
+            ]]
             create_culture_radar_chart(test_stories)
         except Exception as e2:
             print(f"强制生成也失败: {e2}")
\ No newline at end of file
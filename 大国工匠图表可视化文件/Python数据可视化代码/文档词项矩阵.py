@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+多粒度文档-词项矩阵（句级 CSR + 稀疏汇总矩阵）
+以语料库中的句子（corpus.sentences 口径，即 re.split(r'[。！？]', 全文) 的每一段）为行、
+jieba 共享词表（分词.token_vocab）为列，只构建一次句级计数矩阵；
+故事、工匠、行业等更粗的粒度都用 行 × 组 的 0/1 指示矩阵做一次矩阵乘法得到：
+    行业 × 词 = Iᵀ_行业 · X          工匠/故事 × 词 = Iᵀ_区间 · X
+列号就是分词缓存里的 int32 词编号，构建时直接用 encode_documents 的编号数组，不经过 str 列表；
+停用词、人名等过滤照旧用 vocab.mask 得到的布尔数组。
+矩阵连同行偏移一起缓存在 .corpus/dtm-<版本>.npz，语料、分词词典、共享词表不变时直接加载。
+行的起止与语料库一致，都是 UTF-8 字节偏移，可以直接回到 mmap 取原文。
+用法：
+    from 语料库 import load_corpus
+    from 文档词项矩阵 import load_dtm
+    dtm = load_dtm(load_corpus())
+    counts, industries = dtm.by_industry()                 # 行业 × 词
+    counts, names = dtm.by_spans([("胡洋", "基建工程", start, end), ...])
+    freq = dtm.row_counts(counts, industries.index("装备制造"))   # 某一行的词频数组，下标即词编号
+依赖：numpy、scipy、jieba
+"""
+import os
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+from 语料库 import CORPUS_DIR, STORY_DIR
+from 分词 import encode_documents, dict_version, token_vocab, _vocab_digest
+
+DTM_VERSION = 2   # 构建逻辑改动时 +1，旧缓存失效
+
+
+def industry_of(doc_name):
+    """文档名 → 行业：工匠故事/<行业>/<工匠> 取中间一级，其余文档名即行业"""
+    parts = doc_name.split("/")
+    return parts[1] if parts[0] == STORY_DIR and len(parts) == 3 else doc_name
+
+
+# ---------- 1. 句级矩阵 ----------
+class DocumentTermMatrix:
+    """
+    matrix     句子 × 词 的 CSR 计数矩阵（列数为构建时的词表大小）
+    vocab      列对应的共享词表（只增不改，构建后新加的词在本矩阵里计数为 0）
+    row_spans  每行句子在语料文件中的 UTF-8 字节起止
+    doc_ptr    文档 d 占 doc_ptr[d]:doc_ptr[d+1] 行
+    """
+
+    def __init__(self, matrix, vocab, row_spans, doc_names, doc_ptr):
+        self.matrix = matrix
+        self.vocab = vocab
+        self.row_spans = row_spans
+        self.doc_names = list(doc_names)
+        self.doc_ptr = doc_ptr
+
+    @property
+    def row_doc(self):
+        """每行所属文档序号"""
+        return np.repeat(np.arange(len(self.doc_names)), np.diff(self.doc_ptr))
+
+    def row_counts(self, counts, i):
+        """汇总矩阵第 i 行 → 词表长度的 int64 词频数组（与 vocab.mask 等布尔数组对齐）"""
+        row = counts.getrow(i)
+        freq = np.zeros(len(self.vocab), dtype=np.int64)
+        freq[row.indices] = row.data
+        return freq
+
+    # ----- 汇总 -----
+    def indicator(self, labels):
+        """
+        每行一个组名（None 表示不归入任何组）→ (行 × 组 的 0/1 CSR, 组名列表)
+        组名按首次出现的顺序编号。
+        """
+        groups, codes = {}, np.empty(len(labels), dtype=np.int64)
+        for i, label in enumerate(labels):
+            codes[i] = -1 if label is None else groups.setdefault(label, len(groups))
+        rows = np.flatnonzero(codes >= 0)
+        ind = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, codes[rows])),
+            shape=(len(labels), len(groups)),
+        )
+        return ind, list(groups)
+
+    def rollup(self, labels):
+        """按行标签汇总 → (组 × 词 计数矩阵 CSR, 组名列表)"""
+        ind, names = self.indicator(labels)
+        return (ind.T @ self.matrix).tocsr(), names
+
+    def by_document(self):
+        return self.rollup([self.doc_names[d] for d in self.row_doc])
+
+    def by_industry(self):
+        return self.rollup([industry_of(self.doc_names[d]) for d in self.row_doc])
+
+    def by_spans(self, spans):
+        """
+        按字节区间汇总，spans 为 [(组名, 文档名, 起, 止), ...]（如工匠故事的切分结果）
+        句子起点落在区间内即归入该组；同一行落在多个区间时取先给出的区间。
+        """
+        labels = [None] * self.matrix.shape[0]
+        doc_ids = {name: d for d, name in enumerate(self.doc_names)}
+        starts = self.row_spans[:, 0]
+        for label, doc, start, end in spans:
+            d = doc_ids[doc]
+            lo, hi = self.doc_ptr[d], self.doc_ptr[d + 1]
+            first = lo + np.searchsorted(starts[lo:hi], start, side="left")
+            last = lo + np.searchsorted(starts[lo:hi], end, side="left")
+            for r in range(first, last):
+                if labels[r] is None:
+                    labels[r] = label
+        return self.rollup(labels)
+
+    # ----- 存取 -----
+    def save(self, path):
+        """只存编号矩阵；词表本身在 .token_cache/ 里，这里记下列数与词表摘要"""
+        m = self.matrix
+        n = m.shape[1]
+        with open(path + ".tmp", "wb") as f:
+            np.savez(
+                f, data=m.data, indices=m.indices, indptr=m.indptr, shape=np.asarray(m.shape),
+                vocab_size=n, vocab_digest=_vocab_digest(self.vocab, n), row_spans=self.row_spans,
+                doc_names=np.array(self.doc_names, dtype=str), doc_ptr=self.doc_ptr,
+            )
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        """共享词表被改写过（前 vocab_size 个词的摘要对不上）时抛 ValueError，由调用方重建"""
+        vocab = token_vocab()
+        with np.load(path) as z:
+            n = int(z["vocab_size"])
+            if n > len(vocab) or str(z["vocab_digest"]) != _vocab_digest(vocab, n):
+                raise ValueError("共享词表已变化")
+            matrix = sp.csr_matrix((z["data"], z["indices"], z["indptr"]), shape=tuple(z["shape"]))
+            return cls(matrix, vocab, z["row_spans"], [str(name) for name in z["doc_names"]], z["doc_ptr"])
+
+
+def build_dtm(corpus, names=None, workers=None):
+    """
+    分词（走段落缓存，直接取 int32 编号）后把每个词按字节偏移归到所在句子，构建句级矩阵
+    词的字节长度按词表算一次，逐词的起点是段落起点加段内字节长度的前缀和。
+    """
+    names = list(names or corpus.doc_names)
+    vocab, encoded = encode_documents({n: list(corpus.paragraphs(n)) for n in names}, workers=workers)
+    word_bytes = np.fromiter((len(w.encode("utf-8")) for w in vocab.words), dtype=np.int64,
+                             count=len(vocab))
+
+    rows, cols, row_spans, doc_ptr = [], [], [], [0]
+    for name in names:
+        sents = corpus.doc_sentence_spans(name)
+        base = doc_ptr[-1]
+        ptr, ids = encoded[name]
+        nbytes = word_bytes[ids]
+        ends = np.cumsum(nbytes)
+        # 每个词在段内的字节起点 = 全文档前缀和 − 所在段第一个词之前的前缀和
+        para_base = np.concatenate([[0], ends])[ptr[:-1]]
+        p_start = corpus.doc_paragraph_spans(name)[:, 0]
+        tok_starts = np.repeat(p_start - para_base, np.diff(ptr)) + ends - nbytes
+        # 词的起点落在哪个句子；落在句末标点上的词不计
+        r = np.searchsorted(sents[:, 0], tok_starts, side="right") - 1
+        inside = (r >= 0) & (tok_starts < sents[np.maximum(r, 0), 1])
+        rows.append(base + r[inside])
+        cols.append(ids[inside])
+        row_spans.append(sents)
+        doc_ptr.append(base + len(sents))
+
+    n_rows = doc_ptr[-1]
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(cols).astype(np.int64) if cols else np.zeros(0, dtype=np.int64)
+    matrix = sp.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n_rows, len(vocab)))
+    matrix.sum_duplicates()
+    return DocumentTermMatrix(
+        matrix, vocab,
+        np.concatenate(row_spans) if row_spans else np.zeros((0, 2), dtype=np.int64),
+        names, np.asarray(doc_ptr, dtype=np.int64),
+    )
+
+
+# ---------- 2. 缓存 ----------
+def _dtm_path(corpus, names, out_dir):
+    key = "\n".join([str(DTM_VERSION), dict_version(), *corpus.sources, "|", *names])
+    return os.path.join(out_dir, f"dtm-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.npz")
+
+
+def load_dtm(corpus, names=None, out_dir=CORPUS_DIR):
+    """取句级矩阵：语料、分词词典、共享词表、文档范围都没变时直接读 .corpus/ 下的缓存"""
+    names = list(names or corpus.doc_names)
+    path = _dtm_path(corpus, names, out_dir)
+    if os.path.exists(path):
+        try:
+            return DocumentTermMatrix.load(path)
+        except (OSError, ValueError, KeyError):
+            pass   # 缓存损坏或词表变化时重建
+    dtm = build_dtm(corpus, names)
+    os.makedirs(out_dir, exist_ok=True)
+    dtm.save(path)
+    print(f"✓ 文档-词项矩阵已构建：{dtm.matrix.shape[0]} 句 × {dtm.matrix.shape[1]} 词")
+    return dtm
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+docx 统一读取模块（按文件内容哈希缓存段落）
+同一份 docx 只解析一次：段落列表以文件内容 SHA-1 为键，
+压缩保存在 .docx_cache/ 下，之后各分析脚本直接读缓存。
+解析不再经过 python-docx：直接从 zip 中流式 iterparse word/document.xml，
+逐段产出文本，内存占用与文档长度无关。
+用法：
+    from 文档读取 import read_paragraphs, read_docx, iter_paragraphs
+    text = read_docx("基建工程.docx")          # 非空段落以换行拼接
+    paragraphs = read_paragraphs("基建工程.docx")
+    for para in iter_paragraphs("基建工程.docx"):   # 超大文档逐段流式处理
+        ...
+"""
+import os
+import gzip
+import json
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+
+# 缓存目录固定放在本模块旁边（各脚本会 chdir 到 E:\，不能用相对路径）
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".docx_cache")
+
+# 进程内缓存：同一次运行里多次读取同一文件时连解压都省掉
+_memo = {}
+
+
+# ---------- 1. 内容哈希 ----------
+def file_hash(path, chunk_size=1 << 20):
+    """按文件内容计算 SHA-1（改名、移动文件不影响缓存命中）"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ---------- 2. 流式解析 ----------
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY, _P, _R, _HYPERLINK, _BR = (W_NS + t for t in ("body", "p", "r", "hyperlink", "br"))
+# run 内可转成文字的子元素（与 python-docx 的 Run.text 规则一致）
+_RUN_CHARS = {W_NS + "tab": "\t", W_NS + "ptab": "\t", W_NS + "cr": "\n", W_NS + "noBreakHyphen": "-"}
+
+
+def _run_child_text(elem):
+    if elem.tag == W_NS + "t":
+        return elem.text or ""
+    if elem.tag == _BR:
+        # 只有默认的换行型 <w:br/> 算换行，分页/分栏符不产生文字
+        return "\n" if elem.get(W_NS + "type", "textWrapping") == "textWrapping" else ""
+    return _RUN_CHARS.get(elem.tag, "")
+
+
+def iter_paragraphs(path):
+    """
+    逐段产出 docx 正文段落文本（含空段落，顺序同 Document(path).paragraphs）
+    只取 body 直属的 <w:p>，段落文字来自其下 <w:r> 及 <w:hyperlink>/<w:r>，
+    表格、文本框里的段落不计入，与 python-docx 的结果一致。
+    """
+    with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as f:
+        tags = []      # 当前元素的祖先路径：document/body/p/...
+        parts = []     # 当前段落已收集的文字
+        body = None
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                tags.append(elem.tag)
+                if len(tags) == 2 and elem.tag == _BODY:
+                    body = elem
+                continue
+
+            tags.pop()
+            depth = len(tags)
+            if depth >= 4 and tags[1] == _BODY and tags[2] == _P:
+                # body/p/r/x 或 body/p/hyperlink/r/x
+                if (depth == 4 and tags[3] == _R) or \
+                        (depth == 5 and tags[3] == _HYPERLINK and tags[4] == _R):
+                    parts.append(_run_child_text(elem))
+            elif depth == 2 and body is not None:
+                if elem.tag == _P:
+                    yield "".join(parts)
+                    parts = []
+                # body 的直属子元素处理完就丢掉，保证内存恒定
+                body.clear()
+
+
+def _parse_docx(path):
+    """真正解析 docx：只保留非空段落，段落原文不做 strip"""
+    return [text for text in iter_paragraphs(path) if text.strip()]
+
+
+def _cache_path(digest):
+    return os.path.join(CACHE_DIR, digest + ".json.gz")
+
+
+def _load_cache(digest):
+    path = _cache_path(digest)
+    if not os.path.exists(path):
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # 缓存损坏时当作未命中，重新解析覆盖
+        return None
+
+
+def _save_cache(digest, paragraphs):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(digest)
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(paragraphs, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)   # 原子替换，避免并行运行时读到半截文件
+
+
+# ---------- 3. 对外接口 ----------
+def read_paragraphs(path):
+    """返回 docx 的非空段落列表（与 [p.text for p in paragraphs if p.text.strip()] 一致）"""
+    digest = file_hash(path)
+    paragraphs = _memo.get(digest)
+    if paragraphs is None:
+        paragraphs = _load_cache(digest)
+        if paragraphs is None:
+            paragraphs = _parse_docx(path)
+            _save_cache(digest, paragraphs)
+        _memo[digest] = paragraphs
+    return list(paragraphs)
+
+
+def read_docx(path):
+    """返回全文：非空段落以换行拼接"""
+    return "\n".join(read_paragraphs(path))
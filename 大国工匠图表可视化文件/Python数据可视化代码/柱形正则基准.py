@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+柱形图 spirit_dict 计数基准：逐条 re.findall vs 一次扫描（count_pattern_groups）
+两个柱形脚本的 spirit_dict 取自 词典.py 的登记，
+对每个行业文档核对两种方法的频次完全一致，并打印耗时；
+柱形脚本实际使用的全语料命中表（融合分析.pattern_counts）也一并核对。
+运行：python 柱形正则基准.py
+"""
+import re
+import time
+from 语料库 import load_corpus
+from 关键词匹配 import count_pattern_groups
+from 融合分析 import load_fused
+from 词典 import SPIRIT_DICTS
+
+# SPIRIT_DICTS 的键 → 用这份 spirit_dict 的文档
+SCRIPTS = {
+    '航天-能源-文化-装备': ['航天军工', '能源电力', '文化传承', '装备制造'],
+    '基建工程': ['基建工程'],
+}
+REPEAT = 20
+
+
+def count_loop(text, spirit_dict):
+    """原实现：每条正则各 findall 一遍全文"""
+    return [sum(len(re.findall(pat, text, flags=re.I)) for pat in v) for v in spirit_dict.values()]
+
+
+def count_single_pass(text, spirit_dict):
+    return count_pattern_groups(text, *spirit_dict.values(), flags=re.I)
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    corpus = load_corpus()
+    fused = load_fused(corpus)
+    print(f"{'文档':<8}{'正则数':>6}{'逐条(ms)':>10}{'一次扫描(ms)':>14}{'加速':>8}")
+    total_loop = total_single = 0
+    for script, docs in SCRIPTS.items():
+        spirit_dict = SPIRIT_DICTS[script]
+        n_patterns = sum(len(v) for v in spirit_dict.values())
+        for doc in docs:
+            if doc not in corpus:
+                print(f'❌ 缺少 {doc}.docx，跳过')
+                continue
+            text = corpus.doc_text(doc)
+            expected, t_loop = timeit(count_loop, text, spirit_dict)
+            got, t_single = timeit(count_single_pass, text, spirit_dict)
+            assert got == expected, f'{doc} 计数不一致：{got} != {expected}'
+            fused_got = fused.pattern_counts(doc, *spirit_dict.values(), flags=re.I)
+            assert fused_got == expected, f'{doc} 命中表计数不一致：{fused_got} != {expected}'
+            total_loop += t_loop
+            total_single += t_single
+            print(f'{doc:<8}{n_patterns:>6}{t_loop:>10.2f}{t_single:>14.2f}{t_loop / t_single:>7.1f}x')
+    if total_single:
+        print(f'✅ 计数全部一致；合计 {total_loop:.2f} ms → {total_single:.2f} ms（{total_loop / total_single:.1f}x）')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,261 +5,135 @@ import matplotlib
 matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 import os
-from docx import Document
+from 文档读取 import read_paragraphs
+from 关键词匹配 import count_groups
+from 故事切分 import StoryRecord, segment_stories, strip_spans, TextSource, ParagraphSource
+from 融合分析 import story_density
+from 词典 import RADAR_KEYWORDS, RADAR_BONUS
 import warnings
 warnings.filterwarnings('ignore')
 
-# 设置工作目录
-os.chdir('E:\\')
-
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-print("=" * 60)
-print("能源电力领域大国工匠情感维度分析系统")
-print("=" * 60)
+DIMENSIONS = ['安全把控度', '技术精密度', '创新突破力', '行业贡献度', '职业坚守度']
+# 各维度（带权重的）关键词与点名加分写在 词典.py，与图表词典一起登记；语料里的故事直接从融合命中表计数
+KEYWORD_GROUPS = RADAR_KEYWORDS['能源电力']
+SPECIAL_BONUS = RADAR_BONUS['能源电力']
+
+# 预定义工匠名单（根据文档内容）：姓名 → 所属领域
+CRAFTSMEN = {
+    "陈永伟": "核电",
+    "刘丽": "石油", 
+    "胡家瑞": "电力",
+    "贾春成": "材料",
+    "梅琳": "水电",
+    "王进": "电力",
+    "乔素凯": "核电",
+    "黄金娟": "电力",
+    "谭文波": "石油"
+}
+
+def is_long_paragraph(text):
+    """只保留长于3个字的段"""
+    return len(text) > 3
+
+def join_paragraphs(paragraphs):
+    """段落去掉首尾空白，只保留长于3个字的段，以换行拼接"""
+    return '\n'.join(text for text in (para.strip() for para in paragraphs) if is_long_paragraph(text))
 
 def read_docx_file(file_path):
     """读取docx文件内容"""
     try:
-        doc = Document(file_path)
-        full_text = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text and len(text) > 3:
-                full_text.append(text)
-        return '\n'.join(full_text)
+        return join_paragraphs(read_paragraphs(file_path))
     except Exception as e:
         print(f"读取docx文件失败: {e}")
         return ""
 
-def extract_stories(text):
-    """优化版故事提取，确保每个人物内容完整"""
-    stories = []
-    
-    # 预定义工匠名单（根据文档内容）
-    craftsmen = {
-        "陈永伟": "核电",
-        "刘丽": "石油", 
-        "胡家瑞": "电力",
-        "贾春成": "材料",
-        "梅琳": "水电",
-        "王进": "电力",
-        "乔素凯": "核电",
-        "黄金娟": "电力",
-        "谭文波": "石油"
-    }
-    
-    # 为每个人物准备内容
-    for name in craftsmen.keys():
-        stories.append({
-            'name': name,
-            'content': "",
-            'domain': craftsmen[name]
-        })
-    
-    # 按行处理，将内容分配到对应人物
-    lines = text.split('\n')
-    current_person = None
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        # 检查是否为新人物开始
-        person_found = None
-        for person in craftsmen.keys():
-            # 多种匹配方式
-            if line.startswith(person) or f"{person}：" in line or f"{person}:" in line:
-                person_found = person
-                break
-            elif person in line[:15]:  # 名字在前15个字符内
-                person_found = person
-                break
-        
-        if person_found:
-            current_person = person_found
-            # 找到对应故事对象
-            for story in stories:
-                if story['name'] == current_person:
-                    # 添加内容（去掉名字部分）
-                    content_part = line.replace(person_found, '').replace('：', '').replace(':', '').strip()
-                    if content_part:
-                        story['content'] += content_part + " "
-                    break
-        elif current_person:
-            # 继续为当前人物添加内容
-            for story in stories:
-                if story['name'] == current_person:
-                    story['content'] += line + " "
-                    break
-    
-    # 过滤掉内容过少的
-    filtered_stories = []
-    for story in stories:
-        if len(story['content']) > 150:  # 至少150字
-            filtered_stories.append({
-                'name': story['name'],
-                'content': story['content'],
-                'domain': story['domain']
-            })
+def is_person_heading(line, name):
+    """行首是人名、带「人名：」，或人名出现在前15个字符内，视为该人物内容开始"""
+    return line.startswith(name) or f"{name}：" in line or f"{name}:" in line or name in line[:15]
+
+def extract_stories(text, source=None):
+    """
+    优化版故事提取，确保每个人物内容完整
+    故事只记区间（StoryRecord），正文用 story.text 按需解码；source 为 text 的来源
+    （语料库段落用 ParagraphSource，区间直接指向语料文件），默认按 text 本身建 TextSource
+    """
+    source = source if source is not None else TextSource(text)
+    
+    # 为每个人物准备区间列表：标题行去掉名字、冒号后剩下的部分 + 其后各行
+    parts = {name: [] for name in CRAFTSMEN}
+    
+    # 姓名自动机一次扫描找出人物开始的行，其后各行归到该人物
+    seg = segment_stories(text, CRAFTSMEN, is_person_heading)
+    for person, first, end in seg.stories():
+        start, stop = seg.line_spans[first]
+        parts[person].extend(strip_spans(text, start, stop, (person, '：', ':')))
+        parts[person].extend(seg.line_spans[first + 1:end])
+    
+    # 过滤掉内容过少的（至少150字，各段以空格连接）
+    stories = [source.record(name, spans, sep=' ') for name, spans in parts.items()
+               if sum(e - s for s, e in spans) + len(spans) > 150]
     
     # 如果还是太少，使用备份方案：直接按关键词提取
-    if len(filtered_stories) < 5:
+    if len(stories) < 5:
         print("使用备份提取方案...")
-        # 根据工匠名字直接提取附近内容
-        for name in craftsmen.keys():
-            if name in text:
-                start = text.find(name)
-                end = start + 1500  # 提取1500字符
-                content = text[start:end]
-                
-                # 清理内容
-                content = content.replace('\n', ' ').replace('  ', ' ')
-                
-                if len(content) > 200:
-                    filtered_stories.append({
-                        'name': name,
-                        'content': content,
-                        'domain': craftsmen[name]
-                    })
-    
-    return filtered_stories
+        # 根据工匠名字直接提取附近内容：从名字首次出现处到下一位工匠首次出现处（不再截断到 1500 字）
+        firsts = {name: text.find(name) for name in CRAFTSMEN if name in text}
+        for name, start in firsts.items():
+            end = min((pos for pos in firsts.values() if pos > start), default=len(text))
+            if end - start > 200:
+                stories.append(source.record(name, [(start, end)]))
+    
+    return stories
 
-def calculate_dimension_scores(text):
-    """高分优化版情感维度计算"""
-    
-    # 1. 安全把控度 - 大幅扩展并提高权重
-    safety_terms = [
-        ('安全', 2), ('可靠', 2), ('防护', 2), ('零事故', 5), ('零失误', 5),
-        ('万无一失', 5), ('无差错', 4), ('防辐射', 4), ('辐射安全', 4),
-        ('密封', 2), ('防泄漏', 3), ('防爆', 3), ('绝缘', 2),
-        ('应急预案', 3), ('安全措施', 3), ('安全规程', 3), ('安全生产', 3),
-        ('生命保障', 4), ('人身安全', 4), ('设备安全', 3), ('运行安全', 3),
-        ('稳定运行', 2), ('平稳运行', 2), ('可控', 2), ('受控', 2),
-        ('在控', 2), ('安全保障', 4), ('安全可靠', 3), ('安全稳定', 3),
-        ('防护到位', 4), ('措施完善', 3), ('规程严格', 3), ('操作规范', 3),
-        ('风险控制', 3), ('隐患排除', 4), ('事故预防', 4), ('安全第一', 3)
-    ]
-    
-    # 2. 技术精密度
-    precision_terms = [
-        ('精度', 3), ('精密', 3), ('精准', 3), ('精确', 3), ('毫米', 3),
-        ('微米', 4), ('纳米', 4), ('0.1毫米', 5), ('0.5毫米', 5), ('1毫米', 4),
-        ('误差', 2), ('公差', 2), ('偏差', 2), ('校准', 3), ('校验', 3),
-        ('检定', 3), ('测量', 2), ('计量', 2), ('标准化', 2), ('规范化', 2),
-        ('精益求精', 4), ('精雕细琢', 4), ('精工细作', 4), ('一丝不苟', 4),
-        ('分毫不差', 5), ('毫厘不差', 5), ('工艺精湛', 4), ('技术高超', 4),
-        ('专业精湛', 4), ('技艺纯熟', 4), ('手法娴熟', 4), ('操作精准', 4)
-    ]
-    
-    # 3. 创新突破力
-    innovation_terms = [
-        ('创新', 3), ('发明', 4), ('研发', 3), ('研制', 3), ('开发', 2),
-        ('设计', 2), ('改进', 2), ('优化', 2), ('升级', 2), ('革新', 3),
-        ('突破', 4), ('攻克', 4), ('破解', 4), ('解决', 2), ('实现', 2),
-        ('成功', 2), ('首创', 5), ('独创', 5), ('原创', 4), ('自主', 3),
-        ('自主研发', 5), ('自主创新', 5), ('专利', 4), ('发明专利', 5),
-        ('新技术', 3), ('新方法', 3), ('新工艺', 3), ('新材料', 3),
-        ('智能化', 3), ('自动化', 3), ('数字化', 3), ('信息化', 2),
-        ('填补空白', 5), ('国内首创', 5), ('国际领先', 5), ('世界先进', 5),
-        ('行业领先', 4), ('技术突破', 4), ('工艺创新', 4), ('方法创新', 4)
-    ]
-    
-    # 4. 行业贡献度
-    contribution_terms = [
-        ('贡献', 3), ('奉献', 3), ('价值', 2), ('效益', 2), ('成效', 2),
-        ('成绩', 2), ('成就', 3), ('成果', 2), ('经济效益', 4), ('社会效益', 4),
-        ('创造价值', 4), ('降低成本', 3), ('节约成本', 3), ('提高效率', 3),
-        ('提升效率', 3), ('服务社会', 4), ('服务国家', 4), ('服务民生', 4),
-        ('保障供应', 4), ('保障需求', 3), ('保障运行', 3), ('保障安全', 4),
-        ('推动发展', 4), ('促进发展', 3), ('助力发展', 3), ('支持发展', 3),
-        ('培养人才', 4), ('培训人才', 3), ('传授经验', 3), ('传承技艺', 4),
-        ('带动团队', 3), ('带领团队', 3), ('指导团队', 3), ('管理团队', 2),
-        ('重大贡献', 5), ('突出贡献', 5), ('显著成效', 4), ('明显提升', 3)
-    ]
-    
-    # 5. 职业坚守度
-    dedication_terms = [
-        ('坚守', 3), ('坚持', 2), ('执着', 3), ('专注', 3), ('扎根', 3),
-        ('十年', 3), ('二十年', 4), ('三十年', 5), ('四十年', 5), ('五十年', 5),
-        ('长期', 2), ('持久', 2), ('持续', 2), ('始终', 3), ('始终如一', 4),
-        ('一如既往', 3), ('坚持不懈', 4), ('爱岗敬业', 4), ('尽职尽责', 4),
-        ('认真负责', 3), ('勤勤恳恳', 4), ('兢兢业业', 4), ('踏踏实实', 3),
-        ('默默无闻', 3), ('无私奉献', 5), ('忘我工作', 4), ('辛勤工作', 3),
-        ('努力工作', 2), ('刻苦钻研', 4), ('勤奋学习', 3), ('不断学习', 3),
-        ('持续进步', 3), ('传承', 3), ('传授', 3), ('教导', 3), ('指导', 3),
-        ('培养', 3), ('培训', 2), ('坚守岗位', 4), ('坚守一线', 4),
-        ('扎根基层', 4), ('扎根一线', 4), ('数十年如一日', 5), ('几十年如一日', 5)
-    ]
+def story_hits(stories, corpus=None):
+    """
+    故事 × 组 的命中前缀和：给了 corpus 时取自融合命中表，否则扫描各篇正文
+    列依次为 五个维度的加权命中、五个维度的不加权命中、各加分人名的出现次数
+    """
+    groups = list(KEYWORD_GROUPS.values())
+    return story_density(stories, *groups, *[[term for term, _ in g] for g in groups],
+                         *[[name] for name in SPECIAL_BONUS], corpus=corpus)
+
+def score_stories(density, with_hits=False):
+    """
+    高分优化版情感维度计算：命中前缀和（story_hits）→ N×5 分数矩阵（分段公式、加分均按数组运算）
+    with_hits 时同时返回各维度的命中次数（不加权）
+    """
+    counts = density.totals()
+    w, hits, mentioned = counts[:, :5], counts[:, 5:10], counts[:, 10:] > 0
     
     # 计算加权分数
-    def calculate_weighted_score(terms, text):
-        total_weight = 0
-        for term, weight in terms:
-            # 计算出现次数（考虑重叠）
-            count = text.count(term)
-            total_weight += count * weight
-        
-        # 高得分公式：更容易达到90分以上
-        if total_weight == 0:
-            return 0.75  # 基础分提高
-        
-        # 新公式：更容易达到高分
-        if total_weight < 10:
-            score = 0.75 + total_weight * 0.02
-        elif total_weight < 20:
-            score = 0.85 + (total_weight - 10) * 0.015
-        elif total_weight < 30:
-            score = 0.90 + (total_weight - 20) * 0.01
-        elif total_weight < 40:
-            score = 0.92 + (total_weight - 30) * 0.008
-        else:
-            score = 0.95 + (total_weight - 40) * 0.005
-        
-        return min(score, 0.98)  # 最高98分
-    
-    # 计算各维度分数
-    safety_score = calculate_weighted_score(safety_terms, text)
-    precision_score = calculate_weighted_score(precision_terms, text)
-    innovation_score = calculate_weighted_score(innovation_terms, text)
-    contribution_score = calculate_weighted_score(contribution_terms, text)
-    dedication_score = calculate_weighted_score(dedication_terms, text)
+    # 高得分公式：更容易达到90分以上；新公式：更容易达到高分
+    scores = np.select(
+        [w == 0, w < 10, w < 20, w < 30, w < 40],
+        [0.75,                           # 基础分提高
+         0.75 + w * 0.02,
+         0.85 + (w - 10) * 0.015,
+         0.90 + (w - 20) * 0.01,
+         0.92 + (w - 30) * 0.008],
+        0.95 + (w - 40) * 0.005,
+    )
+    scores = np.minimum(scores, 0.98)  # 最高98分
     
     # 文档特定加分（针对文档中明确提到的成就）
-    special_bonus = {
-        "陈永伟": {"safety": 0.05, "precision": 0.08, "innovation": 0.06},
-        "黄金娟": {"innovation": 0.10, "contribution": 0.08, "precision": 0.07},
-        "谭文波": {"innovation": 0.09, "contribution": 0.07},
-        "梅琳": {"precision": 0.09, "safety": 0.06},
-        "王进": {"safety": 0.08, "dedication": 0.07},
-        "刘丽": {"contribution": 0.07, "dedication": 0.08},
-        "贾春成": {"innovation": 0.07, "precision": 0.06},
-    }
-    
-    # 应用特定加分（如果能在文本中识别出人名）
-    for name, bonuses in special_bonus.items():
-        if name in text:
-            if "safety" in bonuses:
-                safety_score += bonuses["safety"]
-            if "precision" in bonuses:
-                precision_score += bonuses["precision"]
-            if "innovation" in bonuses:
-                innovation_score += bonuses["innovation"]
-            if "contribution" in bonuses:
-                contribution_score += bonuses["contribution"]
-            if "dedication" in bonuses:
-                dedication_score += bonuses["dedication"]
+    # 应用特定加分（如果能在文本中识别出人名）：文本 × 人名 的出现矩阵，按人名顺序逐列累加
+    dims = ["safety", "precision", "innovation", "contribution", "dedication"]
+    bonus = np.array([[bonuses.get(d, 0.0) for d in dims] for bonuses in SPECIAL_BONUS.values()])
+    for k in range(len(SPECIAL_BONUS)):
+        scores = scores + np.where(mentioned[:, k:k + 1], bonus[k], 0.0)
     
     # 确保分数在0.75-0.98之间
-    scores = [safety_score, precision_score, innovation_score, contribution_score, dedication_score]
-    scores = [min(max(s, 0.75), 0.98) for s in scores]
-    
-    return scores
+    scores = np.clip(scores, 0.75, 0.98)
+    return (scores, hits) if with_hits else scores
+
+def calculate_dimension_scores(text):
+    return score_stories(story_hits([StoryRecord.from_text(None, text)]))[0].tolist()
 
-def create_radar_chart(stories):
+def create_radar_chart(stories, scores=None):
     """创建雷达图"""
     if not stories:
         print("没有提取到有效人物故事")
@@ -267,7 +141,7 @@ def create_radar_chart(stories):
     
     print(f"开始为 {len(stories)} 位工匠生成雷达图...")
     
-    dimensions = ['安全把控度', '技术精密度', '创新突破力', '行业贡献度', '职业坚守度']
+    dimensions = DIMENSIONS
     n_dim = len(dimensions)
     angles = np.linspace(0, 2 * np.pi, n_dim, endpoint=False).tolist()
     angles += angles[:1]
@@ -279,10 +153,15 @@ def create_radar_chart(stories):
     colors = ['#0277BD', '#009688', '#FF7043', '#4CAF50', '#9C27B0',
               '#FFC107', '#607D8B', '#795548', '#E91E63', '#3F51B5']
     
+    # 前 9 位工匠一次打分（main 里已算好时直接复用）
+    if scores is None:
+        scores = score_stories(story_hits(stories[:9]))
+    all_scores = scores[:9]
+    
     for i, story in enumerate(stories[:9]):
-        name = story['name']
-        scores = calculate_dimension_scores(story['content'])
-        scores_closed = scores + scores[:1]
+        name = story.name
+        person_scores = all_scores[i].tolist()
+        scores_closed = person_scores + person_scores[:1]
         
         ax1.plot(angles, scores_closed, 'o-', linewidth=3.0, 
                 label=name, color=colors[i % len(colors)], markersize=5.5)
@@ -300,7 +179,6 @@ def create_radar_chart(stories):
     # 子图2：平均值分析
     ax2 = fig.add_subplot(122, polar=True)
     
-    all_scores = [calculate_dimension_scores(story['content']) for story in stories[:9]]
     avg_scores = np.mean(all_scores, axis=0)
     std_scores = np.std(all_scores, axis=0)
     
@@ -343,8 +221,18 @@ def create_radar_chart(stories):
     except:
         print(f"图表已保存为文件: {output_path}")
 
+def load_stories(corpus):
+    """五行业统一分析入口用：从已加载的语料库取能源电力.docx 的段落"""
+    source = ParagraphSource(corpus, '能源电力', keep=is_long_paragraph)
+    return extract_stories(source.text, source)
+
 def main():
     """主程序"""
+    # 设置工作目录
+    os.chdir('E:\\')
+    print("=" * 60)
+    print("能源电力领域大国工匠情感维度分析系统")
+    print("=" * 60)
     print("正在启动能源电力领域大国工匠情感维度分析...")
     
     file_path = 'E:\\能源电力.docx'
@@ -370,8 +258,8 @@ def main():
     if stories:
         print("\n提取的工匠列表及内容长度：")
         for i, story in enumerate(stories, 1):
-            content_len = len(story['content'])
-            print(f"  {i:2d}. {story['name']:10s} [{story['domain']:4s}] | 内容长度: {content_len:6d}")
+            content_len = len(story.text)
+            print(f"  {i:2d}. {story.name:10s} [{CRAFTSMEN[story.name]:4s}] | 内容长度: {content_len:6d}")
     
     print("\n" + "=" * 60)
     print("正在进行高分优化情感维度分析...")
@@ -379,9 +267,10 @@ def main():
     
     results = []
     
-    for story in stories:
-        # 计算各维度分数
-        dim_scores = calculate_dimension_scores(story['content'])
+    # 所有工匠一次计算各维度分数，结果表和雷达图共用
+    dim_matrix = score_stories(story_hits(stories))
+    
+    for story, dim_scores in zip(stories, dim_matrix.tolist()):
         
         # 计算总体情感分数（各维度平均）
         overall_score = np.mean(dim_scores)
@@ -403,13 +292,12 @@ def main():
         precision_keywords = ['精度', '毫米', '精准', '误差', '校准']
         innovation_keywords = ['创新', '发明', '专利', '突破', '首创']
         
-        safety_count = sum(story['content'].count(word) for word in safety_keywords)
-        precision_count = sum(story['content'].count(word) for word in precision_keywords)
-        innovation_count = sum(story['content'].count(word) for word in innovation_keywords)
+        safety_count, precision_count, innovation_count = count_groups(
+            story.text, safety_keywords, precision_keywords, innovation_keywords)
         
         results.append({
-            '姓名': story['name'],
-            '所属领域': story['domain'],
+            '姓名': story.name,
+            '所属领域': CRAFTSMEN[story.name],
             '情感倾向': sentiment,
             '总体分数': round(overall_score, 4),
             '安全把控度': round(dim_scores[0], 4),
@@ -423,7 +311,7 @@ def main():
         })
         
         # 显示分析结果
-        print(f"  {story['name']:10s}: {sentiment:6s} | 总体={overall_score:.4f} | "
+        print(f"  {story.name:10s}: {sentiment:6s} | 总体={overall_score:.4f} | "
               f"安全={dim_scores[0]:.4f} 技术={dim_scores[1]:.4f} 创新={dim_scores[2]:.4f}")
     
     if results:
@@ -438,7 +326,7 @@ def main():
         print("\n" + "=" * 60)
         print("正在生成高分优化雷达图...")
         print("=" * 60)
-        create_radar_chart(stories)
+        create_radar_chart(stories, dim_matrix)
         
         # 分析总结
         print("\n" + "=" * 60)
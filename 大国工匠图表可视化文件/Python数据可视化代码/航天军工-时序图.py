@@ -2,37 +2,22 @@
 """
 《航天军工》六维情感时序图（纯 CPU + 中文无乱码）
 """
-import re
-import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
-from docx import Document
+from 语料库 import load_corpus
+from 融合分析 import load_fused
+from 词典 import TIMELINE_LEX
 
 # ---------- 1. 六维词典 ----------
-LEX = {
-    "自豪":   "自豪|骄傲|振奋|长脸|激动|为国争光",
-    "敬佩":   "敬佩|致敬|崇高|伟大|了不起|佩服",
-    "感动":   "感动|泪目|暖心|热泪盈眶|触动",
-    "坚守":   "坚守|耐得住寂寞|30年如一日|扎根|默默",
-    "精益求精": "精益求精|零差错|毫厘|极致|完美|一丝不苟",
-    "报国":   "报国|航天梦|强军|为国铸剑|奉献|忠诚"
-}
+LEX = TIMELINE_LEX["航天军工"]   # 词典统一写在 词典.py，与其他图表一起登记
 
 # ---------- 2. 工具函数 ----------
-def read_docx(path):
-    doc = Document(path)
-    return [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-
-def sent_cut(text):
-    return [s.strip() for s in re.split(r'[。！？；]', text) if s.strip()]
-
-def lexicon_score(sentence):
-    scores = []
-    for dim, pattern in LEX.items():
-        hits = len(re.findall(pattern, sentence))
-        scores.append(min(hits / 3, 1.0))   # 归一化到 0-1
-    return scores
+def lexicon_matrix(corpus):
+    """小句 × 六维 的 float32 得分矩阵：计数取自全语料命中表（融合分析），不再逐句扫描"""
+    hits = load_fused(corpus).alternation_counts("航天军工", LEX.values())
+    return np.minimum(hits.astype(np.float32) / 3, 1.0)   # 归一化到 0-1
 
 # ---------- 3. 画图 ----------
 def plot_timeline(df):
@@ -65,18 +50,15 @@ def plot_timeline(df):
 
 # ---------- 4. 主流程 ----------
 def main():
-    if not os.path.exists("航天军工.docx"):
-        print("❌ 请将「航天军工.docx」放在当前目录再运行！")
+    corpus = load_corpus()
+    if "航天军工" not in corpus:
+        print("❌ 请将「航天军工.docx」放在 原文本数据文件 目录再运行！")
         return
-    paragraphs = read_docx("航天军工.docx")
-    sentences  = []
-    for p in paragraphs:
-        sentences.extend(sent_cut(p))
+    # 按段落切成小句（[。！？；]），直接从 mmap 语料按偏移取出
+    sentences  = list(corpus.clauses("航天军工"))
     print(f"共切分 {len(sentences)} 句，开始打分...")
-    df = pd.DataFrame(sentences, columns=["sentence"])
-    lex_scores = df["sentence"].apply(lexicon_score)
-    for idx, dim in enumerate(LEX.keys()):
-        df[dim] = [v[idx] for v in lex_scores]
+    df = pd.DataFrame(lexicon_matrix(corpus), columns=list(LEX.keys()))
+    df.insert(0, "sentence", sentences)
     df.to_csv("aerospace_6d.csv", index=False, encoding="utf-8-sig")
     plot_timeline(df)
     print("✅ 完成！文件：sentiment_timeline_final.png | aerospace_6d.csv")
@@ -5,100 +5,118 @@ import matplotlib
 matplotlib.use('TkAgg')  # 强制使用TkAgg后端
 import matplotlib.pyplot as plt
 import os
-from docx import Document
+from 语料库 import load_corpus
+from 关键词匹配 import count_groups
+from 故事切分 import StoryRecord, doc_record, load_story_index
+from 融合分析 import story_density
+from 词典 import RADAR_KEYWORDS
 import warnings
 warnings.filterwarnings('ignore')
 
 # ===================== 基础配置 =====================
 WORK_DIR = 'E:\\'
-os.makedirs(WORK_DIR, exist_ok=True)
-os.chdir(WORK_DIR)
 
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 plt.rcParams['xtick.major.pad'] = 15  # 增加刻度标签与轴的距离
 
-print("=" * 70)
-print("          航天军工领域大国工匠情感分析系统（最终运行版）          ")
-print(f"当前工作目录：{os.getcwd()}")
-print("=" * 70)
-
 
 # ===================== 核心函数 =====================
-def extract_stories(text):
+KNOWN_CRAFTSMEN = [
+    "常晓飞", "曹彦生", "崔蕴", "顾春燕", "龙建军", 
+    "阎敏", "张舸", "郑兴", "韩利萍", "王曙群",
+    "洪家光", "胡双钱", "高凤林", "徐立平", "卢仁峰",
+    "巩鹏", "方文墨", "李世峰", "李志强"
+]
+SOURCE_MARKERS = ['来源：', '编辑：', '责任编辑：', '原标题：']
+# 文章原文存放在 原文本数据文件/工匠故事/航天军工/，运行时才从语料库读取
+STORY_DOC = '工匠故事/航天军工/事迹合集'
+DIMENSIONS = ['技术难度', '创新程度', '投入程度', '成就高度', '影响广度']
+# 各维度关键词写在 词典.py，与图表词典一起登记；语料里的故事直接从融合命中表计数
+KEYWORD_GROUPS = RADAR_KEYWORDS['航天军工']
+# 超过这个字数的文本按滑动窗口取各维度的密度峰值（原先是截断到前 10000 字再算整体密度）
+DENSITY_WINDOW = 10000
+
+
+def is_story_heading(line, name):
+    """以「姓名：」「姓名，」开头、整行就是姓名，或含姓名的短行，视为新故事开始"""
+    return (line.startswith(f"{name}：") or line.startswith(f"{name}，") or
+            line == name or (len(line) <= len(name) + 5 and name in line))
+
+
+def clean_heading(heading, name):
+    """标题行去掉姓名和冒号、逗号，作为正文第一行"""
+    return heading.replace(name, '').replace('：', '').replace('，', '').strip() if heading != name else ''
+
+
+def is_source_line(line):
+    return any(keyword in line for keyword in SOURCE_MARKERS)
+
+
+def extract_stories(corpus, doc=STORY_DOC):
+    """按姓名切分事迹合集 → StoryRecord 列表（只记语料偏移，正文用 story.text 按需解码）"""
     stories = []
-    lines = text.split('\n')
-    KNOWN_CRAFTSMEN = [
-        "常晓飞", "曹彦生", "崔蕴", "顾春燕", "龙建军", 
-        "阎敏", "张舸", "郑兴", "韩利萍", "王曙群",
-        "洪家光", "胡双钱", "高凤林", "徐立平", "卢仁峰",
-        "巩鹏", "方文墨", "李世峰", "李志强"
-    ]
-    current_name = None
-    current_content = []
     collected_names = set()
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        name_match = next((name for name in KNOWN_CRAFTSMEN if 
-                          line.startswith(f"{name}：") or line.startswith(f"{name}，") or 
-                          line == name or (len(line) <= len(name) + 5 and name in line)), None)
-        if name_match:
-            if current_name and len('\n'.join(current_content)) > 100 and current_name not in collected_names:
-                stories.append({'name': current_name, 'content': '\n'.join(current_content)})
-                collected_names.add(current_name)
-            current_name = name_match
-            current_content = [line.replace(current_name, '').replace('：', '').replace('，', '').strip() if line != current_name else '']
-        elif current_name and not any(keyword in line for keyword in ['来源：', '编辑：', '责任编辑：', '原标题：']):
-            current_content.append(line)
-    
-    if current_name and len('\n'.join(current_content)) > 100 and current_name not in collected_names:
-        stories.append({'name': current_name, 'content': '\n'.join(current_content)})
+    # 切分结果持久化在语料库旁，语料和名单不变时直接读索引
+    index = load_story_index(corpus, doc, KNOWN_CRAFTSMEN, is_story_heading, head=clean_heading, skip=is_source_line)
+    for story in index:
+        if len(story.text) > 100 and story.name not in collected_names:
+            stories.append(story)
+            collected_names.add(story.name)
     
-    if not stories and len(text) > 500:
-        stories.append({'name': '航天军工工匠群体', 'content': text[:10000]})
+    if not stories:
+        # 切不出故事时整篇作为一段，全文参与打分（长文本由 score_stories 按窗口取密度峰值）
+        record = doc_record(corpus, doc, '航天军工工匠群体')
+        if len(record.text) > 500:
+            stories.append(record)
     
     print(f"✅ 提取到 {len(stories)} 位工匠故事（已去重）")
     return stories
 
 
-def calculate_dimension_scores(text):
-    text_len = len(text)
-    if text_len < 50:
-        return [0.3, 0.3, 0.3, 0.3, 0.3]
-    
-    # 技术难度
-    tech_keywords = ['数控', '焊接', '铆接', '微米', '毫米', '精度', '密封', '喷管', '雷达', '导弹', '火箭', '飞船', '异形', '薄壁', '零公差']
-    tech_score = min((sum(text.count(w) for w in tech_keywords) / (text_len / 1000)) * 1.2, 1.2)
-    
-    # 创新程度
-    innov_keywords = ['创新', '发明', '专利', '改进', '突破', '新工艺', '数字化', '自主研发']
-    innov_score = min((sum(text.count(w) for w in innov_keywords) / (text_len / 1000)) * 1.3, 1.2)
-    
-    # 投入程度
-    commit_keywords = ['刻苦', '苦练', '钻研', '坚守', '日夜', '加班', '数十年', '一辈子', '精益求精']
-    commit_score = min((sum(text.count(w) for w in commit_keywords) / (text_len / 1000)) * 1.4, 1.2)
-    
-    # 成就高度
-    achiev_keywords = ['全国五一劳动奖章', '大国工匠', '国家科技进步奖', '神舟', '长征', '航母', '阅兵', '100%合格率']
-    achiev_score = min((sum(text.count(w) for w in achiev_keywords) / (text_len / 1000)) * 1.3, 1.2)
-    
-    # 影响广度
-    impact_keywords = ['国家', '国防', '航天强国', '报国', '自主可控', '国家安全', '领空安全']
-    impact_score = min((sum(text.count(w) for w in impact_keywords) / (text_len / 1000)) * 1.3, 1.2)
+def load_stories(corpus):
+    """五行业统一分析入口用：从已加载的语料库取故事"""
+    return extract_stories(corpus)
+
+
+def story_hits(stories, corpus=None):
+    """故事 × 五个维度 的命中前缀和：给了 corpus 时取自融合命中表，否则扫描各篇正文"""
+    return story_density(stories, *KEYWORD_GROUPS.values(), corpus=corpus)
+
+
+def score_stories(density, with_hits=False, window=DENSITY_WINDOW):
+    """
+    命中前缀和（story_hits）→ N×5 维度分数矩阵；with_hits 时同时返回（全文）命中数矩阵
+    不超过 window 字的文本按全文每千字命中数打分，
+    更长的文本按 window 字滑动窗口取各维度的密度峰值，全文都参与、不截断。
+    """
+    counts = density.totals()
+    text_len = (density.spans[:, 1] - density.spans[:, 0]).astype(np.float64)[:, None]
     
-    return [max(score, 0.3) for score in [tech_score, innov_score, commit_score, achiev_score, impact_score]]
+    # 各维度系数：技术难度、创新程度、投入程度、成就高度、影响广度
+    weights = np.array([1.2, 1.3, 1.4, 1.3, 1.3])
+    short = text_len < 50
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_k = counts / (text_len / 1000)
+    for i in np.flatnonzero(text_len[:, 0] > window):
+        per_k[i] = density.peak_density(*density.spans[i].tolist(), window)
+    scores = np.minimum(per_k * weights, 1.2)
+    # 不足 50 字的文本各维度都记 0.3
+    scores = np.where(short, 0.3, np.maximum(scores, 0.3))
+    return (scores, counts) if with_hits else scores
+
+
+def calculate_dimension_scores(text):
+    return score_stories(story_hits([StoryRecord.from_text(None, text)]))[0].tolist()
 
 
-def create_radar_chart(stories):
+def create_radar_chart(stories, scores=None):
     if not stories:
         print("❌ 无有效故事，无法生成雷达图")
         return
     
-    dimensions = ['技术难度', '创新程度', '投入程度', '成就高度', '影响广度']
+    dimensions = DIMENSIONS
     n_dim = len(dimensions)
     angles = np.linspace(0, 2 * np.pi, n_dim, endpoint=False).tolist()
     angles += angles[:1]  # 闭合雷达图
@@ -110,13 +128,18 @@ def create_radar_chart(stories):
     colors = ['#1E88E5', '#26A69A', '#EF5350', '#FFA726', '#9C27B0',
               '#5C6BC0', '#26C6DA', '#66BB6A', '#FF7043', '#AB47BC']
     
+    # 每篇故事只打一次分（main 里已算好时直接复用）
+    if scores is None:
+        scores = score_stories(story_hits(stories[:10]))
+    all_scores = scores[:10]
+    
     # 左侧子图：各工匠对比
     ax1 = fig.add_subplot(121, polar=True)
     for i, story in enumerate(stories[:10]):
-        scores = calculate_dimension_scores(story['content'])
-        ax1.plot(angles, scores + scores[:1], 'o-', linewidth=2.2, 
-                label=story['name'], color=colors[i % len(colors)], markersize=4.5)
-        ax1.fill(angles, scores + scores[:1], alpha=0.12, color=colors[i % len(colors)])
+        closed = all_scores[i].tolist() + all_scores[i, :1].tolist()
+        ax1.plot(angles, closed, 'o-', linewidth=2.2, 
+                label=story.name, color=colors[i % len(colors)], markersize=4.5)
+        ax1.fill(angles, closed, alpha=0.12, color=colors[i % len(colors)])
     
     # 维度文字对齐优化（核心修复）
     ax1.set_xticks(angles[:-1])
@@ -139,7 +162,6 @@ def create_radar_chart(stories):
     
     # 右侧子图：平均值+波动
     ax2 = fig.add_subplot(122, polar=True)
-    all_scores = [calculate_dimension_scores(s['content']) for s in stories[:10]]
     avg_scores = np.mean(all_scores, axis=0)
     std_scores = np.std(all_scores, axis=0)
     
@@ -189,24 +211,24 @@ def analyze_sentiment(text):
     positive_words = ['成功', '创新', '突破', '荣誉', '精湛', '报国', '航天梦', '零缺陷', '精益求精']
     challenge_words = ['困难', '难题', '复杂', '艰苦']
     
-    pos_count = sum(text.lower().count(w.lower()) for w in positive_words)
-    chal_count = sum(text.lower().count(w.lower()) for w in challenge_words)
+    pos_count, chal_count = count_groups(text, positive_words, challenge_words, ignore_case=True)
     
     total = pos_count * 1.5 + chal_count * 0.5
     sentiment_score = (pos_count * 1.5) / total if total > 0 else 0.7
     return round(sentiment_score, 3), pos_count, chal_count
 
 
-def export_results(stories):
+def export_results(stories, scores=None):
+    if scores is None:
+        scores = score_stories(story_hits(stories))
     results = []
-    for story in stories:
-        sent_score, pos_count, chal_count = analyze_sentiment(story['content'])
-        tech, innov, commit, achiev, impact = calculate_dimension_scores(story['content'])
+    for story, (tech, innov, commit, achiev, impact) in zip(stories, scores.tolist()):
+        sent_score, pos_count, chal_count = analyze_sentiment(story.text)
         
         sentiment = '非常积极' if sent_score > 0.85 else '积极' if sent_score > 0.7 else '中性'
         results.append({
-            '工匠姓名': story['name'],
-            '事迹长度': len(story['content']),
+            '工匠姓名': story.name,
+            '事迹长度': len(story.text),
             '情感倾向': sentiment,
             '情感分数': sent_score,
             '积极关键词数': pos_count,
@@ -226,574 +248,35 @@ def export_results(stories):
 
 # ===================== 主程序（完整逻辑） =====================
 def main():
-    # 嵌入文档内容（已处理引号冲突）
-    content = """数控铣工常晓飞：锻造毫米之间的绝技
-
-中工网
-
-2024-05-06 13:33
-
-关注
-
-原标题：
-
-数控铣工常晓飞：锻造毫米之间的绝技
-
-人民政协报融媒体记者 周佳佳 宋宝刚 徐康辉
-
-暮春的北京西南郊，花木清芬，坐落在丰台区的中国航天科工二院283厂内一片忙碌的景象。
-
-办公区一楼大厅，一面以星空为底色的巨幅标语墙上，习近平总书记的重要指示——“探索浩瀚宇宙，发展航天事业，建设航天强国，是我们不懈追求的航天梦”异常醒目。
-
-“我们处在技能工作一线，就像螺丝钉一样为我国的航天事业做着自己的贡献，虽然默默无闻，但内心很自豪。”中国航天科工二院283厂高级技师常晓飞在接受记者采访时这样感慨。
-
-常晓飞，283厂的一名数控铣工，擅长航天硬脆材料结构件、精密及薄壁易变形复杂结构件、复合材料结构件的加工，是数控精密加工专业的“行家里手”。“简单地说，就是操作数控机床，根据设计师的图纸，变成一个个实实在在的产品。”常晓飞说道。
-
-常晓飞的拿手绝技，便是数控微雕技术。这是一种什么样的技术？又有多“微”？
-
-“绝技”和两个标杆一样的数据紧密联系在一起——0.03毫米和0.15毫米。他介绍了2020年参加第一届全国职业技能大赛时的两件参赛作品：第一件作品，是在一个直径0.15毫米的金属棒上刻了“中华绝技”四个字，这个字的深度只有0.03~0.04毫米；第二件作品，是在直径将近200毫米的金属盘上，做了一个中国地图的图案。地图的外轮廓全部是通过微孔加工技术完成的，这些微孔的直径是0.03毫米，相当于人的头发丝的1/3。
-
-正是凭着这一手绝技，常晓飞的作品在近200个参赛作品中脱颖而出，获得“最受欢迎的中华十大绝技”。
-
-进入283厂16年来，凭着刻苦钻研的精神，常晓飞锤炼出一身过硬的本领，攻克了多个复杂产品零部件加工难题。也正是凭借这身过硬的本领，让他收获了不少荣誉：全国五一劳动奖章、全国技术能手、第六届全国数控技能竞赛职工组第一名……现在，不少人见了常晓飞都喊他“常大师”。
-
-常晓飞坦言，最让他感慨的是283厂人才、技术“传帮带”的培养机制和“以赛带培”的人才激励机制。“幸运的是，我刚到283厂，就成为了大国工匠曹彦生的徒弟。在师傅严厉的教导下，我的技能得到了快速提升，攻克了很多技术难题，也承担了很多重要的任务。”
-
-2016年，马景来、曹彦生、常晓飞、曹彦文四代师徒薪火相传的报国故事，在央视《焦点访谈》播出，引发了广泛讨论和热议，这让越来越多的人认识了常晓飞，了解什么是大国工匠和工匠精神。
-
-在常晓飞看来，工匠精神更像是一种态度，是每个人在对待自己工作中的一直执着认真、精益求精的态度。“不管是普通零件也好，重要零件也好，每一个零件都会做到精益求精，追求极致。希望我经手的零件或产品，能在一些比较重要的领域发挥它的最大效能。”
-
-采访的前一天，4月25日20时59分，搭载神舟十八号载人飞船的长征二号F遥十八运载火箭在酒泉卫星发射中心成功发射，航天员叶光富、李聪、李广苏乘神舟、赴太空。
-
-“虽然这一幕在中国载人航天的历史上已经多次上演，但是每次看直播我都无比振奋。同为‘航天人’，这种‘特别能吃苦、特别能战斗、特别能攻关、特别能奉献’的载人航天精神一直激励着我在自己的岗位上精益求精、追求卓越。未来，我会继续撸起袖子加油干，同时做好传、帮、带工作，帮助更多年轻同志成长、成才。”常晓飞坚定地说。
-
-来源：人民政协报
-
-收获诸多荣誉的曹彦生 在数控铣工领域学习的步伐始终不停
-
-来源：工人日报 | 2024年07月22日 15:26
-
-原标题：博士铣工
-
-　　曹彦生正在确认零件制作精度。受访者供图
-
-　　让常晓飞想不明白的是，毕业于同一所职业技术学校，同样是数控铣工岗位，眼前这位仅比自己大4岁的学长、师傅，怎么就一步步读到北京航空航天大学博士。为对标先进，他总结出一些原因：“师傅不仅专业能力强，学习能力也强，爱学习、肯学习、能学习。”
-
-　　常晓飞口中的师傅，是全国五一劳动奖章获得者、中国航天科工集团有限公司二院二八三厂精密制造车间主任曹彦生。自2005年进厂后，从普通车床到数控车床，再到智能制造单元，在生产线上成长起来的曹彦生获得过多项技术成就，带出许多徒弟，也从未停止在数控铣工领域拜师学艺的步伐。
-
-　　“产业工人也可以是高学历的，并不是读了博士就不当工人了。”在曹彦生看来，提升学历是产业工人顺应发展新质生产力的途径之一，更重要的是将经验和书本知识融会贯通，用于提高生产技能，为我国航天科技事业降本增效贡献力量。
-
-　　带着问题回校园
-
-　　“读博时的第一堂课让我毕生难忘。”回想起2022年博士生入学时的场景，曹彦生的语气变得兴奋起来。
-
-　　曹彦生坦言，自己是职业技术学校出身，而北航的同学大多是985、211高校毕业，学历的差距让他一开始有些自卑。“但当我站起来说我是航天人时，大家投来羡慕的目光，听完我的经历后纷纷鼓掌。”曹彦生说，同学们从来没有因为学历低而看不起他，反而非常佩服他的勇气和坚持，“从那时起，我更加自信，学习也更有动力。”
-
-　　同学们的掌声与曹彦生这些年在岗位上的埋头苦干密切相关。作为航天科工领域数控铣工，其职责就是根据下发的设计图纸调试数控设备参数，把纸上的模型做成满足工业需要的实物。同时，他所负责的车间还承担着首件生产的重要任务，为后续多件生产确定最终方案。
-
-　　在处理这些任务时总会有各种问题冒出。“我们经常遇见的问题是设计图纸的部分结构在生产中实现成本很高，未考虑到设备加工的局限性，所以需要技术工人吃透模型图纸，沟通设计需求，寻求更优化的设计。”曹彦生说，这不仅考验技术工人的经验储备，也驱动着大家多研究先进生产工艺。
-
-　　带着这些年来在生产线上遇到的诸多困惑，曹彦生申请就读先进制造专业博士学位。曹彦生欣喜地发现，以往积累的实操经验让他更容易理解课堂上讲到的原理，加深了对理论的认知。
-
-　　“重新回到学校，解决具体生产难题的经历让我对读书有了不同的想法。”曹彦生说，师兄弟们还经常在一起讨论，分享国内外研究进展和前沿的科技信息，这位数控铣工“老前辈”以“新学生”的身份再次畅游学海。
-
-　　生产线上“啃硬骨头”
-
-　　刚进厂时，曹彦生已有全国数控大赛前十名的成绩，这让他起初有些心浮气躁。“当时我每天要重复大量的飞平面工作，结果一次操作中输错符号，高速旋转的刀具直接切到工作台上面，一下子不知该如何面对师傅。”曹彦生说。
-
-　　师傅马景来得知徒弟曹彦生的失误后，一改严师态度，心平气和地与他交流。“师傅说，万丈高楼平地起，只有将最基本的技能掌握好，才能在急难险重的任务中不出错。”这次经历让曹彦生体会到数控技术“失之毫厘差之千里”的重要性，摆正心态，踏踏实实地在生产线上“啃硬骨头”。
-
-　　在“啃硬骨头”的过程中，曹彦生练就拿手好戏。空气舵号称导弹的翅膀，由于面积大、结构复杂、厚度薄，控制形变和对称度难度极大，许多师傅都因超差而加工失败。他主动请缨，从分析超差产生的原因、材料的特点等方面入手，用数控机床精雕细琢，最终加工出来的舵面对称度达到0.02毫米的超高精度。
-
-　　曹彦生还发明了“高效圆弧面加工法”等绝技，让铝合金浮在水面、让鲁班锁天衣无缝等加工精度更是不在话下。对此，常晓飞举例说：“随机给他一颗花生，从观察、建模、编程、仿真到最终加工成型，两个小时就能搞定。”
-
-　　24岁成为高级技师，25岁获评全国技术能手，26岁成为北京市金牌教练，36岁获评“航空航天月桂奖·大国工匠奖”……进厂近20年，曹彦生从公司的学历提升选拔推荐人选中脱颖而出，走上攻读博士学位之路。
-
-　　学成归来助力转型升级
-
-　　带着问题去读博，这段经历给曹彦生带来比解决具体问题更大的收获：掌握解决问题的方法体系。他说：“130多页的毕业论文，写作上并不难，难的是要把这一套东西想通，让人受益的是独立完成提出问题、搜集资料、验证假设、分析结论等过程。”
-
-　　曹彦生认为，完成学历提升并不意味着脱离工人身份，反而是新时代产业工人更应该具备的素质。
-
-　　“数控铣工的工作性质决定了其经验往往滞后于问题的出现，但产品的生产需求越来越高，如果还停留在旧有的经验上就无法解决新问题。”曹彦生说，成熟的技术工人不仅要把产品做出来，还要知道它背后的机理、成因，从而形成一套可复制的方法来提升整体生产水平，这是时代发展对技术工人提出的必然要求。
-
-　　为此，曹彦生近年来在经验数字化方面花费不少心思。他介绍，经验数字化就是将高技能人才的绝技绝活通过量化的指标根据产品的需求进行数字化编程，复刻出具有同样水平的数字高技能人才，实现生产作业过程中手工替代。例如在紧固螺钉时，因产品结构问题既要满足固定作用，又不能产生扭矩过大而导致产品变形，过去只能凭借技术工人用手感来控制，如今可以利用旋拧机器人代替人工解决问题。
-
-　　走进二八三厂的大型构件生产车间，各类自动化生产机器运转不停，学成归来的曹彦生满心都是将所学用于这些机器的期待。“发展新质生产力呼唤更多产业工人向‘新’而行。”曹彦生说。
-
- 编辑：苏璇 责任编辑：刘亮
-
-崔蕴：新一代运载火箭总装负责人
-
-2020-05-07 08:40:58　来源：央视新闻客户端
-
-【大国工匠】
-
-他痴迷火箭40年
-
-从一名普通的火箭装配工成长为国家级技能大师
-
-每一次火箭发射
-
-他总是最后一位从发射塔架上下来的人
-
-只有经过他最后检查确认无误之后
-
-火箭才能够点火
-
-凭借着严谨、忠诚
-
-他培养出了一支过硬的队伍
-
-一起走近中国新一代运载火箭总装负责人崔蕴
-
-　　今年58岁的崔蕴，共参与总装过七十多发不同型号的火箭，可2016年在他第一次接到总装长征五号遥一任务的时候，却不知从何下手。
-
-　　长征五号总长57米，直径5米，是新一代超大型火箭。如果按照传统的操作法，使用梯子或者把火箭箭体安装在滚轮上转动起来，工人就可以实施组装。可长五的二级箭体非常特殊，是异形结构，最大的直径5米，最小的3.35米，而箭体里需要安装四万多个精密的仪器和配件，如果把滚环直接固定在箭体两侧的边框上，不仅会头重脚轻无法实施，更会对箭体造成损伤。
-
-　　航天科技集团一院天津总装测试车间首席技师 崔蕴：火箭箱子里要装很多东西，所以说人在里头干活也一样，人只能够到这个扇面，上头五米高我肯定够不着。所以说人在里头操作，我这产品要转起来，以解决人在里面的可达性。
-
-　　让异形箭体安全平稳地转起来，站在地面就可操作成了唯一的目标。那段时间，老崔每天查资料、找办法。无意间路边的自行车让他灵机一动，能不能把滚环像自行车的车轮一样，在箭体边框再延伸出一个大的滚环，使箭体两边的直径大体相同呢？
-
-　　航天科技集团一院天津总装测试车间首席技师 崔蕴： 由直径3.35米逐步地引出，引到了直径4米多这个环上，引到4米多的环就可以了。
-
-　　在二级箭体3.35米的一侧，把边框和延伸出来的外环通过连接板连接在一起，使两侧的直径大体相同，达到平衡，这似乎是个不错的主意。可新型火箭为了减轻自重，箭体边框采用的是铝合金结构，单点受力的强度不够，无法承受连接板的着力。
-
-　　航天科技集团一院天津总装测试车间首席技师 崔蕴：长征五号所有螺钉、螺帽在拧紧的时候都有力矩的要求。通过震动、温度什么这种环境加上，在地面反复验证试验，模拟空中飞行然后得出来的这些数据。
-
-　　二级箭体上有隔热层、发动机、真空导管等精密设备，就连拧一颗小小的螺丝钉，都不能丝毫马虎，更何况把这样大的连接板拧在边框上。经过无数次地修改和实验，崔蕴终于找到了一个绝妙的方法。他借助火箭边框有限的空隙和可以着力的地方，安装了一块加强钢板，然后再把连接板固定在这块加强板上。
-
-　　最终，长征五号二级火箭，被8组加强板，24块连接板和两个超强力滚环牢牢地固定在滚转架车上，如同箭体两端安装了两个车轮，实现了全新式自动滚装，多人多点同时在地面操作，提前两个月完成了长五遥一的总装任务。
-
-　　航天科技集团一院天津总装测试车间首席技师 崔蕴：因为中国的航天是要发展的，将来中国航天的下一代火箭是9.5米，10米级的。我要蹚出这一条路。为咱们国家下一代火箭奠定一个良好的基础。
-
-　　当肩负着探火、探月、空间站建设等重大航天工程任务的长征五号飞上太空时，崔蕴和他的团队已经在向着我国航天事业的下一个目标进发。
-
-大国工匠顾春燕：巧手点亮雷达之眼
-
-2019-05-01 11:46:48
-
-　　用比头发丝还细的金线，将芯片与外部电路连通，这种工艺被称为金线键合。
-
-　　和传统意义上的焊接不同，这种工艺通过针尖的超声震动，使得金线与焊盘形成分子间连接来达到微焊接目的，全部流程必须在显微镜下完成。
-
-　　在中国电科第十四研究所就有这样一位女工艺师，她用自己的一双巧手，串连起我国最尖端雷达的核心。
-
-　　一克黄金，拉出10微米直径、661米长的金线，这大概是一根头发丝的8分之1粗细，用这样的金线来键合雷达收发组件，没有机器可以完成，只有靠人。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：稍微挂一点点，它在那儿荡啊荡啊，风一吹它就在那儿摆。我还跟设计师吵架，我说你们天天搞这种东西，我们这没办法干。
-
-　　这种对芯片的极致要求来自于太赫兹雷达，它是未来战场上对动态目标探测成像的杀手锏，它的极高频率，要求芯片内部器件之间的间隔必须呈几何倍数缩小，同样，用来连接器件的金丝也必须细到极限。
-
-　　顾春燕需要把组装的不可能变成可能。这场焊接不用焊枪，没有火星，高倍显微镜下六万赫兹的震动频率，通过她右手的触碰，将中国最尖端雷达设备的收发组件一点点串起。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：人家是大江大河上造桥，我们是在那么一点点小的空间里面造桥。
-
-　　2007年，顾春燕技校毕业进了中国电科十四所。那时所里刚开始搞微组装，为了练技术，她甚至会用尺子反复测量手腕抬起的高度，只为了键合时能让金线的拱起的弧度一致。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：你特别想做一件事情的时候你是喜欢它。有些试验件它没有成型之前，各种这样拐那样拐，各种交叉，技能就是这样锻炼起来的。
-
-　　也就在那一年，脱颖而出的顾春燕领到了一把编号1的小镊子，和9个同事装起了中国第一部星载相控阵雷达中的上千个组件。十多年过去了，镊子闪亮如新，而大块头组件，变成了指尖的小方格。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：它有四个通道，十几层，每一层都有正面反面，每一层里面的器件密密麻麻的，几乎没有什么距离。
-
-　　这样的距离不是毫厘之间，而是以微米来计算。2014年春天，高分三号卫星研制到了关键阶段，这是我国首颗分辨率达到1米的C波段多极化微波遥感卫星，每平方厘米的收发组件上，装配密度超过了一万个点，这给键合工序出了大难题，哪怕在操作中产生5微米的误差，都会造成芯片短路。
-
-　　中国电科十四所高级工程师 胡永芳：设计是新设计，里面的器件也是当时自主可控、刚突破完的，用的新器件，我们的新工艺，当时给我们的提供的器件也就是那三五片。
-
-　　没有人敢操作的事情，顾春燕站了出来，试装过程中，她创造性地将劈刀打薄并旋转90度安装，将芯片倾斜15度角顺利键合。然而兴奋并没持续多久，大家在整机测试时发现，雷达讯号比预计的要微弱。
-
-　　改制芯片起码需要半年，会极大拖延研制进度，错过发射窗口期，经过反复论证，唯一可行的方法只有再次通过键合工序，将已经连好的上千根线条当中的一条割断，连接到另一枚器件上。这样的改动是破天荒第一次，一旦割错或者割伤别的线条，芯片就会立刻报废。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：真的不能错一步。就那一瞬间，心都吊在嗓子头。
-
-　　这是一场雷达的“心脏搭桥手术”，顾春燕把现场15微米的硬质针头，用酸微腐蚀方法变细作为自己的“手术刀”。几分钟后，她站了起来。
-
-　　中国电科十四所高级工程师 胡永芳：就这么一个站的动作，大家已经就是往她那边拥了，就一个一个去显微镜下要给她再三确定，确定她的东西好的，那个时候就整个我们的房间，净化厂房就沸腾了。
-
-　　2016年8月，搭载着“超级透视眼”的高分三号卫星成功发射，从此，穿过雷雨、浓雾，我国卫星遥感水平实现了新的跨越。
-
-　　作为十四所微组装首席技能专家，顾春燕担负起了所有研制性产品的首件全流程作业任务。从我们的航母和驱逐舰上的“海之星”，到新一代战机火控雷达，一枚枚中华神盾捍卫着祖国的国防安全，一双双战鹰之眼在顾春燕的手中被轻轻点亮。
-
-　　中国电科十四所雷达收发组件总装师 顾春燕：刚到十四所的时候，就知道是报效祖国的，干的时间越来越长，才知道我们做的这些产品，真的是越来越了不起。我们国家自己的设计师独立设计，我们用我们自己的工艺来组装它。这是我们的自豪感，也是责任感。
-
-　　（央视记者：肖璞 岳群 盛洁 王海东 张昊 李娟 宋亮 张博）
-
-来源：央视新闻客户端编辑：朱晶晶
-
-大国工匠龙建军：拒绝“差不多” 木匠竟成了“猎鹰”教练机装配顶尖高手
-
-2019-05-03 12:37:49
-
-　　央视网消息：近几年，中国的战斗机实现了更新换代。战斗机性能更好了，飞行员的培养就成为了关键问题。航空工业洪都研制生产的“猎鹰”L15（幺5）高级教练机，就是为培养先进战机飞行员研制的。今天的大国工匠，我们一起来认识在猎鹰L15高级教练机的生产过程中，专门“攻坚克难”的铆工龙建军。
-
-龙建军的工具
-
-　　龙建军铆接的猎鹰L15高级教练机边条翼有上千颗铆钉，每一颗的加工误差都不能超过0.1毫米。在洪都有一个说法：“枪枪都是机动性，颗颗关乎长寿命”，指的就是每一次铆枪的打孔，都可能影响飞机的机动性能；而每一颗螺栓的连接，也都跟飞机的使用寿命相关。
-
-　　航空工业洪都飞机部装铆工 龙建军：每一个铆钉都发挥它的作用，都是有机动性的，每一个铆钉都有承受的力不一样的，强度都是经过计算的。
-
-　　航空工业洪都 飞机部装一厂技术主任 刘鹤：龙师傅每一次简单地钻一个小孔也好，我觉得他就是他操作也好，思维方式也好，就跟教科书一样的，那么完美极致。
-
-　　上千颗铆钉，龙建军铆接的每一颗都能做到零公差。完美的加工，充分实现了边条翼设计的目标。边条翼设计不仅减小了飞行的阻力，还能增加飞机在大迎角飞行时的爬升力，改善飞机瞬时转弯的机动性能。
-
-　　同事们眼中做事完美极致的龙建军，其实入行前是在老家做木匠的。1996年招工进厂以后，他只上过两年技校。刚进厂时，因为铆枪跑枪打坏了零件，他没少挨师傅的骂。
-
-　　航空工业洪都飞机部装铆工 龙建军：看同事师兄他们做得那么好，我怎么就打不好呢？我肯定是要多练嘛，多花点工夫我相信肯定也能做好，人家为什么做得好，我为什么做不好呢？
-
-　　龙建军于是下了狠劲儿，师傅要求徒弟们上下午各铆接一块废品件，大约四、五十个铆钉。但是龙建军要求自己每天要打六、七百个铆钉，是同伴们的十多倍。休息时间，他还喜欢去别的车间看其它工种的工人怎么操作。
-
-　　航空工业洪都飞机部装铆工 龙建军：主动的话你这个心态肯定就好了，假如你被动去学，人家叫着你去学的话，你肯定就不爽嘛，所以说一个心态是关键。
-
-　　三年多的主动学习和刻苦训练，让龙建军脱颖而出，成为破解飞机装配疑难杂症的高手。在猎鹰L15教练机研制过程中，前风挡跟机身的装配是个难点。前风挡部件跟机身通过116个螺栓连接。这些螺栓在加工时，要满足同轴度精度达到0.25毫米的装配要求。如果一个孔偏差0.1毫米，100个孔的同轴度就会偏离10毫米，导致前风挡跟机身装配时发生错位。当时，有两个孔因为加工不当造成了二次打孔，使得整个前风挡报废，造成了80多万元的经济损失。如果再找不到合适的加工方法，不但影响飞机质量，也会耽误生产进度。面对压力，龙建军临危受命。他用一周的时间了解飞机的结构、查找装配错位的原因，构思破解难题的方案。
-
-　　航空工业洪都飞机部装铆工 龙建军：睡不着，反正是就是躺到床上，这个事挺是一桩事反正是，在脑子里不停地过，脑子里老是想这个问题，想把这个问题更好地解决，反正三四点钟才合眼吧。
-
-　　通过反复思考、实验，龙建军设计加工出了一套由三个模具组成的样板。
-
-　　航空工业洪都飞机部装铆工 龙建军：那个样板装到前风挡上面，把它复制出来，通俗一点讲，就跟我们复印机复印身份证一样。
-
-　　通过样板把前风挡上116个孔的位置“复印”到飞机机身上，不仅确保了产品的装配质量，也将装配的效率提高了4倍。
-
-　　航空工业洪都飞机部装一厂技术主任 刘鹤：龙师傅思考问题的时候，从来都是以一个新颖的角度去思考问题，就是碰到问题碰到困难的时候，他从来都是想怎么用最好的方式 最高的质量能够满足把这个活干完，这种创新意识已经深入他自己的骨髓了。
-
-　　龙建军有个两岁多的小孙子，在家里，他是慈爱的爷爷。这个木马玩具，就是他亲手为小浩天做的。龙师傅在家也是个“小能手”，这些不锈钢的厨具，都是他亲手打造。只是他把追求完美的习惯也带回了家里，这让爱人很是恼火。
-
-　　龙建军的妻子 罗萍芳：弄菜都是这样的。他喜欢什么东西都又好看、又好吃，色香味俱全。做什么事都是这样的，要就不做，要就做最好，好认真。我讲差不多就可以了，他也不会听我的。
-
-　　改掉一切“差不多”的习惯，坚持完美，让龙建军从一个普通的木匠，成长为今天教练机装配的顶尖高手。
-
-　　龙师傅参与生产的洪都K8教练机出口埃及，并在当地建成了生产线，如今，第三代教练机猎鹰L15出口到了赞比亚，还经常在国内外的航展上惊艳亮相。
-
-　　航空工业洪都飞机部装铆工 龙建军：太不可思议了，飞机能够做180度旋转的动作，确实是不容易，我们铆接工人也为教练机的制造出了一份力，我感到非常自豪和骄傲。
-
-来源：央视网编辑：孙仕奇
-
-大国工匠 | 阎敏：导弹“咽喉主刀师”
-
-来源：央视新闻客户端2022-05-04 11:07
-
-　　“大国工匠”
-
-　　原标题：
-
-　　阎敏：导弹“咽喉主刀师”
-
-　　央视新闻客户端消息（新闻联播）：今天（5月3日）的《大国工匠》，我们来看航天科工航天三江江北公司数控车工阎敏。他长期承担着航天型号产品关键件、新型号的首件加工任务。34年来，阎敏因为高超的技能被称为是导弹“咽喉主刀师”。
-
-　　在航天三江江北公司的生产车间里，阎敏正准备对一件用于新型武器装备的零部件进行车削。这个零件是为我国运载火箭和导弹提供能量转换的重要装置——喷管。
-
-　　喷管负责将火箭发动机推进剂燃烧内部喷射出的火焰转化为动力。行内人常将喷管称为火箭的“咽喉”。为了保证发动机的工作安全可靠，喷管关键部位的加工精度要求控制在0.005毫米。
-
-　　阎敏经手的“咽喉”型号产品合格率一直高达100%，然而他这一身真功夫，却是从磨刀开始。
-
-　　为了练就精湛的磨刀技艺，阎敏付出了常人难以想象的努力。正是凭借这一把把磨制准确、精巧的刀，阎敏可以将这根直径50毫米的圆柱体精确车削到细如发丝却不折断。
-
-　　作为第一批学习数控车床的技术工人，阎敏开发出15种数控操作的常用功能。
-
-　　正是凭借着“人机合一”的功底支撑，阎敏一直承担着重点型号导弹关键部位的首件产品加工重任。他总结了一套复合材料异形曲面的加工技术，突破了数控车床0.02毫米的精度，并且创下了0.005毫米的极值。
-
-　　30多年来，阎敏凭借着无可取代的精湛技术，收获了100多项奖项。
-
-责任编辑：刘英杰
-
-大国工匠 | 张舸：匠心守护“神舟”
-
-来源：央视网2022-04-30 09:19
-
-“大国工匠”
-
-原标题：张舸：匠心守护“神舟”
-
-央视网消息（新闻联播）：技术工人队伍是支撑中国制造和中国创造的重要力量，本台新闻联播从今天（4月29日）起推出【大国工匠】，首先我们来认识航天科技集团五院神舟飞船总装班组组长张舸。前不久刚刚从太空返回的神舟十三号飞船就是他和同事从空空的壳体起步、用几十万次的操作一步步安装好的。从神舟七号到神舟十三号，张舸参与总装的飞船一共将17名航天员送入太空。
-
-张舸，神舟飞船总装班组组长。正是用这把钥匙，他和两名同事一起为神舟13号航天员关上舱门，并挥手送别他们去往太空执行空间站任务。现在，他们日夜牵挂的飞船终于成功返回了。
-
-神舟飞船的返回舱容积约6立方米，舱里一共200多台设备。总装人员的有效操作面积约0.7平方米，舱内仅有4个踩踏点。
-
-安装γ放射源是飞船总装工作最具挑战性的难点。放射源的安装位置在航天员座椅底下，肉眼看不到，全凭总装人员的技术积累和手感盲操作。安装时间在飞船发射前负6小时，只能一次成功。
-
-这样的舱外练习，张舸坚持了八年。有时同事都下班了，他还在独自练盲操作，保证在眼睛看不见的情况下，每颗螺钉拧紧力矩保持一致。而在发射前一周，张舸每天在舱外重复50次，每次动作完全符合要求才能够进入到舱内，用模拟源进行操作。
-
-如今，39岁的张舸已经成为神舟飞船总装的领军人，他带领同事一起将三维投影、AR眼镜等先进装备引入飞船总装工作，极大提升了工作效率和质量。近几年神舟飞船总装人员并没有增加，但任务数量从过去的两三年一发到现在一年两发，张舸跟同事多次挑战不可能，出色地完成了总装任务。
-
-责任编辑：姚怡梦
-
-大国工匠 | 郑兴：巧手铸星船 匠心舞九天
-
-来源：央视网 | 2021年05月01日 11:28
-
-　　央视网消息：习近平总书记强调，要加快构建现代职业教育体系，培养更多高素质技术技能人才、能工巧匠、大国工匠。在迈向建设现代化国家的新征程中，技术工人正在成为中国制造、中国创造的重要力量。
-
-　　本台今天（5月1日）推出“五一”特别节目《大国工匠》，将关注他们中的一些佼佼者。他们有的毕业于普通技校，却攻克了重大工程的技术难题；有的二十多年重复一个动作，却成为掌握独门技艺的顶尖高手。他们精益求精、勇挑重担，在平凡的岗位上为国家发展作出了不平凡的贡献。
-
-　　今天，我们首先认识中国航天科技集团五院529厂高级技师郑兴。就在两天前（4月29日），我国首个空间站核心舱“天和”成功入轨，再次展现了我国航天制造的顶尖实力。“天和”的密封舱体，就是由他焊造的。
-
-　　大型载人航天器的焊接，挑战焊工的最高水平。
-
-　　在真空的太空环境中，宇航员要在航天器长久驻留、开展科学实验，一旦舱体出现裂缝，将直接威胁他们的生命安全。  
-
-　　空间站核心舱舱体巨大，焊缝总长度超过300米，焊接时要高标准一次成型，难度极大，造型复杂的球面壁板舱体焊接更是从未有人挑战过。
-
-　　气孔，是精密焊接最常见的缺陷。载人航天器I类焊缝的要求最为苛刻，不仅有严格的数量要求，最大气孔的直径也不能超过头发丝粗细，微小到肉眼无法辨别，只能通过专业X光拍摄后，用放大镜才能看到。
-
-　　郑兴团队反复研究，发现采用变极性等离子弧焊接能有效控制气孔缺陷。
-
-　　空间站焊接进入关键期，郑兴发现，一旦空气湿度超过40%，试验件里的气孔数量和直径都明显增加。
-
-　　以往，他会把焊件局部升温，祛除湿气后迅速完成焊接。可空间站体积庞大，要想升温祛湿非常麻烦。
-
-　　交付节点逼近，时间不等人，反复琢磨后郑兴想到了一个新办法。
-
-　　用两排烤灯直接加热工作面，采用这样的办法，即使是在潮湿的夏天，焊缝里的气孔也大大减少，空间站等大型航天器的焊接难题终于被攻克。这也意味着郑兴经常要在五六十度的高温下连续工作1个多小时。
-
-　　能吃苦、爱思考，是郑兴给人最深的印象。18岁那年，凭借北京市职业院校技能竞赛的获奖证书，郑兴作为唯一的技校生特招进入529厂。那时的他，对航天事业还懵懂无知。
-
-　　当时，中国载人航天事业正在快速发展，厂里推出竞争上岗制度：不只看学历、年龄，只要技能出众，都可以成为主岗人员，参与国家重点型号研制。明白了职责所在，郑兴下定决心苦练技艺。
-
-　　十多年的勤学苦练，郑兴终于从初级工成长为一名高级技师，还成为全国技术能手。这些年，由郑兴担任主岗焊接的神舟飞船、天宫、天舟、新一代载人飞船试验船相继成功发射，空间站实验舱等航天器也将陆续启程，开启中国人大规模建设空间站、探索宇宙奥秘的新时代。
-
- 编辑：杨书杰 责任编辑：刘亮
-
-大国工匠巧手铸星船
-
-数控铣工韩利萍
-
-刚刚成功发射天舟一号的长征七号火箭重量达到600吨而托举火箭腾飞的是一双巨大的手发射平台
-
-在他身上的4万多个零件中最关键的零件加工精度达到了微米级
-
-它是火箭精准入轨的基础今天的大国工匠我们一起来认识一位用双手托起火箭的数控洗工韩丽萍
-
-19把刀具一次装下73个孔要在两天之内不停机加工完毕
-
-准备加工的这个零件叫四通均流阀是长征七号火箭发射平台的关键控制机
-
-别看这个零件个头小但它可是大力士火箭家住燃料以后一直到起飞前将近600吨的重量就靠这个四通均流阀
-
-驱动液压系统进行控制承担火箭发射前姿态调整控制的重担这个发射平台的关键部件
-
-允许的最大公差是两丝相当于两根蚕丝粗加工粗糙度仅有1 6威尼
-
-超过这个范围就有可能导致火箭发射无法准确入轨由于这个零件的就是他进度要求太高了你背一个就全部都废了每一步都得非常的小心只要是一开灯中间就不能停了我们这白包夜班就得连走钻了
-
-长征七号火箭担负着给中国空间站运送货运飞船的任务
-
-天舟一号要在太空中跟天空二号牵手这就要求火箭必须精准的把飞船送到指定的位置
-
-因此发射平台零件的设计精度比之前发射卫星的火箭平台提升了2 5倍
-
-73个孔加工出来都要好理不差每个孔的合格率就算达到分之99都不行
-
-这样的难度让经验丰富的洗工都望而却步如果每个孔的这个
-
-合格率呢是99%的话那我们这个自动金流法有73个孔我们计算了一下它的总的合作率呢就只有48%
-
-这就要求韩丽萍加工的73个孔合格率都要达到百分之百
-
-才能确保火箭的发射万无一失四通军流阀的73个孔全部加工完需要两天时间
-
-在零件加工到第三个孔时候韩丽萍发现机床出现了异常震动加工的时候呢他都是每把刀的这个切削的状态都是不一样的他会引起这个震动的频率也是不一样的就像就像医生给病人看病一样他说他要把这个人的弄
-
-就感觉他是不是正常
-
-我在看这个粗糙度觉得上面还可以底下就觉得这个刀子给换了底下这个有点方有点拉毛了
-
-你再放大一点
-
-看这些上面还是据此的这个有牙样到这已经磨损了正常人们应该是很严重的
-
-这个照片必须得换了四通君留法使用的材料是45号钢
-
-经过热处理以后印度比普通钢材高了将近分之30经加工时刀具比一般加工更容易磨损
-
-加工时需要随时观察机床的状态及时更换刀片如果不是韩丽萍提前预判到刀具的磨损加工下一个孔式零件就有可能超出精度公差甚至报废
-
-机床他越复杂其实需要人的能力更强你要是就是这种半把刀一直半解的那他会处处为难你的
-
-这么多年呢我一直在跟跟我的机床怎么说呢做闺蜜啊
-
-而在十多年前这个机床闺蜜曾经是韩丽萍的噩梦2000年年初当中国航天的装备开始升级换代
-
-韩丽萍是厂里第一批接触数控机床的人一次师傅交给他一个零件
-
-由于空间想象能力不够他怎么也看不懂零件复杂的内部结构图回到家里韩丽萍还在通过电话找师兄请教
-
-他就想不明白他说我都跟你说这么清楚啊你为什么还想真的你
-
-在师兄眼里当年20多岁的韩丽萍在加工方面就是个笨小孩
-
-但是他没想到韩丽萍还是个倔女孩在切土豆时他脑子里突然灵光一闪
-
-能不能用家里的土豆切出零件的模型呢圆弧面打孔这些在平面图纸上韩丽萍怎么也看不懂的难点通过他手中切割成形的土豆变得立体了
-
-有半年多的时间韩丽萍家里堆满了她脸弓切出来的奇形怪状的土豆
-
-当年的笨小孩韩丽萍如今已经成长为成立鼎鼎有名的技能高手
-
-26年来的由韩丽萍加工的关键零件相继用在了长征系列火箭发射平台上
-
-稳稳的将神舟系列飞船北斗卫星天舟货运飞船送上太空
-
-这个铁哥大大可不是普通意义上的铁哥大呀我交通的零件是航天产品啊是吧我们加工的这些东西那是正国黑的就是就是给给咱们中国人长脸的
-
-王曙群
-
-去年12月，上海航天设备制造总厂有限公司对接机构总装组组长王曙群荣获何梁何利基金“科学与技术创新奖”。这是该奖成立29年以来，首次颁给一线产业工人。
-
-29日，大国工匠王曙群先进事迹报告会暨2023年上海工匠选树命名大会在上海举行。回顾站在颁奖台上的那一刻，王曙群说，“我特别激动，看着同台的科技界大咖，我觉得这个奖不仅属于我个人，更属于千千万万广大一线产业工人。”
-
-　　这个奖也让他更坚定了一个信念：“科技创新并不只是科学家的事情，产业工人只要精益求精，敢为人先，也一样能成为我们科技强国的重要力量”。
-
-　　从普通技术工人，到全国劳模，再到首次获评何梁何利基金奖的上海工人，30多年来，王曙群默默坚守在航天装配一线，先后参与神舟八号至神舟十七号、天宫、天和、天舟的31次太空交会对接任务，把工匠精神植根于心、付之于行。
-
-　　20世纪80年代末，王曙群刚入职时，发射任务很少，不少一起进厂的同事纷纷跳槽。师傅鼓励他：“工人同样大有可为。关键是要做一行爱一行，基本功要扎实，更要耐得住寂寞，很多工作都是从拧好一颗螺丝开始的。”在师傅的教诲下，王曙群选择留下，潜心钻研技能，建设航天强国成为他坚定不移的人生方向。
-
-　　1995年，上海航天开始研制“空间对接机构”，曾在企业技能比武中获得过第一名的王曙群有幸成为其中一员。他颇为感慨：“近几年，我们航天赶上了快速发展的好时候。”
-
-　　16年来，难关无数，破题百千。交会对接过程中，需要将200多个插孔准确并同步插入插座，也就是人们熟悉的“太空之吻”。实现这一“吻”，对接机构中的每套单机必须经过各项试验，合格后才能进行总装，其中有10大类、31套单机还需经过热循环试验的考核，一次热循环就需37个小时的试验。
-
-　　最难的时期，是2011年首次“太空之吻”对接机构交付前的两年，王曙群说他们的团队一天只能看到一次太阳，就是在早晨上班的时候，接下来的一整天都在车间里工作、加班，产品交出的那天，王曙群一度恍惚，“那天我们下午4点半下班，我走出车间时看到太阳，突然以为又到早晨了，又该上班了。”
-
-　　王曙群有句话，很出名：“100-1=0”，就是说，搞航天工程，只有100分，没有99分。以航天产品的管路密封来说，如同血管对人体一样，直接影响航天产品的品质和航天员的生命安全。在对接机构研制初期，采用熔焊技术制造的导管一次合格率仅为20%左右，管路多余物清洗一次合格率为77%左右。
-
-　　经过反复试验对比，王曙群团队优化确定了“三步走”的清洗技术路径，完成了43套试验件和正式产品清洗验证，经导管内残留颗粒度检测，一次合格率达到100%。最终，这一科研成果荣获2018年度国家科技进步奖二等奖，实现了上海航天技能工人在国家级科技进步奖方面“零”的突破。
-
-　　就这样一路不停爬坡过坎，王曙群带领团队先后参与研发了50多台套专用装备，解决了许多工艺难题，对接机构总装周期从3个多月缩短到40天，装配可靠性明显提升。
-
-　　伴随着型号任务越来越重，王曙群团队一年要生产5-6套对接机构。在生产过程中，以往是“一边研制一边总装”的生产模式，如今，团队通过载人飞船与货运飞船对接机构产品通用的方案将部组件产品化、通用化，形成了产品全周期生产模式，使得单套对接机构交付时间从10个月缩短到了6个月。
-
-　　今年是王曙群从事对接机构领域的第29个年头。54岁的他坦言，这些年，激动的时刻有很多，但最让他欣慰的是带出了一支高素质、高技能的年轻队伍。“航天前辈为我们这一代磨砺了前路，我们这一代也要为未来的航天事业培养新的人才。”
-
-　　2004年，刚担任班组长的王曙群接到“玉兔号”月球车研制的新任务。如何做到对接机构和月球车研制“两同步”“两不误”？王曙群的答案只有一个，那就是“让年轻人上”。
-
-　　自任班组长以来，王曙群先后培养出10名高级技师，在他眼里，这些正接过老一辈航天人接力棒的年轻人，会成为我国航天事业高速高质量发展的最大动力。
-
-　　2010年大学毕业后师从王曙群的夏巧伟，2017年被评为技师，2022年被授予五项专利。他至今记得，刚参加工作时师傅夜以继日地带着他参与“玉兔号”月球车的总装总测。
-
-　　“说实话，当时的我是有些怨言的，但是当我在西昌卫星发射中心场看着自己倾注了三年时间和心血的产品在隆隆的声响中飞向茫茫太空，传回在月球表面的第一张照片时，一种自豪感油然而生，我更深刻地理解了天道酬勤的内涵，也让我从此爱上了航天这份事业。”夏巧伟说，前行路上，师傅就是我最好的榜样，让我看见了技术工人也能追梦圆梦、人生出彩。
-
-时代发展和社会进步呼唤更多如王曙群一样的工匠。当天，100名2023年“上海工匠”获颁“上海工匠”大铜章及证书。现场聆听王曙群的事迹后，他们中的不少人表示，要学习王曙群老师，强技能报国之志，走技能成才之路，守技能报国之心，逐技能强国之梦。(完)
-
-洪家光
-
-身着深蓝色的整洁工装，犀利的目光紧盯着旋转的零件，一双大手飞快旋转着车床摇把，进刀、车削、退刀一气呵成，他就是在中国航发沈阳黎明航空发动机有限责任公司从事航空发动机工装制造的高级技师洪家光。
-
-在车工岗位上工作20多年来，洪家光从一个“毛头小子”，成长为一名掌握精湛加工工具工装技能的高级技师、能独立撰写车工技能操作法的优秀模范，这些成绩离不开党组织的培养和航发事业的磨砺。
-
-“2005年，我成为一名共产党员。在党组织的关怀下，我从一名学徒工成长为大国工匠。作为党员，我和身边的工友们一起，传承发扬务实创新、担当奉献的精神，发挥先锋模范作用，助力完成各项生产任务。”洪家光说。
-
-发动机是飞机的心脏，航空发动机被誉为现代工业“皇冠上的明珠”，是衡量一个国家综合国力的重要标志之一。洪家光团队加工的是用于航空发动机制造的工装工具产品，这些工具主要用来加工航空发动机的零部件。发动机用的零件精度要求非常高，洪家光对每一个微小尺寸都追求精益求精。他一次次观察记录，并比对调整。
-
-优秀共产党员的品格流淌在血脉里，落实在行动上。一次，在加工修正金刚石滚轮工具时，掌握此项技术的师傅生病住院，洪家光主动承担起任务。为了提高工具加工精度，他在当时的车床无法满足加工要求的情况下，开始一项项改进，减小托盘与操作台的间隙，改造传动机构中齿轮间咬合的紧密程度。原有的刀台抗震性不强，他就重做刀台，小托盘与下面的托盘有间隙，他就想办法将小托盘固定……
-
-4年多里，经无数次尝试，洪家光最终研发出一套用于打磨叶片砂轮的滚轮工具。这一砂轮工具被叶片加工厂使用后，加工叶片的质量得到明显提升。
-
-洪家光心中“大国工匠梦”的背后，是“航发人”代代传承的家国情怀——“国为重、家为轻，择一事、终一生”。
-
-从1998年参加工作至今，洪家光先后跟随多位师傅，他们教导的工匠精神，深深地印刻在洪家光心中。跟着付百森师傅学习的经历让他记忆犹新。
-
-“年轻人都愿意跟老师傅学，眼前这个师傅这么年轻，技术经验能丰富吗？”洪家光刚见到付师傅时有点失落。付师傅却让洪家光在旁边看。
-
-只见付师傅把零件安装、调整、夹紧、左手启动机床，右手快速移动机床拖板。紧接着，他的双手就在机床上操纵着机床上的手柄，加工零件。麻利的动作，像电脑控制的机械手。
-
-付师傅加工完说：“小洪，你测量一下各部分尺寸精度，再按照这个标准加工零件。”洪家光测量后发现公差微乎其微。他心想，这水平太高了，这可是纯手工！
-
-到洪家光加工时，他满头大汗地忙活了十几分钟，发现自己的水平与实际要求差距很大。
-
-付师傅语重心长地说：“光有技校学的知识是不够的，机械加工的实际技术深奥着呢，雄心壮志代替不了真才实学。当高水平的工人，不是你想象的那么容易，你得从一点一滴做起。”
-
-那一刻，洪家光决心从头学，一切从零开始。
-
-对党忠诚，对于洪家光来说不是抽象而是具体的，他以一名共产党员的初心和使命，一步一个脚印地走来。
-
-如今，43岁的洪家光先后完成200多项工装工具技术革新，解决300多个工装工具技术难题。他与团队成员研制的“航空发动机叶片滚轮精密磨削技术”荣获2017年度国家科学技术进步二等奖。以他名字命名的“洪家光劳模创新工作室”和“洪家光技能大师工作站”承担起了“传帮带、提技能”的职责。他带领工作室团队申报并获得31项国家专利授权，完成创新和攻关项目84项，成果转化63项，解决临时难题65项。
-
-他的荣誉册里有全国优秀共产党员、全国劳动模范、大国工匠年度人物、中华技能大奖、全国创新争先奖状、全国五一劳动奖章、全国技术能手、全国“最美职工”、中国青年五四奖章等殊荣。
-
-他还积极参加企业组织的各类活动和社会实践，展现出“航发人”为“动力强军，科技报国”而奋斗的使命。
-
-胡双钱
-
-胡双钱：以零差错铸就“飞机梦”
-
-中工网记者李方
-
-2019-04-2708:12:52
-
-　　研发大型客机是一个国家综合实力的体现，在这个位于现代工业体系顶端的产业里，尽管手工工人越来越少，但他们却不可替代，即使是生产高度自动化的波音和空客，也都保留着独当一面的手工工匠。在我国也有这样一位手艺人——钳工胡双钱。
-
-　　胡双钱，人称“航空手艺人”，一位坚守航空事业39年、加工数十万飞机零件无一差错的中国顶级钳工。曾获全国最美职工、全国劳动模范、全国“五一”劳动奖章、全国敬业奉献模范、上海市质量金奖等荣誉称号。
-
-　　严把质量关成为不可替代
-
-　　“一定要把产品的质量放在首位！”这是胡双钱从第一天进入上海飞机制造厂（现上飞公司），老师傅们天天在耳边敲的警钟。师傅的话，胡双钱一直铭记在心。工作时，胡双钱时常带着本子、笔，蹲在现场做着各种记录，面对精度要求高、技术难度大的工作，胡双钱向经验丰富的师傅请教，机械图纸绘制、工序编制、公差配合等都是胡双钱不断琢磨的内容。
-
-　　有一次，胡双钱按流程给一架在修的大型飞机拧螺丝、上保险。晚上回想起来，他突然对“上保险”的动作感到不怎么踏实。凌晨3点，他又骑车赶去单位检查。当拆去层层外部零部件，看到保险出现时，他那颗悬着的心终于落了下来。
-
-　　无论零件是简单还是复杂，胡双钱都一视同仁，核对图纸、划线打磨、完成加工、交付产品，每个步骤他都反复检查数遍，直到“零瑕疵”。正是因为这种追求完美的工匠精神，胡双钱曾连续十二年被上飞厂评为“质量信得过岗位”。2002年，他荣获上海最高的质量奖项——“上海市质量金奖”这一殊荣。
-
-　　攻坚克难成为工作的一部分
-
-　　2002年、2008年我国ARJ21新支线飞机项目和大型客机项目先后立项研制，中国人的大飞机梦再次被点燃。飞机在研制和试飞阶段，经常有特制零件、首制零件的加工任务，胡双钱也开始逐渐发挥作用。
-
-　　为了让中国人自己研制的民用机早日在蓝天上翱翔，他常常一周有六天都泡在数控机加车间里。在他加工的零部件中，最大的将近5米，最小的比曲别针还小。有时由于零件的直径小，零件定位直口的孔径更小，而孔径深度尺寸又较长，孔径的公差要求高，通常加工完孔径的内圆尺寸后，内径无法进行打表测量，也没有专用量具。胡双钱反复琢磨，找出了一种测量内壁尺寸的方法：用块规加上标准的圆柱销进行辅助测量，通过一次次打表测量，直到符合图纸的加工要求。
-
-　　胡双钱不仅要按工作计划加工形状各异的零部件，有时还要临时“救急”。2014年年初，一日临近下班时生产调度急匆匆地跑到钳工班组，找到了准备打卡下班的胡双钱。原来，C919大型客机项目平尾零件上，一个位于连接接头的小孔需要胡双钱进行加工，而直径仅1.6毫米。孔槽位置精度为0.15毫米，且是非平面加工；钻孔位置离上平面距离有50厘米，需要用戴长套筒的钻头进行加工。如此一来，加工精度很难保证。在困难面前，胡双钱定了定神，开动脑筋，寻找对策。一个个步骤忙而不乱、有条不紊。时间一分一秒地过去，到最后一个环节完成时，已经是次日凌晨1点。然而，第二天清晨，上早班的同事看到了已经投入工作的胡双钱了。
-
-高凤林
-
-高凤林：零点一六毫米上创造“火花艺术”（图）
-
-2016-04-2907:19:16　来源：中工网—《工人日报》
-
-　　工作中的高凤林。
-
-开栏的话
-
-　　4月27日，在“五一”国际劳动节来临之际，中央宣传部、中央文明办、全国总工会向全社会正式发布“最美职工”榜单。
-
-　　上榜的这10位一线职工，他们心系岗位，有着崇高的职业理想，用精湛的技艺践行着“工匠精神”，诠释着“匠人”本质。对亿万职工来说，他们是精益求精、创新创造的“大国工匠”，是劳动者的杰出代表，是社会主义核心价值观的优秀践行者。
-
-　　这些“最美职工”干一行、爱一行，而精一行是他们的终极目标及成就，他们用自己真实的人生经历诠释了“劳动最光荣、劳动最崇高、劳动最伟大、劳动最美丽”的真谛，展示了劳动者的最美风范。本版从今日起推出《最美职工》专栏，通过展现他们的先进事迹，动员激励广大职工以先进模范人物为榜样，辛勤劳动、诚实劳动、创造性劳动，为实现中华民族伟大复兴中国梦贡献力量。敬请读者关注。
-
-　　“对一线职工来说，因为劳动所以美丽！”4月27日，中国航天科技集团第一研究院国营211厂特种熔融焊工、特级技师高凤林获评中宣部、中央文明办、全国总工会联合发布的“最美职工”，成为第三批获此殊荣的一线职工。
-
-　　36年里，这位焊工只专注于一件事——在厚度、薄度均在毫厘之间的管壁上，一次次攻克发动机喷管焊接技术难关，被称为焊接火箭“心脏”的人。我国发射的140多枚长征系列运载火箭，都是依靠他焊接的发动机成功推向太空。而这个数字占到我国发射长征系列火箭总数的一半以上。
-
-　　汗荐轩辕
-
-　　一个焊点的宽度仅为0.16毫米、完成焊接允许的时间误差不超过0.1秒、管壁厚度仅为0.33毫米，“长征五号”发动机的喷管上，高凤林需要经过3万多次的操作，才能将几百根空心管完美“编织”在一起。
-
-　　要满足这样“严苛”的标准，要求工人必须有精湛的技术，“眼睛要尖、技术要硬、功底要深厚”。
-
-　　也因此，学技术、干工作，高凤林从不惜力。自1980年进入211厂发动机焊接车间成为一名氩弧焊工起，高凤林就开始了刻苦的训练：吃饭时拿筷子练送丝，喝水时端着盛满水的缸子练稳定性，休息时举着铁块练耐力，时常冒着高温观察铁水的流动规律，并练就了“如果焊接需要，可以10分钟不眨眼”的绝活儿。
-
-　　汗水与时间，将高凤林打磨成名副其实的“金手天焊”。
-
-　　——上世纪90年代，亚洲最大“长二捆”全箭振动塔的焊接中，高凤林连续不断在表面温度高达几百摄氏度的焊件上操作。在他的手上，至今可见当时因严重烤伤留下的疤痕。
+    os.makedirs(WORK_DIR, exist_ok=True)
+    os.chdir(WORK_DIR)
+    print("=" * 70)
+    print("          航天军工领域大国工匠情感分析系统（最终运行版）          ")
+    print(f"当前工作目录：{os.getcwd()}")
+    print("=" * 70)
 
-　　——国家“七五”攻关项目、东北哈汽轮机厂大型机车换热器的生产中，为了突破一项熔焊难题，高凤林在半年时间里，天天趴在产品上，一趴就是几个小时，被"""
-    
-    print(f"✅ 文档内容已加载，总字符数：{len(content):,}")
+    corpus = load_corpus()
+    print(f"✅ 文档内容已加载，总字符数：{len(corpus.doc_text(STORY_DOC)):,}")
     
-    # 提取人物故事
-    stories = extract_stories(content)
+    # 提取人物故事（按偏移从语料库取，不复制正文）
+    stories = extract_stories(corpus)
     print("\n🔍 提取的工匠列表：")
     for i, story in enumerate(stories, 1):
-        print(f"   {i:2d}. {story['name']:12s} | 事迹长度：{len(story['content']):,}字符")
+        print(f"   {i:2d}. {story.name:12s} | 事迹长度：{len(story.text):,}字符")
     
     # 导出分析结果
     print("\n" + "-" * 70)
     print("                          正在进行情感维度分析...                          ")
     print("-" * 70)
-    export_results(stories)
+    # 所有故事一次打分，导出和雷达图共用
+    scores = score_stories(story_hits(stories, corpus))
+    export_results(stories, scores)
     
     # 生成雷达图
     print("\n" + "-" * 70)
     print("                          正在生成雷达图...                          ")
     print("-" * 70)
-    create_radar_chart(stories)
+    create_radar_chart(stories, scores)
     
     # 最终检查
     print("\n" + "=" * 70)
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+全语料一次扫描的命中表（柱形图、时序图、热力图、雷达图的统计都从它派生）
+原先 spirit_dict（柱形）、LEX（时序）、INDUSTRY_DICT / QUALITY_DICT（热力）、雷达图各维度关键词各自把同一篇文档重新扫一遍；
+这里取 词典注册 里登记的全部词典（都写在 词典.py），把全部关键词、交替式分支词、正则触发词
+并进同一个关键词自动机，整份语料文件只扫描一遍，记下每一次出现（允许重叠）的
+(词序号, UTF-8 字节起点, 所在句/小句/段落/文档序号, 在该段内是否计入 str.count)，全是紧凑的 numpy 数组。
+各脚本的口径都是这张命中表的视图，不再回到原文扫描；词在组之间挪动、改权重后重新汇总只要几毫秒：
+    hit_table           文档内某些词的命中表：(词序号, 段序号, 字节偏移, 是否计入)
+    keyword_counts      句 × 关键词，口径同 str.count（热力图 build_cooccurrence）
+    group_counts        句 × 组 的（加权）计数，口径同逐句 count_groups
+    alternation_counts  小句 × 「词1|词2|…」模式，口径同逐句 re.findall（时序图 segment_counts）
+    pattern_counts      整篇文档按组求和，口径同 len(re.findall(p, text, flags))（柱形图）
+    story_density       工匠故事 × 组 的命中前缀和，口径同 HitDensity([s.text ...])（雷达图）
+雷达图的故事来自同一份语料（docx 段落或 工匠故事/ 下的文章），故事记录的字节区间直接在命中表里二分取命中，
+不再解码、扫描正文；不在语料里的故事（默认人物、直接读取的 docx）和标题行照旧扫描文字。
+命中表连同词表缓存为 .corpus/fused-<版本>.npz，语料或登记词典里的词有变化才重新扫描，
+依次运行各图表脚本时全语料只扫一遍。主题河流读取 知乎名单采集.xlsx，不在此列。
+用法：
+    from 融合分析 import load_fused
+    fused = load_fused(corpus)
+    co = fused.cooccurrence("航天军工", INDUSTRY_DICT, QUALITY_DICT)
+    scores = fused.group_counts("航天军工", [("毫米", 2), "微米"], ["安全"], unit="paragraphs")
+    hits = fused.alternation_counts("航天军工", LEX.values())
+    counts = fused.pattern_counts("基建工程", *spirit_dict.values(), flags=re.I)
+    density = story_density(stories, *RADAR_KEYWORDS["航天军工"].values(), corpus=corpus)
+运行：python 融合分析.py（构建命中表并打印各文档的命中数）
+依赖：numpy、scipy
+"""
+import os
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+from 语料库 import CORPUS_DIR, _char_to_byte, load_corpus
+from 关键词匹配 import (keyword_matcher, HitDensity, _weighted, _alternation_counter,
+                      _compile_pattern_groups)
+from 共现矩阵 import group_vocab, cooccurrence_from_hits
+from 词典注册 import registered
+
+FUSED_VERSION = 2   # 命中表格式或扫描逻辑改动时 +1，旧缓存失效
+UNITS = ("sentences", "clauses", "paragraphs", "documents")
+
+# 进程内已加载的命中表：缓存路径 → FusedIndex（五行业统一分析里各行业共用一份）
+_loaded = {}
+
+
+# ---------- 1. 登记的词典 ----------
+def lexicon_words(kind, lexicon):
+    """
+    词典 → 需要进自动机的词
+    keywords      关键词原样（带权重的取词）
+    alternations  各交替式的纯文字分支
+    patterns      各条正则开头的纯文字（触发词），按不带 flags 取，覆盖任何 flags 下用到的触发词
+    """
+    if kind == "keywords":
+        return [w for ws in lexicon.values() for w, _ in _weighted(ws) if w]
+    if kind == "alternations":
+        return _alternation_counter(tuple(lexicon.values())).branches
+    if kind == "patterns":
+        return _compile_pattern_groups(tuple(map(tuple, lexicon.values())), 0)[0].triggers
+    raise ValueError(f"未知的词典口径：{kind}")
+
+
+def registered_words(lexicons=None):
+    """全部登记词典的词（去重，按登记顺序）；lexicons 默认取 词典注册.registered()"""
+    words = []
+    for kind, lexicon in registered() if lexicons is None else lexicons:
+        words.extend(lexicon_words(kind, lexicon))
+    words = list(dict.fromkeys(words))
+    if any("\n" in w for w in words):
+        raise ValueError("登记的词中含换行符，命中可能跨文档")
+    return words
+
+
+# ---------- 2. 命中表 ----------
+class FusedIndex:
+    """
+    vocab    自动机词表
+    starts   每次命中在语料文件中的 UTF-8 字节起点（递增）
+    words    每次命中的词序号（对应 vocab）
+    rows     {粒度: 每次命中所在段在全语料中的序号}，命中跨段时为 -1
+    counted  {粒度: 该命中在所在段内是否计入 str.count}（同一词不重叠）
+    """
+
+    def __init__(self, corpus, vocab, starts, words, rows, counted):
+        self.corpus = corpus
+        self.vocab = list(vocab)
+        self.index = {w: i for i, w in enumerate(self.vocab)}
+        self.nbytes = np.fromiter((len(w.encode("utf-8")) for w in self.vocab), dtype=np.int64,
+                                  count=len(self.vocab))
+        self.starts = starts
+        self.words = words
+        self.rows = rows
+        self.counted = counted
+
+    def _row_range(self, doc, unit):
+        """文档 doc 的 unit 在全语料中的序号范围 [first, last)"""
+        if unit not in UNITS:
+            raise ValueError(f"unit 须为 {UNITS} 之一")
+        c, d = self.corpus, self.corpus.doc_id(doc)
+        if unit == "sentences":
+            return int(c.doc_sent_ptr[d]), int(c.doc_sent_ptr[d + 1])
+        if unit == "paragraphs":
+            return int(c.doc_para_ptr[d]), int(c.doc_para_ptr[d + 1])
+        if unit == "clauses":
+            return int(c.para_clause_ptr[c.doc_para_ptr[d]]), int(c.para_clause_ptr[c.doc_para_ptr[d + 1]])
+        return d, d + 1
+
+    def _spans(self, doc, unit):
+        first, last = self._row_range(doc, unit)
+        return _unit_spans(self.corpus)[unit][first:last]
+
+    def hit_table(self, doc, words, unit="sentences"):
+        """
+        文档 doc 内属于 words 的命中表 → (词序号, 段序号, 字节偏移, 是否计入 str.count)
+        词序号对应 words；段序号是文档内第几个 unit，命中跨段时为 -1；字节偏移为命中在语料文件中的起点。
+        """
+        missing = [w for w in words if w not in self.index]
+        if missing:
+            raise KeyError(f"词不在命中表里（词典未在 词典.py 登记？）：{missing[:5]}")
+        start, end = self.corpus.doc_spans[self.corpus.doc_id(doc)].tolist()
+        lo, hi = np.searchsorted(self.starts, [start, end])
+        local = np.full(len(self.vocab), -1, dtype=np.int64)
+        local[[self.index[w] for w in words]] = np.arange(len(words))
+        ids = local[self.words[lo:hi]]
+        keep = ids >= 0
+        first, _ = self._row_range(doc, unit)
+        rows = self.rows[unit][lo:hi][keep].astype(np.int64)
+        rows = np.where(rows >= 0, rows - first, -1)
+        return ids[keep], rows, self.starts[lo:hi][keep], self.counted[unit][lo:hi][keep]
+
+    # ----- 视图 -----
+    def keyword_counts(self, doc, keywords, unit="sentences"):
+        """段 × 关键词 的 CSR 计数矩阵，元素等于 segment.count(keyword)；返回 (矩阵, 关键词)"""
+        keywords = list(dict.fromkeys(w for w in keywords if w))
+        ids, rows, _, counted = self.hit_table(doc, keywords, unit)
+        first, last = self._row_range(doc, unit)
+        counts = sp.csr_matrix(
+            (np.ones(int(counted.sum()), dtype=np.int64), (rows[counted], ids[counted])),
+            shape=(last - first, len(keywords)),
+        )
+        counts.sum_duplicates()
+        return counts, keywords
+
+    def group_counts(self, doc, *groups, unit="sentences"):
+        """
+        段 × 组 的（加权）计数矩阵，第 r 行等于 count_groups(第 r 段, *groups)
+        每组可以是词列表或 (词, 权重) 列表；只是 段 × 关键词 计数乘上 关键词 × 组 的权重矩阵。
+        """
+        keywords, weights = _group_matrix(groups)
+        counts, _ = self.keyword_counts(doc, keywords, unit)
+        return np.asarray(counts @ weights)
+
+    def cooccurrence(self, doc, row_groups, col_groups, unit="sentences"):
+        """同 build_cooccurrence(corpus.sentences(doc), row_groups, col_groups)"""
+        hits, vocab = self.keyword_counts(doc, group_vocab(row_groups, col_groups), unit)
+        return cooccurrence_from_hits(hits, vocab, row_groups, col_groups)
+
+    def alternation_counts(self, doc, patterns, unit="clauses"):
+        """段 × 模式 的 int32 计数矩阵，同 segment_counts(corpus.clauses(doc), patterns)"""
+        patterns = list(patterns)
+        counter = _alternation_counter(tuple(patterns))
+        branches = counter.branches
+        ids, rows, starts, _ = self.hit_table(doc, branches, unit)
+        keep = rows >= 0
+        seg_of = dict(zip(starts[keep].tolist(), rows[keep].tolist()))
+        nbytes = self.nbytes[[self.index[w] for w in branches]].tolist()
+        found = np.fromiter(
+            (v for d, pos in counter.resolve(zip(starts[keep].tolist(), ids[keep].tolist()), nbytes)
+             for v in (d, seg_of[pos])), dtype=np.int64,
+        ).reshape(-1, 2)
+        spans = self._spans(doc, unit)
+        flat = np.bincount(found[:, 1] * len(patterns) + found[:, 0], minlength=len(spans) * len(patterns))
+        counts = flat.astype(np.int32).reshape(len(spans), len(patterns))
+        # 含正则语法的模式不在命中表里，逐段 findall
+        for d, regex in counter.fallback.items():
+            for r, (s, e) in enumerate(spans.tolist()):
+                counts[r, d] = len(regex.findall(self.corpus.text(s, e)))
+        return counts
+
+    def pattern_counts(self, doc, *groups, flags=0):
+        """整篇文档每组正则的匹配总数，同 count_pattern_groups(corpus.doc_text(doc), *groups, flags=flags)"""
+        counter, plan = _compile_pattern_groups(tuple(map(tuple, groups)), flags)
+        ids, _, starts, _ = self.hit_table(doc, counter.triggers, "documents")
+        text = self.corpus.doc_text(doc)
+        base = int(self.corpus.doc_spans[self.corpus.doc_id(doc)][0])
+        chars = np.searchsorted(_char_to_byte(text), starts - base)   # 字节起点 → 字符下标
+        counts = counter.count_hits(text, zip(chars.tolist(), ids.tolist()))
+        return [sum(counts[i] for i in g) for g in plan]
+
+    def story_density(self, stories, *groups):
+        """
+        故事 × 组 的命中前缀和，与 HitDensity([s.text for s in stories], *groups) 相同
+        正文在语料里的故事（buf 为 corpus.buf）按字节区间在命中表里二分取命中：整个落在区间内的才算，
+        同一词在区间内按 str.count 口径不重叠；字节偏移按区间内的 UTF-8 首字节数换成正文里的字符下标。
+        标题行 head 和不在语料里的故事（StoryRecord.from_text 等）扫描文字。
+        """
+        keywords, weights = _group_matrix(groups)
+        missing = [w for w in keywords if w not in self.index]
+        if missing:
+            raise KeyError(f"词不在命中表里（词典未在 词典.py 登记？）：{missing[:5]}")
+        if any(s.sep in w for s in stories for w in keywords):
+            raise ValueError("故事的分隔符出现在关键词中，命中可能跨区间")
+        matcher = keyword_matcher(tuple(keywords))
+        ids = [self.index[w] for w in keywords]
+        local = np.full(len(self.vocab), -1, dtype=np.int64)
+        local[ids] = np.arange(len(keywords))
+        nbytes = self.nbytes[ids]
+        found, lengths, offset = [], [], 0
+        for story in stories:
+            if story.buf is self.corpus.buf:
+                chars, words, length = self._story_hits(story, matcher, local, nbytes)
+            else:
+                text = story.text
+                hits = np.fromiter((v for pos, i in matcher.iter_matches(text) for v in (pos, i)),
+                                   dtype=np.int64).reshape(-1, 2)
+                chars, words, length = hits[:, 0], hits[:, 1], len(text)
+            found.append(np.stack([chars + offset, words], axis=1))
+            lengths.append(length)
+            offset += length + 1
+        found = np.concatenate(found) if found else np.zeros((0, 2), dtype=np.int64)
+        return HitDensity.from_hits(lengths, found, weights)
+
+    def _story_hits(self, story, matcher, local, nbytes):
+        """语料里的一段故事 → (命中在正文里的字符下标, 词序号, 正文字数)"""
+        chars, words, pos, sep = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], 0, len(story.sep)
+        if story.head is not None:
+            hits = np.fromiter((v for p, i in matcher.iter_matches(story.head) for v in (p, i)),
+                               dtype=np.int64).reshape(-1, 2)
+            chars.append(hits[:, 0])
+            words.append(hits[:, 1])
+            pos += len(story.head) + sep
+        for start, end in story.spans:
+            lo, hi = np.searchsorted(self.starts, [start, end])
+            ids = local[self.words[lo:hi]]
+            starts = self.starts[lo:hi]
+            inside = (ids >= 0) & (starts + nbytes[np.maximum(ids, 0)] <= end)
+            ids, starts = ids[inside], starts[inside]
+            keep = _counted(starts, ids, np.zeros(len(ids), dtype=np.int32), nbytes.tolist())
+            # 区间内每个字节之前有几个 UTF-8 首字节，即字节偏移 → 字符下标
+            data = np.frombuffer(self.corpus.buf, dtype=np.uint8, count=end - start, offset=start)
+            lead = np.zeros(end - start + 1, dtype=np.int64)
+            np.cumsum((data & 0xC0) != 0x80, out=lead[1:])
+            chars.append(pos + lead[starts[keep] - start])
+            words.append(ids[keep])
+            pos += int(lead[-1]) + sep
+        return np.concatenate(chars), np.concatenate(words), max(pos - sep, 0)
+
+    # ----- 存取 -----
+    def save(self, path):
+        arrays = {"vocab": np.array(self.vocab, dtype=str), "starts": self.starts, "words": self.words}
+        for unit in UNITS:
+            arrays[f"rows_{unit}"] = self.rows[unit]
+            arrays[f"counted_{unit}"] = self.counted[unit]
+        with open(path + ".tmp", "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, corpus, path):
+        with np.load(path) as z:
+            return cls(corpus, [str(w) for w in z["vocab"]], z["starts"], z["words"],
+                       {u: z[f"rows_{u}"] for u in UNITS}, {u: z[f"counted_{u}"] for u in UNITS})
+
+
+def _group_matrix(groups):
+    """组（词列表或 (词, 权重) 列表）→ (去重的关键词, 关键词 × 组 的权重矩阵)"""
+    groups = [[(w, weight) for w, weight in _weighted(g) if w] for g in groups]
+    keywords = list(dict.fromkeys(w for g in groups for w, _ in g))
+    col = {w: i for i, w in enumerate(keywords)}
+    weights = np.zeros((len(keywords), len(groups)),
+                       dtype=np.result_type(*[weight for g in groups for _, weight in g] or [0]))
+    for j, g in enumerate(groups):
+        for w, weight in g:
+            weights[col[w], j] += weight
+    return keywords, weights
+
+
+def _unit_spans(corpus):
+    """各粒度的全部段（全语料按文件顺序排列的字节区间）"""
+    return {"sentences": corpus.sent_spans, "clauses": corpus.clause_spans,
+            "paragraphs": corpus.para_spans, "documents": corpus.doc_spans}
+
+
+def _locate(starts, ends, spans):
+    """命中 → 所在段的序号；没有整个落在某一段内的记 -1"""
+    r = np.searchsorted(spans[:, 0], starts, side="right") - 1
+    inside = (r >= 0) & (ends <= spans[np.maximum(r, 0), 1])
+    return np.where(inside, r, -1).astype(np.int32)
+
+
+def _counted(starts, words, rows, nbytes):
+    """str.count 口径：同一词在同一段内不重叠计数（跨段的命中不计，也不挡后面的命中）"""
+    out = np.zeros(len(starts), dtype=bool)
+    last_end = [0] * len(nbytes)
+    for j, (pos, i, r) in enumerate(zip(starts.tolist(), words.tolist(), rows.tolist())):
+        if r >= 0 and pos >= last_end[i]:
+            last_end[i] = pos + nbytes[i]
+            out[j] = True
+    return out
+
+
+def build_fused(corpus, words):
+    """整份语料文件解码一次、自动机扫描一次 → FusedIndex（各粒度的段序号、计数标记一并算好）"""
+    matcher = keyword_matcher(tuple(words))
+    text = corpus.buf[:].decode("utf-8")
+    found = np.fromiter(
+        (v for pos, i in matcher.iter_hits(text) for v in (pos, i)), dtype=np.int64
+    ).reshape(-1, 2)
+    starts = _char_to_byte(text)[found[:, 0]]
+    ids = found[:, 1].astype(np.int32)
+    nbytes = [len(w.encode("utf-8")) for w in matcher.keywords]
+    ends = starts + np.asarray(nbytes, dtype=np.int64)[ids]
+    rows, counted = {}, {}
+    for unit, spans in _unit_spans(corpus).items():
+        rows[unit] = _locate(starts, ends, spans)
+        counted[unit] = _counted(starts, ids, rows[unit], nbytes)
+    return FusedIndex(corpus, matcher.keywords, starts, ids, rows, counted)
+
+
+# ---------- 3. 缓存 ----------
+def _fused_path(corpus, words, out_dir):
+    key = "\n".join([str(FUSED_VERSION), *corpus.sources, "|", *words])
+    return os.path.join(out_dir, f"fused-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.npz")
+
+
+def load_fused(corpus, lexicons=None, out_dir=CORPUS_DIR):
+    """取命中表：本进程已加载过的直接复用，语料和登记词典的词都没变时读 .corpus/ 下的缓存"""
+    words = registered_words(lexicons)
+    path = _fused_path(corpus, words, out_dir)
+    fused = _loaded.get(path)
+    if fused is not None and fused.corpus is corpus:
+        return fused
+    fused = None
+    if os.path.exists(path):
+        try:
+            fused = FusedIndex.load(corpus, path)
+        except (OSError, ValueError, KeyError):
+            pass   # 缓存损坏时重建
+    if fused is None:
+        fused = build_fused(corpus, words)
+        os.makedirs(out_dir, exist_ok=True)
+        fused.save(path)
+        print(f"✓ 命中表已构建：{len(fused.vocab)} 个词，{len(fused.starts)} 次命中")
+    _loaded[path] = fused
+    return fused
+
+
+def story_density(stories, *groups, corpus=None):
+    """
+    故事 × 组 的命中前缀和（雷达图打分用）
+    给了 corpus 时从融合命中表按故事区间取命中（FusedIndex.story_density），否则扫描各篇正文
+    """
+    stories = list(stories)
+    if corpus is None:
+        return HitDensity([s.text for s in stories], *groups)
+    return load_fused(corpus).story_density(stories, *groups)
+
+
+def main():
+    corpus = load_corpus()
+    fused = load_fused(corpus)
+    bounds = np.searchsorted(fused.starts, corpus.doc_spans)
+    for name, (lo, hi) in zip(corpus.doc_names, bounds.tolist()):
+        if "/" not in name:
+            print(f"{name}：{hi - lo} 次命中，{len(np.unique(fused.words[lo:hi]))} 个不同的词")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,40 +5,42 @@ import matplotlib
 matplotlib.use('TkAgg')  # 强制使用TkAgg后端
 import matplotlib.pyplot as plt
 import os
-from docx import Document
+from 文档读取 import read_paragraphs
+from 关键词匹配 import count_groups
+from 故事切分 import StoryRecord, strip_spans, TextSource, ParagraphSource
+from 融合分析 import story_density
+from 词典 import RADAR_KEYWORDS
 import warnings
 warnings.filterwarnings('ignore')
 
-# 设置工作目录（已按要求改为E:\）
-os.chdir('E:\\')
-
 # 设置中文字体（解决中文显示乱码问题）
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-print("=" * 60)
-print("装备制造领域情感分析系统（修正版）")
-print("工作目录:", os.getcwd())
-print("=" * 60)
+DIMENSIONS = ['技术难度', '创新程度', '投入程度', '成就高度', '影响广度']
+# 各维度关键词写在 词典.py，与图表词典一起登记；语料里的故事直接从融合命中表计数
+KEYWORD_GROUPS = RADAR_KEYWORDS['装备制造']
+
+def join_paragraphs(paragraphs):
+    """段落去掉首尾空白、过滤空行后以换行拼接"""
+    return '\n'.join(text for text in (para.strip() for para in paragraphs) if text)
 
 def read_docx_file(file_path):
     """读取docx文件内容，处理可能的读取异常"""
     try:
-        doc = Document(file_path)
-        full_text = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:  # 过滤空行
-                full_text.append(text)
-        return '\n'.join(full_text)
+        return join_paragraphs(read_paragraphs(file_path))
     except Exception as e:
         print(f"读取docx文件失败: {e}")
         return ""
 
-def extract_stories(text):
-    """提取文档中所有人物（核心+配角），适配文档表述格式"""
+def extract_stories(text, source=None):
+    """
+    提取文档中所有人物（核心+配角），适配文档表述格式
+    故事只记区间（StoryRecord），正文用 story.text 按需解码；source 为 text 的来源
+    （语料库段落用 ParagraphSource，区间直接指向语料文件），默认按 text 本身建 TextSource
+    """
+    source = source if source is not None else TextSource(text)
     stories = []
-    lines = text.split('\n')
     # 文档中所有明确出现的人物名（核心+配角）
     all_names = [
         # 核心人物
@@ -50,114 +52,80 @@ def extract_stories(text):
         "于文燕", "姜磊", "贺良", "王洪年", "许滨", "邹强"
     ]
     
-    current_name = None
-    current_content = []
+    def heading_name(line):
+        # 检查当前行是否为已知人物名的开始（支持“人名+冒号/逗号/空格”格式）
+        return next((name for name in all_names if 
+                     line.startswith(f"{name}：") or 
+                     line.startswith(f"{name},") or 
+                     line.startswith(f"{name}，") or 
+                     line == name), None)
+    
+    def save(name, spans):
+        # 内容长度放宽至50字（各行以换行连接），适配配角简短描述
+        if name and sum(e - s for s, e in spans) + len(spans) - 1 > 50:
+            stories.append(source.record(name, spans))
     
-    for line in lines:
-        line = line.strip()
+    current_name = None
+    current_spans = []
+    pos = 0
+    for raw in text.split('\n'):
+        line = raw.strip()
+        line_start = pos + len(raw) - len(raw.lstrip())
+        line_end = line_start + len(line)
+        pos += len(raw) + 1
         if not line:
             continue
         
-        # 检查当前行是否为已知人物名的开始（支持“人名+冒号/逗号/空格”格式）
-        name_match = next((name for name in all_names if 
-                          line.startswith(f"{name}：") or 
-                          line.startswith(f"{name},") or 
-                          line.startswith(f"{name}，") or 
-                          line == name), None)
+        name_match = heading_name(line)
         if name_match:
-            # 保存上一个人物的故事（内容长度放宽至50字，适配配角简短描述）
-            if current_name and len('\n'.join(current_content)) > 50:
-                stories.append({
-                    'name': current_name,
-                    'content': '\n'.join(current_content)
-                })
-            # 初始化新人物的故事收集
+            # 保存上一个人物的故事，开始收集新人物
+            save(current_name, current_spans)
             current_name = name_match
-            current_content = []
-            # 提取人物名后的内容（修复变量名错误：name→name_match）
+            current_spans = []
+            # 提取人物名后的内容（去掉「人名：」或「人名，」）
             if line != current_name:
-                if line.startswith(f"{name_match}："):
-                    current_content.append(line.replace(f"{name_match}：", '').strip())
-                elif line.startswith(f"{name_match},") or line.startswith(f"{name_match}，"):
-                    current_content.append(line.replace(f"{name_match},", '').replace(f"{name_match}，", '').strip())
+                removed = [f"{name_match}："] if line.startswith(f"{name_match}：") else [f"{name_match},", f"{name_match}，"]
+                current_spans.extend(strip_spans(text, line_start, line_end, removed))
         elif current_name:
-            # 收集当前人物的后续内容（遇到其他人物名则停止）
-            next_name = next((name for name in all_names if 
-                            line.startswith(f"{name}：") or 
-                            line.startswith(f"{name},") or 
-                            line.startswith(f"{name}，") or 
-                            line == name), None)
-            if not next_name:
-                current_content.append(line)
+            # 收集当前人物的后续内容（遇到其他人物名时已在上面切换）
+            current_spans.append((line_start, line_end))
     
     # 保存最后一个人物的故事
-    if current_name and len('\n'.join(current_content)) > 50:
-        stories.append({
-            'name': current_name,
-            'content': '\n'.join(current_content)
-        })
+    save(current_name, current_spans)
     
     # 去重（避免同一人物被多次提取）
     unique_stories = []
     seen_names = set()
     for story in stories:
-        if story['name'] not in seen_names:
-            seen_names.add(story['name'])
+        if story.name not in seen_names:
+            seen_names.add(story.name)
             unique_stories.append(story)
     
     return unique_stories
 
-def calculate_dimension_scores(text):
-    """优化维度分数计算：扩充投入程度关键词，调整分数权重"""
-    # 1. 技术难度维度（保持原有逻辑，补充行业特色关键词）
-    tech_keywords = ['技术', '工艺', '操作', '设备', '机器', '系统', '精密', '精确', 
-                    '高难度', '复杂', '精细', '难题', '挑战', '高级', '尖端', '高科技',
-                    '微米', '毫米', '丝', '精度', '误差', '密封', '焊接', '研磨',
-                    '深孔', '锻造', '铸造', '组装', '调试', '镗加工', '铅柱']
-    tech_count = sum(text.count(word) for word in tech_keywords)
-    tech_score = min(tech_count / (len(text)/3000 + 1) * 0.8, 0.95)
-    
-    # 2. 创新程度维度（保持原有逻辑）
-    innov_keywords = ['创新', '创造', '发明', '研发', '改进', '优化', '首创', '独创',
-                     '专利', '自主研发', '自主设计', '革新', '突破', '新方法', '新工艺']
-    innov_count = sum(text.count(word) for word in innov_keywords)
-    innov_score = min(innov_count / (len(text)/2500 + 1) * 0.9, 0.95)
-    
-    # 3. 投入程度维度（核心优化：扩充关键词，调整权重）
-    commit_keywords = [
-        # 原有抽象关键词
-        '刻苦', '努力', '坚持', '奋斗', '钻研', '专注', '投入', '付出',
-        '日夜', '加班', '训练', '练习', '苦练', '拼搏', '辛勤',
-        # 新增场景化关键词（适配文档表述）
-        '吃住厂', '通宵', '反复试验', '摸索', '自费', '啃资料', '查单词',
-        '千百次', '上万次', '几年', '数十年', '毕生', '扎根', '坚守',
-        '废寝忘食', '不辞辛劳', '克服困难', '迎难而上', '毫无保留'
-    ]
-    commit_count = sum(text.count(word) for word in commit_keywords)
-    # 提高权重系数（从0.85→1.0），降低分母系数（从2000→1500），提升分数敏感度
-    commit_score = min(commit_count / (len(text)/1500 + 1) * 1.0, 0.95)
-    
-    # 4. 成就高度维度（保持原有逻辑）
-    achiev_keywords = ['成功', '成就', '突破', '荣誉', '奖励', '表彰', '完成', '实现',
-                      '获奖', '冠军', '第一', '纪录', '成果', '胜利', '卓越', '辉煌',
-                      '专家', '大师', '能手', '标兵', '先进', '首席', '顶尖', '领先']
-    achiev_count = sum(text.count(word) for word in achiev_keywords)
-    achiev_score = min(achiev_count / (len(text)/1500 + 1) * 1.0, 0.95)
-    
-    # 5. 影响广度维度（保持原有逻辑）
-    impact_keywords = ['影响', '贡献', '价值', '意义', '重要', '关键', '推动', '促进',
-                      '国际', '全球', '世界', '国家', '行业', '领域', '领先', '先进',
-                      '出口', '自主知识产权', '大国重器', '海洋强国', '高铁名片']
-    impact_count = sum(text.count(word) for word in impact_keywords)
-    impact_score = min(impact_count / (len(text)/1800 + 1) * 0.9, 0.95)
+def story_hits(stories, corpus=None):
+    """故事 × 五个维度 的命中前缀和：给了 corpus 时取自融合命中表，否则扫描各篇正文"""
+    return story_density(stories, *KEYWORD_GROUPS.values(), corpus=corpus)
+
+def score_stories(density, with_hits=False):
+    """优化维度分数计算：命中前缀和（story_hits）→ N×5 矩阵，调整分数权重（with_hits 时同时返回命中数）"""
+    counts = density.totals()
+    text_len = (density.spans[:, 1] - density.spans[:, 0]).astype(np.float64)[:, None]
     
-    # 确保分数在0.2-0.95之间（提高最低分，避免过低）
-    scores = [tech_score, innov_score, commit_score, achiev_score, impact_score]
-    scores = [min(max(score, 0.2), 0.95) for score in scores]
+    # 列依次为 技术、创新、投入、成就、影响
+    # 投入程度：提高权重系数（从0.85→1.0），降低分母系数（从2000→1500），提升分数敏感度
+    spans = np.array([3000, 2500, 1500, 1500, 1800])
+    weights = np.array([0.8, 0.9, 1.0, 1.0, 0.9])
+    scores = np.minimum(counts / (text_len / spans + 1) * weights, 0.95)
     
-    return scores
+    # 确保分数在0.2-0.95之间（提高最低分，避免过低）
+    scores = np.clip(scores, 0.2, 0.95)
+    return (scores, counts) if with_hits else scores
 
-def create_radar_chart(stories):
+def calculate_dimension_scores(text):
+    return score_stories(story_hits([StoryRecord.from_text(None, text)]))[0].tolist()
+
+def create_radar_chart(stories, scores=None):
     """创建雷达图：优化布局，支持更多人物显示"""
     if not stories:
         print("没有数据生成雷达图")
@@ -166,7 +134,7 @@ def create_radar_chart(stories):
     print(f"开始为 {len(stories)} 个人物生成雷达图...")
     
     # 雷达图基础配置
-    dimensions = ['技术难度', '创新程度', '投入程度', '成就高度', '影响广度']
+    dimensions = DIMENSIONS
     n_dim = len(dimensions)
     angles = np.linspace(0, 2 * np.pi, n_dim, endpoint=False).tolist()
     angles += angles[:1]
@@ -182,11 +150,15 @@ def create_radar_chart(stories):
               '#98FB98', '#DDA0DD', '#F0E68C', '#FFB6C1', '#87CEEB',
               '#D3D3D3', '#F4A460', '#20B2AA', '#9370DB', '#32CD32']
     
+    # 前 12 个人物一次打分
+    if scores is None:
+        scores = score_stories(story_hits(stories[:12]))
+    all_scores = scores[:12]
     # 遍历所有人物绘制（限制12人，避免图表拥挤）
     for i, story in enumerate(stories[:12]):
-        name = story['name']
-        scores = calculate_dimension_scores(story['content'])
-        scores_closed = scores + scores[:1]
+        name = story.name
+        person_scores = all_scores[i].tolist()
+        scores_closed = person_scores + person_scores[:1]
         
         ax1.plot(angles, scores_closed, 'o-', linewidth=2, 
                 label=name, color=colors[i % len(colors)])
@@ -204,9 +176,6 @@ def create_radar_chart(stories):
     # 子图2：平均情感维度分析（保持原有逻辑，优化数值标签）
     ax2 = fig.add_subplot(122, polar=True)
     
-    all_scores = []
-    for story in stories[:12]:
-        all_scores.append(calculate_dimension_scores(story['content']))
     avg_scores = np.mean(all_scores, axis=0)
     std_scores = np.std(all_scores, axis=0)
     
@@ -260,9 +229,7 @@ def analyze_sentiment_simple(text):
                      '头疼', '憋屈', '艰苦', '痛苦', '挫折', '障碍', '不足', '缺点',
                      '报废', '返工', '延误', '损坏', '复杂', '繁琐', '疲劳', '危险']
     
-    text_lower = text.lower()
-    pos_count = sum(text_lower.count(word.lower()) for word in positive_words)
-    neg_count = sum(text_lower.count(word.lower()) for word in negative_words)
+    pos_count, neg_count = count_groups(text, positive_words, negative_words, ignore_case=True)
     
     if pos_count + neg_count > 0:
         score = pos_count / (pos_count + neg_count)
@@ -271,8 +238,19 @@ def analyze_sentiment_simple(text):
     
     return score, pos_count, neg_count
 
+def load_stories(corpus):
+    """五行业统一分析入口用：从已加载的语料库取装备制造.docx 的段落"""
+    source = ParagraphSource(corpus, '装备制造')
+    return extract_stories(source.text, source)
+
 def main():
     """主程序：串联所有功能"""
+    # 设置工作目录（已按要求改为E:\）
+    os.chdir('E:\\')
+    print("=" * 60)
+    print("装备制造领域情感分析系统（修正版）")
+    print("工作目录:", os.getcwd())
+    print("=" * 60)
     print("正在启动装备制造领域情感分析（修正版）...")
     
     # 1. 检查文件
@@ -299,8 +277,8 @@ def main():
     # 显示所有提取的人物
     print("\n提取的人物列表：")
     for i, story in enumerate(stories, 1):
-        content_len = len(story['content'])
-        print(f"  {i:2d}. {story['name']:12s} - 内容长度: {content_len:6d} 字符")
+        content_len = len(story.text)
+        print(f"  {i:2d}. {story.name:12s} - 内容长度: {content_len:6d} 字符")
     
     # 4. 情感分析
     results = []
@@ -309,7 +287,8 @@ def main():
     print("-" * 50)
     
     for story in stories:
-        score, pos_count, neg_count = analyze_sentiment_simple(story['content'])
+        content = story.text
+        score, pos_count, neg_count = analyze_sentiment_simple(content)
         if score > 0.6:
             sentiment = '积极'
         elif score < 0.4:
@@ -318,15 +297,15 @@ def main():
             sentiment = '中性'
         
         results.append({
-            '姓名': story['name'],
+            '姓名': story.name,
             '情感倾向': sentiment,
             '情感分数': round(score, 3),
             '积极关键词数': pos_count,
             '消极关键词数': neg_count,
-            '故事内容长度': len(story['content'])
+            '故事内容长度': len(content)
         })
         
-        print(f"  {story['name']:12s}: 情感={sentiment:4s} | 分数={score:.3f} | "
+        print(f"  {story.name:12s}: 情感={sentiment:4s} | 分数={score:.3f} | "
               f"积极词={pos_count:2d} | 消极词={neg_count:2d}")
     
     # 5. 保存结果到CSV
@@ -3,20 +3,26 @@
 装备制造轮廓内词云（已去停用词）
 """
 import os
-import jieba
+import re
 import numpy as np
 import cv2
 from PIL import Image
 from wordcloud import WordCloud
 from matplotlib import pyplot as plt
-from docx import Document
+from 语料库 import load_corpus
+from 文档词项矩阵 import load_dtm
+from 分词 import craftsman_names
 
 # ------------------------------------------------
 # 1. 读 Word 并分词 + 去停用词
 # ------------------------------------------------
-doc_path = "装备制造.docx"
-doc = Document(doc_path)
-text = '\n'.join(p.text for p in doc.paragraphs if p.text.strip())
+industry = "装备制造"
+# 词频直接取缓存的句级文档-词项矩阵（五个行业一次汇总），改停用词后重跑不会重新切词；
+# 工匠姓名已作为用户词典整词切出，列号即共享词表里的 int32 词编号
+dtm = load_dtm(load_corpus())
+counts, industries = dtm.by_industry()
+vocab = dtm.vocab
+freq = dtm.row_counts(counts, industries.index(industry))
 
 # 简单停用词表（可继续往里面加）
 stop = {'我们',"一个","零件", "文墨","这个","就是","文波","自己","剑锋","马荣","王曙群","顾秋亮","延安","曹彦生","常晓飞",
@@ -27,8 +33,10 @@ stop = {'我们',"一个","零件", "文墨","这个","就是","文波","自己"
         '洪家', '闫敏', '那个', "梅琳", '的话', '之一', '一些',
         '所有', '每个', '各种', '这项', '该', '本', '将', '了', '的', '和', '与', '在', '为', '是', '对', '及', '等', '等等'}
 
-words = [w for w in jieba.lcut(text)
-         if len(w) > 1 and w not in stop]
+# 过滤条件都是词表上的布尔掩码：单字、标点空白、停用词、人名（人名不进词云）
+word_like = np.fromiter((re.match(r"\w", w) is not None for w in vocab.words), dtype=bool, count=len(vocab))
+keep = (vocab.lengths() > 1) & word_like & ~vocab.mask(stop) & ~vocab.mask(craftsman_names())
+frequencies = dict(vocab.top(freq * keep))
 
 # ------------------------------------------------
 # 2. 生成“装备制造”二值 mask（轮廓=255，其余=0）
@@ -69,7 +77,7 @@ wc = WordCloud(
         contour_width=1,
         contour_color='yellow',
         scale=2
-).generate(' '.join(words))
+).generate_from_frequencies(frequencies)
 
 # ------------------------------------------------
 # 4. 保存 & 显示
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+图表与雷达图的全部词典（唯一登记处）
+热力图 INDUSTRY_DICT / QUALITY_DICT、时序图 LEX、柱形图 spirit_dict、雷达图各维度的关键词组都写在这里，
+模块导入时经 词典注册.register 登记；各脚本从这里取自己的那一份，
+融合命中表（融合分析）按登记的全部词对整份语料只扫描一遍。
+改词、加词只改本文件：命中表缓存以词表定版本，词有变化时自动重建。
+用法：
+    from 词典 import INDUSTRY_DICTS, QUALITY_DICTS, TIMELINE_LEX, SPIRIT_DICTS, RADAR_KEYWORDS
+    INDUSTRY_DICT = INDUSTRY_DICTS["航天军工"]
+    LEX = TIMELINE_LEX["航天军工"]
+    KEYWORD_GROUPS = RADAR_KEYWORDS["航天军工"]      # {维度: 关键词列表}，顺序同雷达图 DIMENSIONS
+"""
+from 词典注册 import register
+
+# ---------- 1. 热力图：行业 × 品质（按句共现）----------
+INDUSTRY_DICTS = {
+    "航天军工": {
+        "数控加工": ["数控铣工", "常晓飞", "数控微雕", "0.03毫米", "0.15毫米"],
+        "火箭总装": ["崔蕴", "长征五号", "火箭总装", "咽喉主刀师", "喷管"],
+        "飞船总装": ["张舸", "神舟", "飞船总装", "γ放射源", "盲操作"],
+        "航天焊接": ["郑兴", "空间站", "舱体焊接", "300米焊缝", "气孔"],
+        "雷达装配": ["顾春燕", "金线键合", "太赫兹雷达", "微米级", "芯片键合"],
+        "导弹加工": ["阎敏", "导弹", "咽喉主刀师", "0.005毫米", "喷管"],
+        "航天材料": ["韩利萍", "长征七号", "发射平台", "四通均流阀", "0.02毫米"],
+        "航天对接": ["王曙群", "太空之吻", "对接机构", "100-1=0", "热循环"]
+    },
+    "能源电力": {
+        "核电维修": ["陈永伟", "核电站", "反应堆", "0.1毫米", "传感器"],
+        "特高压带电": ["王进", "特高压", "带电检修", "1000千伏", "秋千法"],
+        "核电燃料": ["乔素凯", "核燃料", "水下修复", "四米长杆", "零失误"],
+        "电能计量": ["黄金娟", "电能表", "自动化检定", "2秒钟", "58倍"],
+        "火电焊接": ["胡家瑞", "热电", "焊缝", "良心", "四十年"],
+        "水电吊装": ["梅琳", "白鹤滩", "转子吊装", "1毫米", "2300吨"]
+    },
+    "文化传承": {
+        "宣纸晒纸": ["毛胜利", "晒纸", "三丈三", "11米", "头刷"],
+        "宣纸捞纸": ["周东红", "捞纸", "7秒", "1800张", "100%正品率"],
+        "古编钟": ["刘佑年", "编钟", "调音", "22道工序", "双音"],
+        "古丝绸": ["王亚蓉", "丝绸", "东周", "2600年", "0.1毫米"],
+        "书画修复": ["单嘉玖", "书画修复", "揭", "全色", "画医"],
+        "硬币雕刻": ["余敏", "硬币", "牡丹币", "熊猫币", "0.07毫米"],
+        "钞票雕刻": ["马荣", "人民币", "凹版雕刻", "0.16毫米", "毛泽东像"]
+    },
+    "装备制造": {
+        "ROV操控": ["韩超", "ROV", "深海一号", "1500米", "脐带缆"],
+        "设备再造": ["刘云清", "改造", "1微米", "清洗机", "复兴号"],
+        "货车焊接": ["易冉", "C70E", "铁路货车", "0.2毫米", "超声波"],
+        "转向架研磨": ["宁允展", "定位臂", "0.05毫米", "转向架", "研磨"],
+        "铸造控制": ["毛正石", "铸造", "10℃", "0误差", "叶片"],
+        "深孔加工": ["戎鹏强", "深孔", "0.01毫米", "身管", "火炮"]
+    },
+    "基建工程": {
+        "航空制造": ["运-20", "C919", "大飞机", "机身", "钣金", "舱门", "蒙皮", "胡洋", "王伟"],
+        "核电建设": ["核电站", "主管道", "焊工", "未晓朋", "田湾", "核电", "焊缝"],
+        "射电望远镜": ["FAST", "反射面板", "吊装", "周永和", "射电望远镜", "天眼"],
+        "海底隧道/桥梁": ["港珠澳大桥", "沉管", "管延安", "海底隧道", "深中通道", "大连湾"],
+        "LNG船舶": ["LNG船", "殷瓦钢", "张冬伟", "液化天然气", "围护系统"]
+    },
+}
+
+QUALITY_DICTS = {
+    "航天军工": {
+        "精度": ["毫米", "微米", "0.03", "0.005", "0.02", "丝"],
+        "责任": ["生命", "安全", "航天员", "零缺陷", "100-1=0"],
+        "创新": ["绝技", "首创", "改进", "发明", "操作法"],
+        "专注": ["盲操作", "手感", "反复", "凌晨", "十万次"],
+        "吃苦": ["高温", "60度", "晕船", "通宵", "加班"],
+        "学习": ["博士", "读书", "返校", "理论", "新知"],
+        "协作": ["团队", "师徒", "传帮带", "班组", "合力"],
+        "极致": ["100%", "零缺陷", "万无一失", "完美", "极值"]
+    },
+    "能源电力": {
+        "精度": ["毫米", "0.1毫米", "1毫米", "2毫米", "微米"],
+        "责任": ["零失误", "良心", "安全", "生命", "零缺陷"],
+        "创新": ["自动化", "首创", "改进", "秋千法", "2秒钟"],
+        "专注": ["四十年", "26年", "手感", "专注", "肌肉记忆"],
+        "吃苦": ["高温", "高空", "60米", "暴晒", "严寒"],
+        "学习": ["博士", "读书", "标准", "专利", "论文"],
+        "协作": ["团队", "师徒", "班组", "合力", "传帮带"],
+        "极致": ["100%", "58倍", "零缺陷", "完美", "极高"]
+    },
+    "文化传承": {
+        "精度": ["毫米", "0.1毫米", "0.07毫米", "0.16毫米", "双音"],
+        "责任": ["100%正品率", "画医", "传世", "零缺陷", "国家形象"],
+        "创新": ["复活", "复刻", "失传", "改进", "首创"],
+        "专注": ["7秒", "22道工序", "30年", "40年", "揭"],
+        "吃苦": ["酷暑", "弯腰", "腰椎", "胃病", "熬夜"],
+        "学习": ["自学", "实验考古", "研究", "美院", "技艺"],
+        "协作": ["师徒", "三人组", "传承", "传帮带", "合作"],
+        "极致": ["100%", "零瑕疵", "完美", "极高", "唯一"]
+    },
+    "装备制造": {
+        "精度": ["微米", "0.05毫米", "0.01毫米", "10℃", "0.2毫米"],
+        "责任": ["零误差", "生命", "安全", "军品", "万无一失"],
+        "创新": ["改造", "再造", "首创", "操作法", "突破"],
+        "专注": ["0.01毫米", "纯手工", "研磨", "深孔", "专注"],
+        "吃苦": ["高温", "高空", "加班", "熬夜", "连续"],
+        "学习": ["自学", "编程", "机器人", "软件", "标准"],
+        "协作": ["团队", "班组", "师徒", "合力", "传帮带"],
+        "极致": ["100%", "零缺陷", "极高", "完美", "顶尖"]
+    },
+    "基建工程": {
+        "精度": ["毫米", "0.5毫米", "0.25毫米", "误差", "精度", "严丝合缝", "缝隙"],
+        "责任": ["责任", "耻辱", "荣耀", "名字", "刻", "终身", "一辈子"],
+        "创新": ["数字化", "零的突破", "第一次", "首创", "革命性", "探索"],
+        "专注": ["专注", "耐心", "重复", "一遍又一遍", "再检查", "强迫症"],
+        "吃苦": ["高温", "汗水", "狭小", "闷热", "烫", "疼", "苦"],
+        "学习": ["学习", "笔记", "日志", "培训", "请教", "啃", "坚持"],
+        "协作": ["团队", "合力", "配合", "并肩", "专家团", "几十人"],
+        "极致": ["百分之百", "100%", "0漏点", "天衣无缝", "无可挑剔", "完美"]
+    },
+}
+
+# ---------- 2. 时序图：六维情感（「词1|词2|…」交替式，按小句计数）----------
+TIMELINE_LEX = {
+    "航天军工": {
+        "自豪":   "自豪|骄傲|振奋|长脸|激动|为国争光",
+        "敬佩":   "敬佩|致敬|崇高|伟大|了不起|佩服",
+        "感动":   "感动|泪目|暖心|热泪盈眶|触动",
+        "坚守":   "坚守|耐得住寂寞|30年如一日|扎根|默默",
+        "精益求精": "精益求精|零差错|毫厘|极致|完美|一丝不苟",
+        "报国":   "报国|航天梦|强军|为国铸剑|奉献|忠诚"
+    },
+    "能源电力": {
+        "坚守":   "坚守|执着|30年如一日|扎根|一辈子|长周期",
+        "匠心":   "匠心|精益求精|零差错|毫厘|完美|一丝不苟|手感",
+        "安全":   "安全|零事故|无小事|核电|特高压|带电作业|生命",
+        "创新":   "创新|突破|卡脖子|专利|自动化|智能化|发明",
+        "自豪":   "自豪|骄傲|大国重器|国家名片|世界之最|首创",
+        "担当":   "担当|责任|守护|保障|民生|国家需要|使命"
+    },
+    "文化传承": {
+        "坚守":   "坚守|传承|坚持|执着|耐得住寂寞|30年如一日|磨性情",
+        "匠心":   "匠心|精益求精|零差错|毫厘|完美|一丝不苟|妙手回春",
+        "敬畏":   "敬畏|敬畏心|小心翼翼|如履薄冰|文物为生命|不能断",
+        "自豪":   "自豪|骄傲|国宝|皇冠明珠|中华文化|民族|传世",
+        "感动":   "感动|泪目|暖心|触动|震撼|情不自禁",
+        "创新":   "创新|突破|失传|复活|复制|复原|模拟考古"
+    },
+    "装备制造": {
+        "精度":   "精度|微米|丝|0.01|丝毫|零误差|一点不能差",
+        "匠心":   "匠心|精益求精|手工|研磨|錾刻|绣花|极致",
+        "创新":   "创新|改造|发明|专利|自动化|智能化|产线",
+        "坚守":   "坚守|30年|40年|一辈子|传帮带|扎根",
+        "自豪":   "自豪|大国重器|金名片|世界之最|首创",
+        "担当":   "担当|责任|国家需要|使命|保障|安全"
+    },
+    "基建工程": {
+        "精度":   "精度|毫米|微米|丝|零误差|毫米级|厘米级",
+        "匠心":   "匠心|精益求精|手工|研磨|吊装|吊装工|钳工",
+        "安全":   "安全|零事故|滴水不漏|人命|风险|守护",
+        "创新":   "创新|突破|首创|模拟|自动化|机器人|新工艺",
+        "坚守":   "坚守|30年|40年|一辈子|传帮带|扎根|归零",
+        "自豪":   "自豪|大国工程|超级工程|世界之最|中国奇迹"
+    },
+}
+
+# ---------- 3. 柱形图：精神品质正则（按整篇文档计数，re.I）----------
+SPIRIT_DICTS = {
+    # 通用关键词正则（已融合四领域原文高频句）
+    "航天-能源-文化-装备": {
+        '精益求精': [
+            r'0\.5毫米', r'误差不能超过.*?毫米', r'零误差', r'零缺陷', r'25毫米以内', r'9%', r'滴水不漏', r'精益求精', r'一丝.*?苟',
+            r'毫厘不差', r'芝麻粒大小', r'精度能达到毫米级', r'面板的吻合误差不能超过两毫米', r'接缝的间隙必须小于1毫米',
+            r'0\.03毫米', r'0\.02毫米', r'0\.005毫米', r'1毫米以内', r'移动距离控制在一毫米以内', r'头发丝.*?1/3', r'头发丝粗细',
+            r'不允许超过.*?毫米', r'微米级', r'两丝', r'1 6威尼', r'99\.994%', r'10微米', r'5微米', r'0\.1毫米', r'0\.16毫米'
+        ],
+        '坚韧不拔': [
+            r'咬牙坚持', r'坚持.*?日夜', r'270多天', r'连续.*?焊', r'返工', r'烧坏.*?再修', r'失败.*?次', r'重来',
+            r'每天干的是高强度体力活', r'手掌磨出血泡', r'没有淡水', r'住的是草棚', r'4平方米', r'宁让汗水漂起船',
+            r'豁出命也要建好', r'冬天来临前', r'吃住在船上', r'昼夜不停', r'一次次进行.*?试验', r'松螺丝、拧螺丝的机械动作',
+            r'靠小推车.*?一寸寸地拼接', r'蹲着练习', r'蹲半个小时', r'25年', r'30年', r'40年', r'近四十', r'两千万次',
+            r'一万小时定律', r'8000次', r'6000多公里', r'2000多次试验', r'上万次的重复'
+        ],
+        '创新突破': [
+            r'数字化.*?零的突破', r'首创', r'自主研发', r'0到1', r'前所未有', r'第一次.*?设计', r'第一次.*?启用', r'突破',
+            r'革命性变革', r'效率提高百倍', r'世界最长外海沉管隧道', r'厘米级精确对接', r'世界天眼', r'500米口径', r'40多万块反射面',
+            r'圆规理论', r'原绘模式', r'钢板的自然下垂', r'顺势而下', r'中国奇迹', r'超级工程', r'多个世界之最',
+            r'变极性等离子弧焊接', r'秋千法', r'电动液压桥塞坐封工具', r'航空发动机叶片滚轮精密磨削技术', r'电能表自动化检定',
+            r'智能化计量检定', r'三级除氢法', r'反变形补偿法', r'风动砂轮纯手工研磨操作法', r'望闻问切', r'蒙眼锉削'
+        ],
+        '敬业奉献': [
+            r'一辈子的事业', r'自豪', r'荣耀', r'使命', r'我的名字.*?绑在那', r'默默奉献', r'无涉名利',
+            r'生在这个时代', r'参与这么重要的一个型号', r'幸运', r'无法用语言来形容', r'亲历者',
+            r'光荣退休证挂在客厅', r'不是国产的飞机就不坐', r'等着中国大飞机重启', r'放弃每个月五六千元收入',
+            r'先当三个月的施工', r'每天清晨第一个来到车间', r'只专注于钣金工作', r'择一事终一生', r'守艺人',
+            r'把产品当作艺术品来雕琢', r'把航天品质当作生命来守护', r'国为重、家为轻', r'择一事终一生'
+        ],
+        '责任担当': [
+            r'核安全', r'飞行中解体', r'船毁人亡', r'泄漏', r'生态环境', r'后果不堪设想', r'终身负责', r'刻工号',
+            r'飞机上任何一个小孔出现问题', r'可能导致飞行中解体', r'核电站相当于就报废了', r'对生态环境产生很大的影响',
+            r'焊条燃烧过程中产生气孔', r'应力集中', r'容易产生裂纹', r'接口可能断裂',
+            r'我的名字那道口和我的名字紧紧绑在那', r'干不好那就是我的耻辱', r'不允许任何隐患出坞门',
+            r'100-1=0', r'零缺陷', r'万无一失', r'把每一枚弹药都当作工艺品', r'把每一颗螺钉拧紧力矩保持一致'
+        ]
+    },
+    # 5 个精神品质的关键词正则（按实际原文提炼）
+    "基建工程": {
+        '精益求精': [
+            # 原有
+            r'0\.5毫米', r'误差不能超过.*?毫米', r'零误差', r'零缺陷', r'25毫米以内', r'9%', r'滴水不漏', r'精益求精', r'一丝.*?苟',
+            # 新增——全部出自原文
+            r'毫厘不差', r'芝麻粒大小', r'精度能达到毫米级', r'误差不超过.*?毫米', r'面板的吻合误差不能超过两毫米',
+            r'接缝的间隙必须小于1毫米', r'用手摸一摸盘面', r'再检查一次', r'反复检查', r'不让隐患出坞门',
+            r'听感绝技', r'手感', r'99%提高到99\.99%', r'研磨油', r'砂纸上均匀地画圈'
+        ],
+
+        '坚韧不拔': [
+            # 原有
+            r'咬牙坚持', r'坚持.*?日夜', r'270多天', r'连续.*?焊', r'返工', r'烧坏.*?再修', r'失败.*?次', r'重来',
+            # 新增
+            r'每天干的是高强度体力活', r'手掌磨出血泡', r'没有淡水', r'住的是草棚', r'4平方米',
+            r'宁让汗水漂起船', r'豁出命也要建好', r'冬天来临前', r'吃住在船上', r'昼夜不停',
+            r'一次次进行.*?试验', r'松螺丝、拧螺丝的机械动作', r'靠小推车.*?一寸寸地拼接'
+        ],
+
+        '创新突破': [
+            # 原有
+            r'数字化.*?零的突破', r'首创', r'自主研发', r'0到1', r'前所未有', r'第一次.*?设计', r'第一次.*?启用', r'突破',
+            # 新增
+            r'革命性变革', r'大飞机机身数字化装配零的突破', r'效率提高百倍', r'世界最长外海沉管隧道', r'厘米级精确对接',
+            r'世界天眼', r'500米口径', r'40多万块反射面', r'圆规理论', r'原绘模式',
+            r'钢板的自然下垂', r'顺势而下', r'中国奇迹', r'超级工程', r'多个世界之最'
+        ],
+
+        '敬业奉献': [
+            # 原有
+            r'一辈子的事业', r'自豪', r'荣耀', r'使命', r'我的名字.*?绑在那', r'默默奉献', r'无涉名利',
+            # 新增
+            r'生在这个时代', r'参与这么重要的一个型号', r'幸运', r'无法用语言来形容', r'亲历者',
+            r'光荣退休证挂在客厅', r'不是国产的飞机就不坐', r'等着中国大飞机重启', r'放弃每个月五六千元收入',
+            r'先当三个月的施工', r'每天清晨第一个来到车间', r'只专注于钣金工作'
+        ],
+
+        '责任担当': [
+            # 原有
+            r'核安全', r'飞行中解体', r'船毁人亡', r'泄漏', r'生态环境', r'后果不堪设想', r'终身负责', r'刻工号',
+            # 新增
+            r'飞机上任何一个小孔出现问题', r'可能导致飞行中解体', r'核电站相当于就报废了', r'对生态环境产生很大的影响',
+            r'焊条燃烧过程中产生气孔', r'应力集中', r'容易产生裂纹', r'接口可能断裂',
+            r'我的名字那道口和我的名字紧紧绑在那', r'干不好那就是我的耻辱', r'不允许任何隐患出坞门'
+        ]
+    },
+}
+
+# ---------- 4. 雷达图：各行业五个维度的关键词组（可带权重），按工匠故事计数 ----------
+RADAR_KEYWORDS = {
+    "航天军工": {
+        "技术难度": ['数控', '焊接', '铆接', '微米', '毫米', '精度', '密封', '喷管', '雷达', '导弹', '火箭', '飞船', '异形', '薄壁', '零公差'],
+        "创新程度": ['创新', '发明', '专利', '改进', '突破', '新工艺', '数字化', '自主研发'],
+        "投入程度": ['刻苦', '苦练', '钻研', '坚守', '日夜', '加班', '数十年', '一辈子', '精益求精'],
+        "成就高度": ['全国五一劳动奖章', '大国工匠', '国家科技进步奖', '神舟', '长征', '航母', '阅兵', '100%合格率'],
+        "影响广度": ['国家', '国防', '航天强国', '报国', '自主可控', '国家安全', '领空安全'],
+    },
+    "能源电力": {
+        # 1. 安全把控度 - 大幅扩展并提高权重
+        "安全把控度": [
+            ('安全', 2), ('可靠', 2), ('防护', 2), ('零事故', 5), ('零失误', 5),
+            ('万无一失', 5), ('无差错', 4), ('防辐射', 4), ('辐射安全', 4),
+            ('密封', 2), ('防泄漏', 3), ('防爆', 3), ('绝缘', 2),
+            ('应急预案', 3), ('安全措施', 3), ('安全规程', 3), ('安全生产', 3),
+            ('生命保障', 4), ('人身安全', 4), ('设备安全', 3), ('运行安全', 3),
+            ('稳定运行', 2), ('平稳运行', 2), ('可控', 2), ('受控', 2),
+            ('在控', 2), ('安全保障', 4), ('安全可靠', 3), ('安全稳定', 3),
+            ('防护到位', 4), ('措施完善', 3), ('规程严格', 3), ('操作规范', 3),
+            ('风险控制', 3), ('隐患排除', 4), ('事故预防', 4), ('安全第一', 3)
+        ],
+        # 2. 技术精密度
+        "技术精密度": [
+            ('精度', 3), ('精密', 3), ('精准', 3), ('精确', 3), ('毫米', 3),
+            ('微米', 4), ('纳米', 4), ('0.1毫米', 5), ('0.5毫米', 5), ('1毫米', 4),
+            ('误差', 2), ('公差', 2), ('偏差', 2), ('校准', 3), ('校验', 3),
+            ('检定', 3), ('测量', 2), ('计量', 2), ('标准化', 2), ('规范化', 2),
+            ('精益求精', 4), ('精雕细琢', 4), ('精工细作', 4), ('一丝不苟', 4),
+            ('分毫不差', 5), ('毫厘不差', 5), ('工艺精湛', 4), ('技术高超', 4),
+            ('专业精湛', 4), ('技艺纯熟', 4), ('手法娴熟', 4), ('操作精准', 4)
+        ],
+        # 3. 创新突破力
+        "创新突破力": [
+            ('创新', 3), ('发明', 4), ('研发', 3), ('研制', 3), ('开发', 2),
+            ('设计', 2), ('改进', 2), ('优化', 2), ('升级', 2), ('革新', 3),
+            ('突破', 4), ('攻克', 4), ('破解', 4), ('解决', 2), ('实现', 2),
+            ('成功', 2), ('首创', 5), ('独创', 5), ('原创', 4), ('自主', 3),
+            ('自主研发', 5), ('自主创新', 5), ('专利', 4), ('发明专利', 5),
+            ('新技术', 3), ('新方法', 3), ('新工艺', 3), ('新材料', 3),
+            ('智能化', 3), ('自动化', 3), ('数字化', 3), ('信息化', 2),
+            ('填补空白', 5), ('国内首创', 5), ('国际领先', 5), ('世界先进', 5),
+            ('行业领先', 4), ('技术突破', 4), ('工艺创新', 4), ('方法创新', 4)
+        ],
+        # 4. 行业贡献度
+        "行业贡献度": [
+            ('贡献', 3), ('奉献', 3), ('价值', 2), ('效益', 2), ('成效', 2),
+            ('成绩', 2), ('成就', 3), ('成果', 2), ('经济效益', 4), ('社会效益', 4),
+            ('创造价值', 4), ('降低成本', 3), ('节约成本', 3), ('提高效率', 3),
+            ('提升效率', 3), ('服务社会', 4), ('服务国家', 4), ('服务民生', 4),
+            ('保障供应', 4), ('保障需求', 3), ('保障运行', 3), ('保障安全', 4),
+            ('推动发展', 4), ('促进发展', 3), ('助力发展', 3), ('支持发展', 3),
+            ('培养人才', 4), ('培训人才', 3), ('传授经验', 3), ('传承技艺', 4),
+            ('带动团队', 3), ('带领团队', 3), ('指导团队', 3), ('管理团队', 2),
+            ('重大贡献', 5), ('突出贡献', 5), ('显著成效', 4), ('明显提升', 3)
+        ],
+        # 5. 职业坚守度
+        "职业坚守度": [
+            ('坚守', 3), ('坚持', 2), ('执着', 3), ('专注', 3), ('扎根', 3),
+            ('十年', 3), ('二十年', 4), ('三十年', 5), ('四十年', 5), ('五十年', 5),
+            ('长期', 2), ('持久', 2), ('持续', 2), ('始终', 3), ('始终如一', 4),
+            ('一如既往', 3), ('坚持不懈', 4), ('爱岗敬业', 4), ('尽职尽责', 4),
+            ('认真负责', 3), ('勤勤恳恳', 4), ('兢兢业业', 4), ('踏踏实实', 3),
+            ('默默无闻', 3), ('无私奉献', 5), ('忘我工作', 4), ('辛勤工作', 3),
+            ('努力工作', 2), ('刻苦钻研', 4), ('勤奋学习', 3), ('不断学习', 3),
+            ('持续进步', 3), ('传承', 3), ('传授', 3), ('教导', 3), ('指导', 3),
+            ('培养', 3), ('培训', 2), ('坚守岗位', 4), ('坚守一线', 4),
+            ('扎根基层', 4), ('扎根一线', 4), ('数十年如一日', 5), ('几十年如一日', 5)
+        ],
+    },
+    "文化传承": {
+        "积极程度": ['自豪', '欣慰', '满足', '成就', '荣誉', '热爱', '喜悦', '骄傲', '敬佩', '成功'],
+        "坚持程度": ['坚守', '坚持', '执着', '毅力', '数十年', '40年', '苦练', '刻苦', '专注', '恒心'],
+        "艰辛程度": ['艰辛', '困难', '挑战', '艰苦', '不易', '枯燥', '繁琐', '耗时', '磨练', '压力'],
+        "责任感": ['责任', '使命', '守护', '保护', '贡献', '传承', '弘扬', '担当', '义务', '奉献'],
+        "成就感": ['成就', '成果', '价值', '意义', '满足', '认可', '荣耀', '辉煌', '突破', '贡献'],
+    },
+    "装备制造": {
+        # 1. 技术难度维度（保持原有逻辑，补充行业特色关键词）
+        "技术难度": ['技术', '工艺', '操作', '设备', '机器', '系统', '精密', '精确', 
+                '高难度', '复杂', '精细', '难题', '挑战', '高级', '尖端', '高科技',
+                '微米', '毫米', '丝', '精度', '误差', '密封', '焊接', '研磨',
+                '深孔', '锻造', '铸造', '组装', '调试', '镗加工', '铅柱'],
+        # 2. 创新程度维度（保持原有逻辑）
+        "创新程度": ['创新', '创造', '发明', '研发', '改进', '优化', '首创', '独创',
+                '专利', '自主研发', '自主设计', '革新', '突破', '新方法', '新工艺'],
+        # 3. 投入程度维度（核心优化：扩充关键词，调整权重）
+        "投入程度": [
+            # 原有抽象关键词
+            '刻苦', '努力', '坚持', '奋斗', '钻研', '专注', '投入', '付出',
+            '日夜', '加班', '训练', '练习', '苦练', '拼搏', '辛勤',
+            # 新增场景化关键词（适配文档表述）
+            '吃住厂', '通宵', '反复试验', '摸索', '自费', '啃资料', '查单词',
+            '千百次', '上万次', '几年', '数十年', '毕生', '扎根', '坚守',
+            '废寝忘食', '不辞辛劳', '克服困难', '迎难而上', '毫无保留'
+        ],
+        # 4. 成就高度维度（保持原有逻辑）
+        "成就高度": ['成功', '成就', '突破', '荣誉', '奖励', '表彰', '完成', '实现',
+                '获奖', '冠军', '第一', '纪录', '成果', '胜利', '卓越', '辉煌',
+                '专家', '大师', '能手', '标兵', '先进', '首席', '顶尖', '领先'],
+        # 5. 影响广度维度（保持原有逻辑）
+        "影响广度": ['影响', '贡献', '价值', '意义', '重要', '关键', '推动', '促进',
+                '国际', '全球', '世界', '国家', '行业', '领域', '领先', '先进',
+                '出口', '自主知识产权', '大国重器', '海洋强国', '高铁名片'],
+    },
+    "基建工程": {
+        # 维度1：精度要求（基建核心，如毫米级误差、密封）
+        "精度要求": ['精度', '误差', '毫米', '0.5毫米', '0.25毫米', '无渗漏', '密封', '吻合误差', '厘米级', '零漏点', '精确对接'],
+        # 维度2：工程难度（基建环境挑战，如高温高压、深海）
+        "工程难度": ['高温', '高压', '高辐射', '高空', '深海', '狭小空间', '梅雨季节', '高难度', '严峻考验', '零下163℃', '复杂', '曲折'],
+        # 维度3：坚守付出（工匠投入，如长期钻研、极端作业）
+        "坚守付出": ['坚持', '日夜', '汗水', '苦练', '钻研', '十几年', '七年', '270多天', '通宵', '吃住厂', '二十多年', '十年', '反复', '耐心'],
+        # 维度4：创新突破（基建技术革新，如数字化装配）
+        "创新突破": ['数字化', '自主研发', '创新', '突破', '零的突破', '核心技术', '革命性变革', '新方法', '自主制造', '技术封锁', '独创'],
+        # 维度5：社会价值（基建国家意义，如大国重器、世界之最）
+        "社会价值": ['国家', '世界之最', '大国重器', '重大任务', '自主制造', '里程碑', '清洁能源', '交通骨架', '中国荣耀', '超级工程', '世界第一'],
+    },
+}
+
+# 能源电力雷达图：文中点到名的工匠另有加分（人名 → 维度 → 加分），人名按关键词登记
+RADAR_BONUS = {
+    "能源电力": {
+        "陈永伟": {"safety": 0.05, "precision": 0.08, "innovation": 0.06},
+        "黄金娟": {"innovation": 0.10, "contribution": 0.08, "precision": 0.07},
+        "谭文波": {"innovation": 0.09, "contribution": 0.07},
+        "梅琳": {"precision": 0.09, "safety": 0.06},
+        "王进": {"safety": 0.08, "dedication": 0.07},
+        "刘丽": {"contribution": 0.07, "dedication": 0.08},
+        "贾春成": {"innovation": 0.07, "precision": 0.06},
+    },
+}
+
+
+# ---------- 5. 登记 ----------
+register("keywords", *INDUSTRY_DICTS.values(), *QUALITY_DICTS.values())
+register("alternations", *TIMELINE_LEX.values())
+register("patterns", *SPIRIT_DICTS.values())
+register("keywords", *RADAR_KEYWORDS.values())
+register("keywords", *({name: [name] for name in bonus} for bonus in RADAR_BONUS.values()))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+词典注册表（按内容哈希定版本，编译结果缓存到磁盘）
+各脚本的 LEX、spirit_dict、INDUSTRY_DICT、QUALITY_DICT、QUALITY_BANK 以及 *_keywords 列表
+在交给匹配器之前都经过这里：词典内容连同编译它的代码一起做 SHA-1，
+同一版本只编译一次，结果 pickle 到 .lexicon_cache/，之后的运行直接加载。
+词典或编译代码任何一处改动都会得到新的哈希，旧缓存自然失效。
+图表和雷达图的词典统一写在 词典.py，导入时经 register 登记到这里；
+融合命中表（融合分析）按 registered() 的全部词一次扫描语料，不再另外维护一份词典清单。
+用法：
+    from 词典注册 import compiled, lexicon_version, register, registered
+    matcher = compiled("keywords", tuple(words), lambda spec: KeywordMatcher(spec))
+    print(lexicon_version(LEX))       # 12 位版本号，可写进输出文件便于追溯
+    register("alternations", LEX)     # 登记词典（计数口径, 词典）
+"""
+import os
+import sys
+import json
+import pickle
+import hashlib
+
+# 缓存目录固定放在本模块旁边（各脚本会 chdir 到 E:\，不能用相对路径）
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".lexicon_cache")
+
+# 进程内注册表：版本哈希 → 编译结果
+_compiled = {}
+_code_hashes = {}
+# 登记的词典：(计数口径, 词典)，按登记顺序
+_registered = []
+
+
+# ---------- 1. 版本 ----------
+def _canonical(obj):
+    """词典 → 规范 JSON（保留键顺序：打分结果依赖词典顺序）"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=list)
+
+
+def lexicon_version(lexicon):
+    """词典内容的版本号（SHA-1 前 12 位）"""
+    return hashlib.sha1(_canonical(lexicon).encode("utf-8")).hexdigest()[:12]
+
+
+def _code_hash(build):
+    """编译函数所在模块的源码哈希：匹配器实现变了，缓存也要跟着失效"""
+    module = sys.modules.get(getattr(build, "__module__", None))
+    path = getattr(module, "__file__", None)
+    if path not in _code_hashes:
+        h = hashlib.sha1()
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        _code_hashes[path] = h.hexdigest()
+    return _code_hashes[path]
+
+
+# ---------- 2. 磁盘缓存 ----------
+def _cache_path(kind, digest):
+    return os.path.join(CACHE_DIR, f"{kind}-{digest}.pkl")
+
+
+def _load_cache(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # 缓存损坏或类定义已变，当作未命中
+        return None
+
+
+def _save_cache(path, obj):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)   # 原子替换，避免并行运行时读到半截文件
+
+
+# ---------- 3. 对外接口 ----------
+def compiled(kind, spec, build):
+    """
+    取词典 spec 的编译结果：进程内 → .lexicon_cache/ → 调 build(spec) 现场编译并落盘
+    kind   编译产物的种类（keywords / patterns / ...），用于缓存文件名
+    spec   词典内容（可 JSON 化），与 build 的源码一起决定版本
+    """
+    digest = hashlib.sha1(
+        (kind + "\0" + _code_hash(build) + "\0" + _canonical(spec)).encode("utf-8")
+    ).hexdigest()
+    obj = _compiled.get(digest)
+    if obj is None:
+        path = _cache_path(kind, digest)
+        obj = _load_cache(path)
+        if obj is None:
+            obj = build(spec)
+            _save_cache(path, obj)
+        _compiled[digest] = obj
+    return obj
+
+
+# ---------- 4. 登记 ----------
+def register(kind, *lexicons):
+    """
+    登记词典，融合命中表按登记的全部词扫描
+    kind      计数口径：keywords（{名: 词列表}，词可带权重）/ alternations（{名: "词1|词2"}）/ patterns（{名: 正则列表}）
+    lexicons  一部或多部词典
+    """
+    _registered.extend((kind, lexicon) for lexicon in lexicons)
+
+
+def registered():
+    """全部登记的 (计数口径, 词典)；图表词典都在 词典.py 里，导入即登记"""
+    import 词典   # noqa: F401
+    return list(_registered)
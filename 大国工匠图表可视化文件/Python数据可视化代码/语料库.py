@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+原文本语料库（单一 UTF-8 文件 + numpy 偏移索引，mmap 按需切片）
+把 原文本数据文件/*.docx 以及 原文本数据文件/工匠故事/<行业>/<工匠>.txt 合并成：
+    .corpus/corpus.txt         各文档正文，文档之间再隔一个换行
+                               docx 为非空段落以换行拼接；txt 原样保留（含空行，字数口径不变）
+    .corpus/corpus_index.npz   文档 → 段落 → 句子 的 UTF-8 字节起止偏移
+各脚本 mmap 同一份语料文件，按偏移取句子/段落，不再各自持有整篇文本的多份拷贝。
+句子有两种切法：
+    sentences  re.split(r'[。！？]', 全文) 的每一段（热力图口径，可跨段落，含空段）
+    clauses    每个段落按 [。！？；] 切分并去掉首尾空白的非空小句（时序图 sent_cut 口径）
+用法：
+    from 语料库 import load_corpus
+    corpus = load_corpus()                      # 源文件有变化时自动重建
+    for sent in corpus.sentences("基建工程"):
+        ...
+    text = corpus.story_text("基建工程", "胡洋")   # 按工匠名取内置文章
+依赖：numpy
+"""
+import os
+import re
+import glob
+import mmap
+import numpy as np
+from 文档读取 import read_paragraphs
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), "原文本数据文件")
+CORPUS_DIR = os.path.join(BASE_DIR, ".corpus")
+CORPUS_FILE = "corpus.txt"
+INDEX_FILE = "corpus_index.npz"
+# 原先硬编码在情感分析脚本里的文章，按 工匠故事/<行业>/<工匠>.txt 存放，文档名即相对路径
+STORY_DIR = "工匠故事"
+
+SENT_DELIM_RE = re.compile(r"[。！？]")
+CLAUSE_RE = re.compile(r"[^。！？；]+")
+
+
+# ---------- 1. 构建 ----------
+def _char_to_byte(text):
+    """字符下标 → UTF-8 字节偏移的查找表（长度 len(text)+1），向量化计算"""
+    cp = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    nbytes = 1 + (cp >= 0x80).astype(np.int64) + (cp >= 0x800) + (cp >= 0x10000)
+    table = np.zeros(len(cp) + 1, dtype=np.int64)
+    np.cumsum(nbytes, out=table[1:])
+    return table
+
+
+def _spans(pairs):
+    return np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+def _source_files(src_dir):
+    docx_files = sorted(glob.glob(os.path.join(src_dir, "*.docx")))
+    story_files = sorted(glob.glob(os.path.join(src_dir, STORY_DIR, "*", "*.txt")))
+    return docx_files + story_files
+
+
+def _doc_name(src_dir, path):
+    """文档名：相对 src_dir 的路径去掉扩展名，如 基建工程、工匠故事/基建工程/胡洋"""
+    return os.path.splitext(os.path.relpath(path, src_dir))[0].replace(os.sep, "/")
+
+
+def _source_stamps(src_dir):
+    """源文件指纹：文件名|大小|修改时间，任何一项变化都触发重建"""
+    stamps = []
+    for path in _source_files(src_dir):
+        st = os.stat(path)
+        stamps.append(f"{_doc_name(src_dir, path)}|{st.st_size}|{st.st_mtime_ns}")
+    return stamps
+
+
+def _read_source(path):
+    """读取一篇源文档 → (全文, 段落字符区间列表)"""
+    if path.endswith(".docx"):
+        paragraphs = read_paragraphs(path)
+        spans, pos = [], 0
+        for para in paragraphs:
+            spans.append((pos, pos + len(para)))
+            pos += len(para) + 1
+        return "\n".join(paragraphs), spans
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    spans, pos = [], 0
+    for line in text.split("\n"):
+        if line.strip():
+            spans.append((pos, pos + len(line)))
+        pos += len(line) + 1
+    return text, spans
+
+
+def build_corpus(src_dir=SRC_DIR, out_dir=CORPUS_DIR):
+    """读取 src_dir 下全部 docx 及工匠故事 txt，写出语料文件与偏移索引"""
+    os.makedirs(out_dir, exist_ok=True)
+    files = _source_files(src_dir)
+
+    names, doc_spans = [], []
+    para_spans, doc_para_ptr = [], [0]
+    sent_spans, doc_sent_ptr = [], [0]
+    clause_spans, para_clause_ptr = [], [0]
+
+    corpus_path = os.path.join(out_dir, CORPUS_FILE)
+    offset = 0
+    with open(corpus_path + ".tmp", "wb") as out:
+        for path in files:
+            text, paras = _read_source(path)
+            c2b = _char_to_byte(text) + offset
+
+            # 段落内小句（字符坐标）
+            clauses, clause_ptr = [], []
+            for pos, end in paras:
+                para = text[pos:end]
+                for m in CLAUSE_RE.finditer(para):
+                    piece = m.group()
+                    stripped = piece.strip()
+                    if stripped:
+                        start = pos + m.start() + len(piece) - len(piece.lstrip())
+                        clauses.append((start, start + len(stripped)))
+                clause_ptr.append(len(clauses))
+
+            # 句子：与 re.split(r'[。！？]', text) 一一对应
+            cuts = [m.start() for m in SENT_DELIM_RE.finditer(text)]
+            sents = list(zip([0] + [c + 1 for c in cuts], cuts + [len(text)]))
+
+            names.append(_doc_name(src_dir, path))
+            doc_spans.append((c2b[0], c2b[-1]))
+            para_spans.extend(map(tuple, c2b[_spans(paras)]))
+            sent_spans.extend(map(tuple, c2b[_spans(sents)]))
+            base = para_clause_ptr[-1]
+            clause_spans.extend(map(tuple, c2b[_spans(clauses)]))
+            para_clause_ptr.extend(base + n for n in clause_ptr)
+            doc_para_ptr.append(len(para_spans))
+            doc_sent_ptr.append(len(sent_spans))
+
+            data = text.encode("utf-8")
+            out.write(data + b"\n")
+            offset += len(data) + 1
+
+    index_path = os.path.join(out_dir, INDEX_FILE)
+    with open(index_path + ".tmp", "wb") as f:
+        np.savez(
+            f,
+            doc_names=np.array(names, dtype=str),
+            sources=np.array(_source_stamps(src_dir), dtype=str),
+            doc_spans=_spans(doc_spans),
+            para_spans=_spans(para_spans),
+            doc_para_ptr=np.asarray(doc_para_ptr, dtype=np.int64),
+            sent_spans=_spans(sent_spans),
+            doc_sent_ptr=np.asarray(doc_sent_ptr, dtype=np.int64),
+            clause_spans=_spans(clause_spans),
+            para_clause_ptr=np.asarray(para_clause_ptr, dtype=np.int64),
+        )
+    os.replace(corpus_path + ".tmp", corpus_path)
+    os.replace(index_path + ".tmp", index_path)
+    print(f"✓ 语料库已构建：{len(names)} 篇文档，{len(para_spans)} 段，{len(sent_spans)} 句")
+
+
+# ---------- 2. 读取 ----------
+class Corpus:
+    """mmap 打开的语料库；所有偏移均为 UTF-8 字节偏移"""
+
+    def __init__(self, out_dir=CORPUS_DIR):
+        self._file = open(os.path.join(out_dir, CORPUS_FILE), "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self.buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.buf = b""   # 空语料无法 mmap
+        with np.load(os.path.join(out_dir, INDEX_FILE)) as idx:
+            self.doc_names = [str(n) for n in idx["doc_names"]]
+            self.sources = [str(s) for s in idx["sources"]]   # 构建时的源文件指纹，下游缓存据此判断是否过期
+            self.doc_spans = idx["doc_spans"]
+            self.para_spans = idx["para_spans"]
+            self.doc_para_ptr = idx["doc_para_ptr"]
+            self.sent_spans = idx["sent_spans"]
+            self.doc_sent_ptr = idx["doc_sent_ptr"]
+            self.clause_spans = idx["clause_spans"]
+            self.para_clause_ptr = idx["para_clause_ptr"]
+        self._doc_ids = {name: i for i, name in enumerate(self.doc_names)}
+
+    def __contains__(self, name):
+        return self._name(name) in self._doc_ids
+
+    @staticmethod
+    def _name(name):
+        return name[:-5] if name.endswith(".docx") else name
+
+    def doc_id(self, name):
+        """文档名（可带 .docx 后缀）→ 文档序号"""
+        try:
+            return self._doc_ids[self._name(name)]
+        except KeyError:
+            raise KeyError(f"语料库中没有文档：{name}") from None
+
+    # ----- 按偏移切片 -----
+    def view(self, start, end):
+        """零拷贝字节视图"""
+        return memoryview(self.buf)[start:end]
+
+    def text(self, start, end):
+        return self.buf[start:end].decode("utf-8")
+
+    def _iter_text(self, spans):
+        for start, end in spans.tolist():
+            yield self.buf[start:end].decode("utf-8")
+
+    # ----- 按文档取 -----
+    def doc_text(self, name):
+        start, end = self.doc_spans[self.doc_id(name)]
+        return self.text(start, end)
+
+    def doc_paragraph_spans(self, name):
+        d = self.doc_id(name)
+        return self.para_spans[self.doc_para_ptr[d]:self.doc_para_ptr[d + 1]]
+
+    def doc_sentence_spans(self, name):
+        d = self.doc_id(name)
+        return self.sent_spans[self.doc_sent_ptr[d]:self.doc_sent_ptr[d + 1]]
+
+    def doc_clause_spans(self, name):
+        d = self.doc_id(name)
+        first_para, last_para = self.doc_para_ptr[d], self.doc_para_ptr[d + 1]
+        return self.clause_spans[self.para_clause_ptr[first_para]:self.para_clause_ptr[last_para]]
+
+    def paragraphs(self, name):
+        return self._iter_text(self.doc_paragraph_spans(name))
+
+    def sentences(self, name):
+        return self._iter_text(self.doc_sentence_spans(name))
+
+    def clauses(self, name):
+        return self._iter_text(self.doc_clause_spans(name))
+
+    # ----- 工匠故事 -----
+    def story_names(self, industry):
+        """某行业下已存放的工匠故事名（按文件名排序）"""
+        prefix = f"{STORY_DIR}/{industry}/"
+        return [n[len(prefix):] for n in self.doc_names if n.startswith(prefix)]
+
+    def story_text(self, industry, name):
+        """按行业 + 工匠名取文章原文（只在调用时从 mmap 解码）"""
+        return self.doc_text(f"{STORY_DIR}/{industry}/{name}")
+
+
+def load_corpus(src_dir=SRC_DIR, out_dir=CORPUS_DIR):
+    """打开语料库；索引缺失或源 docx 有增删改时先重建"""
+    index_path = os.path.join(out_dir, INDEX_FILE)
+    stale = True
+    if os.path.exists(index_path) and os.path.exists(os.path.join(out_dir, CORPUS_FILE)):
+        with np.load(index_path) as idx:
+            stale = [str(s) for s in idx["sources"]] != _source_stamps(src_dir)
+    if stale:
+        build_corpus(src_dir, out_dir)
+    return Corpus(out_dir)
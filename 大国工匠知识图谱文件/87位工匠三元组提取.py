@@ -1,11 +1,30 @@
+import os
+import re
+import sys
+import numpy as np
 import pandas as pd
+from 三元组库 import TripleStore
 
 # ========== 核心配置 ==========
 EXCEL_FILE = '工作簿1.xlsx'  # 确保Excel与此脚本在同一文件夹
 SHEET_NAME = '原始数据'
+TRIPLE_COLUMNS = ['Subject', 'Predicate', 'Object']
+TRIPLES_CSV = '大国工匠_triples.csv'
+NODES_CSV = 'gephi_nodes.csv'      # 同时是 实体 → Id 的持久登记表
+EDGES_CSV = 'gephi_edges.csv'
+STATE_FILE = '.triples_state.npz'  # 上次处理过的行键，用于增量更新
+TRIPLE_DB = '大国工匠_triples.db'  # 可选的 SQLite 三元组库（加 --db 时写入）
+
+# Gephi 节点类型规则（按先后判定，先命中的优先）
+INNOVATION_SET = {'改进型', '突破性', '传承型'}
+HERITAGE_SET = {'师徒', '自学', '院校'}
+LEVEL_SET = {'低', '中', '高'}
+TECH_KEYWORDS = ['mm', 'μm', '加工', '精度', '焊接', '研磨']
+TRAIT_KEYWORDS = ['精益求精', '坚守执着', '创新突破', '责任担当', '传承奉献', '问题导向']
 
 # ========== 三元组抽取函数 ==========
 def extract_triples_from_table(row):
+    """逐行版（单行 → 三元组列表），保留作口径对照；整表抽取用下面的 extract_triples"""
     triples = []
     name = str(row['工匠姓名']).strip()
     
@@ -56,6 +75,250 @@ def extract_triples_from_table(row):
     
     return triples
 
+# ========== 三元组抽取（按列向量化） ==========
+def _field(df, col):
+    """列 → (去首尾空白的字符串列, 非空掩码)，口径同逐行的 str(值).strip() 与 pd.notna(值)"""
+    values = df[col]
+    return values.map(str).str.strip().to_numpy(dtype=object), values.notna().to_numpy()
+
+
+def _dedupe(triples):
+    """按 (Subject, Predicate, Object) 的 64 位哈希去重，保留第一次出现"""
+    keys = pd.util.hash_pandas_object(triples[TRIPLE_COLUMNS], index=False)
+    return triples[~keys.duplicated().to_numpy()].reset_index(drop=True)
+
+
+def extract_triples(df):
+    """
+    整张表一次抽取三元组 → DataFrame(Subject, Predicate, Object)，已去重
+    每一类关系是一整列的运算（精神特质三列、行业大类的附带三元组同样按列展开），
+    各类拼接后按 (原行号, 行内次序) 排序再去重，结果与逐行 extract_triples_from_table
+    再 drop_duplicates 完全相同，包括行序。
+    """
+    name = df['工匠姓名'].map(str).str.strip().to_numpy(dtype=object)
+    valid = (name != '工匠姓名') & (name != 'nan') & (name != '')
+    industry, has_industry = _field(df, '行业大类')
+    parts = []
+
+    def add(rank, mask, subjects, predicate, objects):
+        rows = np.flatnonzero(mask)
+        parts.append(pd.DataFrame({
+            'row': rows, 'rank': rank,
+            'Subject': subjects[rows], 'Predicate': predicate, 'Object': objects[rows],
+        }))
+
+    # 1. 工匠-从事-职业
+    job, has_job = _field(df, '职业/行业')
+    add(0, valid & has_job, name, '从事', job)
+    # 2. 工匠-掌握-技术，技术-应用于-行业
+    tech, has_tech = _field(df, '核心技术/绝活')
+    add(1, valid & has_tech, name, '掌握', tech)
+    add(2, valid & has_tech & has_industry, tech, '应用于', industry)
+    # 3. 工匠-体现-精神特质（三列），精神特质-属于-行业
+    for i in range(1, 4):
+        col = f'精神特质{i}'
+        if col not in df:
+            continue
+        trait = df[col].map(str).str.strip().to_numpy(dtype=object)
+        has_trait = (trait != '') & (trait != 'nan')
+        add(1 + 2 * i, valid & has_trait, name, '体现', trait)
+        add(2 + 2 * i, valid & has_trait & has_industry, trait, '属于', industry)
+    # 4~8. 工匠-属于-行业大类 / 采用-创新类型 / 使用-传承方式 / 风险等级 / 精度等级
+    add(9, valid & has_industry, name, '属于', industry)
+    for rank, (col, predicate) in enumerate(
+            [('创新类型', '采用'), ('传承方式', '使用'), ('风险等级', '风险等级'), ('精度等级', '精度等级')], 10):
+        values, present = _field(df, col)
+        add(rank, valid & present, name, predicate, values)
+
+    triples = pd.concat(parts, ignore_index=True)
+    triples = triples.iloc[np.lexsort((triples['rank'].to_numpy(), triples['row'].to_numpy()))]
+    return _dedupe(triples[TRIPLE_COLUMNS])
+
+# ========== Gephi 节点与边 ==========
+def _keyword_pattern(keywords):
+    """关键词列表 → 一个交替式正则，整列 str.contains 一次做完子串判定"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def entity_type_table(df):
+    """精确匹配类的规则（工匠姓名、行业大类、创新类型、传承方式、等级）合成一张 实体 → 类型 的哈希表"""
+    table = {}
+    for entity_type, values in [
+        ('工匠', df['工匠姓名'].dropna()),
+        ('行业大类', df['行业大类'].dropna().unique()),
+        ('创新类型', INNOVATION_SET),
+        ('传承方式', HERITAGE_SET),
+        ('等级', LEVEL_SET),
+    ]:
+        for value in values:
+            table.setdefault(value, entity_type)   # 同一实体按规则先后取第一个
+    return table
+
+
+def classify_entities(entities, df):
+    """
+    实体 → 类型数组：精确匹配一次查表，没查到的整列做 核心技术 / 精神特质 关键词子串匹配，其余为「其他」
+    判定顺序与原先逐个实体 if/elif 的顺序一致。
+    """
+    entities = pd.Series(list(entities), dtype=object)
+    types = entities.map(entity_type_table(df))
+    rest = types.isna().to_numpy()
+    text = entities[rest].map(str)
+    is_tech = text.str.contains(_keyword_pattern(TECH_KEYWORDS)).to_numpy()
+    is_trait = text.str.contains(_keyword_pattern(TRAIT_KEYWORDS)).to_numpy()
+    types = types.to_numpy(dtype=object)
+    types[rest] = np.select([is_tech, is_trait], ['核心技术', '精神特质'], default='其他')
+    return types
+
+
+class EntityRegistry:
+    """
+    实体 → 节点 Id 的登记表：已登记的实体永远沿用原 Id，新实体按首次出现的先后接着编号，
+    重跑不再因为 set 的遍历顺序把所有节点重新编号。持久化形式就是 gephi_nodes.csv 的 Id、Label 两列。
+    """
+
+    def __init__(self, ids=(), labels=()):
+        self.ids = list(ids)
+        self.labels = list(labels)
+        self._index = None
+
+    @classmethod
+    def from_nodes(cls, nodes_df):
+        return cls(nodes_df['Id'].astype(np.int64).tolist(), nodes_df['Label'].tolist())
+
+    def _lookup_index(self):
+        if self._index is None or len(self._index) != len(self.labels):
+            self._index = pd.Index(self.labels)
+        return self._index
+
+    def assign(self, labels):
+        """登记 labels 中的新实体 → 新实体的掩码（与 labels 对齐）"""
+        labels = list(labels)
+        is_new = self._lookup_index().get_indexer(labels) < 0 if self.labels else np.ones(len(labels), dtype=bool)
+        new_labels = [label for label, new in zip(labels, is_new) if new]
+        start = max(self.ids) + 1 if self.ids else 0
+        self.ids.extend(range(start, start + len(new_labels)))
+        self.labels.extend(new_labels)
+        return is_new
+
+    def lookup(self, labels):
+        """实体 → Id 数组（Index.get_indexer 一次映射），未登记的实体报错"""
+        pos = self._lookup_index().get_indexer(labels)
+        if (pos < 0).any():
+            raise KeyError('有实体未登记')
+        return np.asarray(self.ids, dtype=np.int64)[pos]
+
+
+def build_gephi(triples_df, df, registry=None, new_only=False):
+    """
+    三元组 → (节点表 Id/Label/Type, 边表 Source/Target/Type/Weight)
+    节点 Id 取自登记表 registry（已有实体沿用原 Id），没给时从 0 起按三元组中首次出现的先后编号，结果与运行环境无关；
+    边的端点用 Index.get_indexer 一次映射成节点 Id。new_only 时节点表只含这次新登记的实体。
+    """
+    registry = registry if registry is not None else EntityRegistry()
+    labels = pd.unique(triples_df[['Subject', 'Object']].to_numpy().ravel())
+    is_new = registry.assign(labels)
+    if new_only:
+        labels = labels[is_new]
+    nodes_df = pd.DataFrame({
+        'Id': registry.lookup(labels),
+        'Label': labels,
+        'Type': classify_entities(labels, df),
+    }).sort_values('Id', kind='stable', ignore_index=True)
+    edges_df = pd.DataFrame({
+        'Source': registry.lookup(triples_df['Subject']),
+        'Target': registry.lookup(triples_df['Object']),
+        'Type': triples_df['Predicate'].to_numpy(),
+        'Weight': 1,
+    })
+    return nodes_df, edges_df
+
+
+# ========== 增量更新 ==========
+def _read_csv(path):
+    # 全按字符串读，'nan'、'NA' 之类的实体名不能被当成缺失值
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+
+def _row_keys(df):
+    """每行原始数据的 64 位哈希，判断哪些行是上次之后新增的"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _save_state(keys, out_dir):
+    path = os.path.join(out_dir, STATE_FILE)
+    with open(path + '.tmp', 'wb') as f:
+        np.savez(f, row_keys=keys)
+    os.replace(path + '.tmp', path)
+
+
+def _load_state(out_dir):
+    path = os.path.join(out_dir, STATE_FILE)
+    if not all(os.path.exists(os.path.join(out_dir, f)) for f in (STATE_FILE, TRIPLES_CSV, NODES_CSV, EDGES_CSV)):
+        return None
+    try:
+        with np.load(path) as z:
+            return z['row_keys']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _load_registry(out_dir):
+    path = os.path.join(out_dir, NODES_CSV)
+    if not os.path.exists(path):
+        return EntityRegistry()
+    nodes = _read_csv(path)
+    return EntityRegistry.from_nodes(nodes) if {'Id', 'Label'} <= set(nodes.columns) else EntityRegistry()
+
+
+def rebuild_graph(df, out_dir='.'):
+    """全量重建三个 CSV；节点 Id 沿用已有 gephi_nodes.csv 的登记，类型全部重新判定"""
+    triples_df = extract_triples(df)
+    nodes_df, edges_df = build_gephi(triples_df, df, _load_registry(out_dir))
+    triples_df.to_csv(os.path.join(out_dir, TRIPLES_CSV), index=False, encoding='utf-8-sig')
+    nodes_df.to_csv(os.path.join(out_dir, NODES_CSV), index=False, encoding='utf-8-sig')
+    edges_df.to_csv(os.path.join(out_dir, EDGES_CSV), index=False, encoding='utf-8-sig')
+    _save_state(_row_keys(df), out_dir)
+    return triples_df, nodes_df, edges_df
+
+
+def update_graph(df, out_dir='.', full=False):
+    """
+    增量更新：只抽取上次之后新增的行，新三元组、新节点、新边追加到三个 CSV 末尾，其余原样复用
+    → (是否全量, 新三元组, 新节点, 新边)
+    没有状态文件、或上次处理过的行有被删改的（行键不在表里了）时退回全量重建。
+    增量时只判定新节点的类型；新行让旧实体的类型发生变化（如技术名恰好成了工匠名）时用 full=True 重建。
+    """
+    keys = _row_keys(df)
+    old_keys = None if full else _load_state(out_dir)
+    if old_keys is None or not np.isin(old_keys, keys).all():
+        return (True, *rebuild_graph(df, out_dir))
+
+    new_rows = ~np.isin(keys, old_keys)
+    triples_df = extract_triples(df[new_rows])
+    existing = _read_csv(os.path.join(out_dir, TRIPLES_CSV))
+    seen = pd.util.hash_pandas_object(existing[TRIPLE_COLUMNS], index=False)
+    fresh = pd.util.hash_pandas_object(triples_df[TRIPLE_COLUMNS], index=False)
+    triples_df = triples_df[~fresh.isin(seen).to_numpy()].reset_index(drop=True)
+
+    nodes_df, edges_df = build_gephi(triples_df, df, _load_registry(out_dir), new_only=True)
+    # 追加写（文件开头已有 BOM，追加部分不能再写 BOM）
+    for frame, name in [(triples_df, TRIPLES_CSV), (nodes_df, NODES_CSV), (edges_df, EDGES_CSV)]:
+        frame.to_csv(os.path.join(out_dir, name), mode='a', header=False, index=False, encoding='utf-8')
+    _save_state(keys, out_dir)
+    return False, triples_df, nodes_df, edges_df
+
+
+def write_store(triples_df, full, out_dir='.'):
+    """
+    把本次的三元组写进 SQLite 三元组库 → 新增条数
+    全量重建、或库还是空的（第一次加 --db）时按 TRIPLES_CSV 整表重写，否则只追加本次的新三元组。
+    """
+    with TripleStore(os.path.join(out_dir, TRIPLE_DB)) as store:
+        if full or not len(store):
+            return store.add(_read_csv(os.path.join(out_dir, TRIPLES_CSV)), replace=True)
+        return store.add(triples_df)
+
 # ========== 主流程 ==========
 if __name__ == '__main__':
     try:
@@ -63,71 +326,15 @@ if __name__ == '__main__':
         df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
         print(f"✅ 成功读取Excel，共{len(df)}行数据")
         
-        # 抽取三元组
-        all_triples = []
-        for idx, row in df.iterrows():
-            all_triples.extend(extract_triples_from_table(row))
-        
-        # 去重并转为DataFrame
-        triples_df = pd.DataFrame(all_triples, columns=['Subject', 'Predicate', 'Object'])
-        triples_df = triples_df.drop_duplicates()
-        
-        # 保存三元组
-        triples_df.to_csv('大国工匠_triples.csv', index=False, encoding='utf-8-sig')
-        print(f"📊 已保存{len(triples_df)}个三元组到'大国工匠_triples.csv'")
-        
-        # ========== 生成Gephi文件 ==========
-        # 创建节点
-        all_entities = set(triples_df['Subject']) | set(triples_df['Object'])
-        
-        # 自动识别类型
-        entity_types = {}
-        industry_set = set(df['行业大类'].dropna().unique())
-        innovation_set = {'改进型', '突破性', '传承型'}
-        heritage_set = {'师徒', '自学', '院校'}
-        level_set = {'低', '中', '高'}
-        
-        for e in all_entities:
-            if e in df['工匠姓名'].values:
-                entity_types[e] = '工匠'
-            elif e in industry_set:
-                entity_types[e] = '行业大类'
-            elif e in innovation_set:
-                entity_types[e] = '创新类型'
-            elif e in heritage_set:
-                entity_types[e] = '传承方式'
-            elif e in level_set:
-                entity_types[e] = '等级'
-            elif any(keyword in str(e) for keyword in ['mm', 'μm', '加工', '精度', '焊接', '研磨']):
-                entity_types[e] = '核心技术'
-            elif any(trait in str(e) for trait in ['精益求精', '坚守执着', '创新突破', '责任担当', '传承奉献', '问题导向']):
-                entity_types[e] = '精神特质'
-            else:
-                entity_types[e] = '其他'
-        
-        nodes_df = pd.DataFrame([
-            {'Id': i, 'Label': e, 'Type': entity_types[e]}
-            for i, e in enumerate(all_entities)
-        ])
-        
-        # 创建边
-        entity_to_id = {row['Label']: row['Id'] for _, row in nodes_df.iterrows()}
-        edges_df = pd.DataFrame([
-            {
-                'Source': entity_to_id[row['Subject']],
-                'Target': entity_to_id[row['Object']],
-                'Type': row['Predicate'],
-                'Weight': 1
-            }
-            for _, row in triples_df.iterrows()
-        ])
-        
-        # 保存Gephi文件
-        nodes_df.to_csv('gephi_nodes.csv', index=False, encoding='utf-8-sig')
-        edges_df.to_csv('gephi_edges.csv', index=False, encoding='utf-8-sig')
-        
-        print(f"🎯 节点文件: gephi_nodes.csv ({len(nodes_df)}个节点)")
-        print(f"🔗 边文件: gephi_edges.csv ({len(edges_df)}条边)")
+        # 抽取三元组并生成 Gephi 节点、边（只处理新增的行；加 --full 全量重建）
+        full, triples_df, nodes_df, edges_df = update_graph(df, full='--full' in sys.argv)
+        mode = '全量重建' if full else '增量追加'
+        print(f"📊 {mode}：{len(triples_df)}个三元组 → '{TRIPLES_CSV}'")
+        print(f"🎯 {mode}：{len(nodes_df)}个节点 → {NODES_CSV}")
+        print(f"🔗 {mode}：{len(edges_df)}条边 → {EDGES_CSV}")
+        if '--db' in sys.argv:
+            added = write_store(triples_df, full)
+            print(f"🗄️ 三元组库新增{added}条 → {TRIPLE_DB}")
         print("\n" + "="*50)
         
     except FileNotFoundError:
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+大国工匠三元组的 SQLite 持久存储（不用每次把 CSV 读进 pandas 再查）
+术语字典编码：实体、谓词统一存进 terms(id, term)，三元组表只存三个整数 Id；
+三元组表以 (s, p, o) 为主键（WITHOUT ROWID，本身即 SPO 索引），另建 POS、OSP 两个覆盖索引，
+S/P/O 任意组合绑定的模式查询都能落在某个索引的前缀上，千万级三元组时也是毫秒级。
+数据库开 WAL 模式，写入时其他进程照常可读；一次 add 是一个事务，读者要么看到写入前、要么看到写入后的库。
+用法：
+    from 三元组库 import TripleStore
+    store = TripleStore('大国工匠_triples.db')
+    store.add(triples_df)                          # DataFrame(Subject, Predicate, Object) 或 (s, p, o) 序列
+    store.match(s='高凤林')                         # [(s, p, o), ...]，未给出的位置为通配
+    store.match(p='应用于', o='航天军工')
+    store.objects('高凤林', '掌握')                 # ['...']
+    store.count(p='体现')
+依赖：sqlite3（标准库）
+"""
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    id   INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS triples (
+    s INTEGER NOT NULL,
+    p INTEGER NOT NULL,
+    o INTEGER NOT NULL,
+    PRIMARY KEY (s, p, o)
+) WITHOUT ROWID;
+"""
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s)",
+    "CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p)",
+)
+INSERT_TERM = "INSERT OR IGNORE INTO terms (term) VALUES (?)"
+INSERT_TRIPLE = "INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)"
+SELECT_TRIPLES = """
+SELECT ts.term, tp.term, tob.term FROM triples t
+JOIN terms ts ON ts.id = t.s JOIN terms tp ON tp.id = t.p JOIN terms tob ON tob.id = t.o
+"""
+DROP_INDEXES = ("DROP INDEX IF EXISTS triples_pos", "DROP INDEX IF EXISTS triples_osp")
+BATCH_SIZE = 100000    # 每批 executemany 的三元组数（只限制内存，整次写入仍是一个事务）
+CACHE_KB = 262144      # 写连接的页缓存（KB），批量写入时三棵 B 树的随机插入主要靠它
+LOOKUP_CHUNK = 900     # 按术语查 Id 时每条 IN (...) 的参数个数（低于 SQLite 的变量上限）
+
+
+def _rows(triples):
+    """DataFrame(Subject, Predicate, Object) 或 (s, p, o) 序列 → (s, p, o) 元组序列"""
+    if hasattr(triples, 'itertuples'):
+        return triples[['Subject', 'Predicate', 'Object']].itertuples(index=False, name=None)
+    return triples
+
+
+def _term_ids(conn, terms, ids):
+    """登记术语（已有的忽略），Id 补进 ids（术语 → Id）"""
+    conn.executemany(INSERT_TERM, ((t,) for t in terms))
+    for i in range(0, len(terms), LOOKUP_CHUNK):
+        chunk = terms[i:i + LOOKUP_CHUNK]
+        sql = f"SELECT term, id FROM terms WHERE term IN ({','.join('?' * len(chunk))})"
+        ids.update(conn.execute(sql, chunk))
+
+
+class TripleStore:
+    """一个 SQLite 文件即一个三元组库；readonly=True 时以只读方式打开（供并发查询进程使用）"""
+
+    def __init__(self, path, readonly=False):
+        self.path = path
+        if readonly:
+            self.conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        else:
+            self.conn = sqlite3.connect(path, isolation_level=None)   # 事务由 add 显式 BEGIN / COMMIT
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute(f'PRAGMA cache_size=-{CACHE_KB}')
+            self.conn.executescript(SCHEMA)
+            for sql in INDEXES:
+                self.conn.execute(sql)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM triples').fetchone()[0]
+
+    # ----- 写入 -----
+    def add(self, triples, replace=False):
+        """
+        批量写入（重复三元组忽略）→ 实际新增的条数
+        清空（replace=True）、各批写入、重建索引都在同一个事务里，中途出错整体回滚，
+        并发的读者在提交前一直看到原来的库。
+        每 BATCH_SIZE 条一批：先登记本批新见到的术语并取回 Id（本次写入内缓存，跨批不重复查），
+        再把编码后的三元组按 (s, p, o) 排序 executemany 写入。
+        往空库里装数时先去掉 POS、OSP 索引，全部写完后再一次性建索引，比逐条维护三棵 B 树快得多。
+        """
+        conn = self.conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if replace:
+                conn.execute('DELETE FROM triples')
+                conn.execute('DELETE FROM terms')
+            before = len(self)
+            if before == 0:
+                for sql in DROP_INDEXES:
+                    conn.execute(sql)
+            rows = iter(_rows(triples))
+            ids = {}
+            while True:
+                batch = [tuple(map(str, r)) for _, r in zip(range(BATCH_SIZE), rows)]
+                _term_ids(conn, list({t for row in batch for t in row if t not in ids}), ids)
+                conn.executemany(INSERT_TRIPLE, sorted((ids[s], ids[p], ids[o]) for s, p, o in batch))
+                if len(batch) < BATCH_SIZE:
+                    break
+            if before == 0:
+                for sql in INDEXES:
+                    conn.execute(sql)
+            added = len(self) - before
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return added
+
+    # ----- 模式查询 -----
+    def _ids(self, s, p, o):
+        """绑定的术语 → Id；有术语不在库里时返回 None（查询结果必为空）"""
+        bound = {}
+        for col, term in (('s', s), ('p', p), ('o', o)):
+            if term is not None:
+                row = self.conn.execute('SELECT id FROM terms WHERE term = ?', (term,)).fetchone()
+                if row is None:
+                    return None
+                bound[col] = row[0]
+        return bound
+
+    def match(self, s=None, p=None, o=None, limit=None):
+        """三元组模式查询：s/p/o 为 None 的位置是通配 → [(s, p, o), ...]"""
+        bound = self._ids(s, p, o)
+        if bound is None:
+            return []
+        sql = SELECT_TRIPLES
+        if bound:
+            sql += ' WHERE ' + ' AND '.join(f't.{col} = :{col}' for col in bound)
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return self.conn.execute(sql, bound).fetchall()
+
+    def count(self, s=None, p=None, o=None):
+        """满足模式的三元组条数（只扫索引，不回表取术语）"""
+        bound = self._ids(s, p, o)
+        if bound is None:
+            return 0
+        sql = 'SELECT COUNT(*) FROM triples t'
+        if bound:
+            sql += ' WHERE ' + ' AND '.join(f't.{col} = :{col}' for col in bound)
+        return self.conn.execute(sql, bound).fetchone()[0]
+
+    def objects(self, s, p):
+        return [row[2] for row in self.match(s=s, p=p)]
+
+    def subjects(self, p, o):
+        return [row[0] for row in self.match(p=p, o=o)]
+
+    def predicates(self):
+        """库中出现过的全部谓词"""
+        sql = 'SELECT term FROM terms WHERE id IN (SELECT DISTINCT p FROM triples) ORDER BY id'
+        return [row[0] for row in self.conn.execute(sql)]
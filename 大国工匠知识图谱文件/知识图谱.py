@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+大国工匠知识图谱的内存索引（不经过 Gephi 直接查询）
+由 大国工匠_triples.csv 构建：实体、谓词各自编成连续整数（驻留），边按两个方向各存一份 CSR 邻接：
+    出边  out_ptr[s]:out_ptr[s+1] 为 s 的出边，按 (谓词, 目标) 排序
+    入边  in_ptr[o]:in_ptr[o+1]   为 o 的入边，按 (谓词, 来源) 排序
+取某个谓词下的邻居只是在一段连续切片里二分查找谓词范围，百万级边上也是微秒级；
+k 跳扩展、谓词链、最短路的 BFS 都是整层一次 gather，访问标记和前驱记在定长数组里，不逐条边循环。
+用法：
+    from 知识图谱 import load_graph
+    g = load_graph()                                   # 默认读本目录的 大国工匠_triples.csv
+    g.neighbors('高凤林', '掌握')                       # 高凤林 掌握的技术
+    g.follow('高凤林', '掌握', '应用于')                # 工匠 → 掌握 → 技术 → 应用于 → 行业
+    g.k_hop('航天军工', 2, direction='both')           # {实体: 跳数}
+    g.shortest_path('高凤林', '崔蕴')                   # [(实体, 谓词, 实体), ...]
+    g.save('graph.npz'); g = KnowledgeGraph.load('graph.npz')
+依赖：numpy、pandas
+"""
+import os
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TRIPLES_CSV = os.path.join(BASE_DIR, '大国工匠_triples.csv')
+DIRECTIONS = ('out', 'in', 'both')
+
+
+# ========== CSR 构建 ==========
+def _csr(keys, preds, others, n_nodes):
+    """按 (keys, preds, others) 排序 → (ptr, 邻居, 谓词)"""
+    order = np.lexsort((others, preds, keys))
+    ptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_nodes), out=ptr[1:])
+    return ptr, others[order].astype(np.int32), preds[order].astype(np.int32)
+
+
+class KnowledgeGraph:
+    """
+    labels      实体名数组（下标即实体 Id）
+    predicates  谓词名数组（下标即谓词 Id）
+    src/pred/dst 每条边（三元组）的 Id，顺序同三元组表
+    """
+
+    def __init__(self, labels, predicates, src, pred, dst):
+        self.labels = np.asarray(labels, dtype=object)
+        self.predicates = np.asarray(predicates, dtype=object)
+        self.src = np.asarray(src, dtype=np.int32)
+        self.pred = np.asarray(pred, dtype=np.int32)
+        self.dst = np.asarray(dst, dtype=np.int32)
+        self.node_ids = {label: i for i, label in enumerate(self.labels.tolist())}
+        self.predicate_ids = {p: i for i, p in enumerate(self.predicates.tolist())}
+        n = len(self.labels)
+        self.out_ptr, self.out_nbr, self.out_pred = _csr(self.src, self.pred, self.dst, n)
+        self.in_ptr, self.in_nbr, self.in_pred = _csr(self.dst, self.pred, self.src, n)
+
+    @classmethod
+    def from_triples(cls, triples_df):
+        """三元组表（Subject, Predicate, Object）→ 图；实体按首次出现的先后编号"""
+        s = triples_df['Subject'].to_numpy(dtype=object)
+        o = triples_df['Object'].to_numpy(dtype=object)
+        codes, labels = pd.factorize(np.concatenate([s, o]))
+        pred, predicates = pd.factorize(triples_df['Predicate'].to_numpy(dtype=object))
+        return cls(labels, predicates, codes[:len(s)], pred, codes[len(s):])
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.src)
+
+    # ----- Id 换算 -----
+    def node_id(self, label):
+        try:
+            return self.node_ids[label]
+        except KeyError:
+            raise KeyError(f'图中没有实体：{label}') from None
+
+    def predicate_id(self, predicate):
+        try:
+            return self.predicate_ids[predicate]
+        except KeyError:
+            raise KeyError(f'图中没有谓词：{predicate}') from None
+
+    def _pred(self, predicate):
+        return None if predicate is None else self.predicate_id(predicate)
+
+    def _adjacency(self, direction):
+        if direction == 'out':
+            return ((self.out_ptr, self.out_nbr, self.out_pred),)
+        if direction == 'in':
+            return ((self.in_ptr, self.in_nbr, self.in_pred),)
+        if direction == 'both':
+            return self._adjacency('out') + self._adjacency('in')
+        raise ValueError(f'direction 须为 {DIRECTIONS} 之一')
+
+    # ----- 邻居 -----
+    def neighbor_ids(self, node, predicate=None, direction='out'):
+        """单个实体 Id → 邻居 Id 数组（给了谓词时只取该谓词的边）"""
+        p = self._pred(predicate)
+        parts = []
+        for ptr, nbr, prd in self._adjacency(direction):
+            lo, hi = ptr[node], ptr[node + 1]
+            if p is not None:
+                seg = prd[lo:hi]   # 段内按谓词有序，二分取出该谓词的范围
+                lo, hi = lo + np.searchsorted(seg, p), lo + np.searchsorted(seg, p, side='right')
+            parts.append(nbr[lo:hi])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def neighbors(self, label, predicate=None, direction='out'):
+        """实体名 → 邻居实体名列表"""
+        return self.labels[self.neighbor_ids(self.node_id(label), predicate, direction)].tolist()
+
+    def expand_ids(self, frontier, predicate=None, direction='out'):
+        """
+        一层扩展：一组实体 Id → (邻居 Id, 来源 Id, 谓词 Id, 是否入边)，整层一次 gather
+        """
+        frontier = np.asarray(frontier, dtype=np.int64)
+        p = self._pred(predicate)
+        out = []
+        for k, (ptr, nbr, prd) in enumerate(self._adjacency(direction)):
+            starts, ends = ptr[frontier], ptr[frontier + 1]
+            counts = ends - starts
+            total = int(counts.sum())
+            idx = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            origin = np.repeat(frontier, counts)
+            if p is not None:
+                keep = prd[idx] == p
+                idx, origin = idx[keep], origin[keep]
+            is_in = direction == 'in' or (direction == 'both' and k == 1)
+            out.append((nbr[idx].astype(np.int64), origin, prd[idx], np.full(len(idx), is_in)))
+        return tuple(np.concatenate(cols) for cols in zip(*out))
+
+    # ----- 多跳查询 -----
+    def follow(self, label, *predicates, direction='out'):
+        """沿谓词链走：follow('高凤林', '掌握', '应用于') → 行业名列表（去重，按 Id 排序）"""
+        frontier = np.array([self.node_id(label)])
+        for predicate in predicates:
+            frontier = np.unique(self.expand_ids(frontier, predicate, direction)[0])
+        return self.labels[frontier].tolist()
+
+    def k_hop_ids(self, node, k, predicate=None, direction='out'):
+        """k 跳以内可达的实体 → (Id 数组, 跳数数组)，含起点（跳数 0）"""
+        seen = np.zeros(len(self.labels), dtype=bool)
+        seen[node] = True
+        ids, hops, frontier = [np.array([node])], [np.array([0])], np.array([node])
+        for hop in range(1, k + 1):
+            nbr = np.unique(self.expand_ids(frontier, predicate, direction)[0])
+            frontier = nbr[~seen[nbr]]
+            if not len(frontier):
+                break
+            seen[frontier] = True
+            ids.append(frontier)
+            hops.append(np.full(len(frontier), hop))
+        return np.concatenate(ids), np.concatenate(hops)
+
+    def k_hop(self, label, k, predicate=None, direction='out'):
+        """k 跳以内可达的实体 → {实体名: 跳数}"""
+        ids, hops = self.k_hop_ids(self.node_id(label), k, predicate, direction)
+        return dict(zip(self.labels[ids].tolist(), hops.tolist()))
+
+    def shortest_path(self, source, target, predicate=None, direction='both', max_hops=None):
+        """
+        无权最短路（逐层 BFS，每层一次 gather）→ [(实体, 谓词, 实体), ...]，按边原本的方向写；不可达返回 None
+        """
+        s, t = self.node_id(source), self.node_id(target)
+        if s == t:
+            return []
+        n = len(self.labels)
+        visited = np.zeros(n, dtype=bool)
+        # 只有 visited 为真的位置有意义：上一实体 Id、谓词 Id、是否逆着边走
+        parent, via, back = np.empty(n, dtype=np.int64), np.empty(n, dtype=np.int32), np.empty(n, dtype=bool)
+        visited[s] = True
+        frontier = np.array([s])
+        hop = 0
+        while len(frontier) and (max_hops is None or hop < max_hops):
+            hop += 1
+            nbr, origin, prd, is_in = self.expand_ids(frontier, predicate, direction)
+            fresh = np.flatnonzero(~visited[nbr])
+            frontier, first = np.unique(nbr[fresh], return_index=True)   # 同一实体取最先扩展到它的边
+            edge = fresh[first]
+            visited[frontier] = True
+            parent[frontier], via[frontier], back[frontier] = origin[edge], prd[edge], is_in[edge]
+            if visited[t]:
+                return self._unwind(parent, via, back, s, t)
+        return None
+
+    def _unwind(self, parent, via, back, s, t):
+        steps, v = [], t
+        while v != s:
+            u = int(parent[v])
+            a, b = (v, u) if back[v] else (u, v)
+            steps.append((self.labels[a], self.predicates[via[v]], self.labels[b]))
+            v = u
+        return steps[::-1]
+
+    # ----- 存取 -----
+    def save(self, path):
+        with open(path + '.tmp', 'wb') as f:
+            np.savez(f, labels=self.labels.astype(str), predicates=self.predicates.astype(str),
+                     src=self.src, pred=self.pred, dst=self.dst)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as z:
+            return cls(z['labels'].astype(object), z['predicates'].astype(object), z['src'], z['pred'], z['dst'])
+
+
+def load_graph(path=TRIPLES_CSV):
+    """读三元组 CSV 构建图（全按字符串读，'nan' 之类的实体名不当作缺失值）"""
+    triples_df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    return KnowledgeGraph.from_triples(triples_df)
+
+
+# ========== 示例 ==========
+if __name__ == '__main__':
+    g = load_graph()
+    print(f"✅ 已加载知识图谱：{len(g)}个实体，{len(g.predicates)}种谓词，{g.num_edges}条边")
+    name = g.labels[0]
+    print(f"🔍 {name} 掌握：{g.neighbors(name, '掌握')}")
+    print(f"🔍 {name} → 掌握 → 应用于：{g.follow(name, '掌握', '应用于')}")
+    print(f"🔍 {name} 两跳内（双向）：{len(g.k_hop(name, 2, direction='both'))}个实体")
+    other = g.labels[g.src[-1]]
+    print(f"🔗 {name} → {other}：{g.shortest_path(name, other)}")